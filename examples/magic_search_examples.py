@@ -8,74 +8,89 @@ easy to search by any product value in the Akeneo PIM system.
 """
 
 import asyncio
-from myer_pim_sdk import AkeneoClient, AkeneoAsyncClient, SearchBuilder
-from myer_pim_sdk.search import (
-    by_supplier_style, by_brand, ready_for_enrichment, 
-    enrichment_complete, missing_images, by_supplier,
-    concession_products, online_products, clearance_products
+import atexit
+from functools import lru_cache
+from myer_pim_sdk import AkeneoClient, SearchBuilder
+
+# The async client and the quick search helpers are imported inside the examples
+# that use them, so running only the sync examples doesn't pay for those imports.
+
+CLIENT_SETTINGS = dict(
+    client_id="your_client_id",
+    client_secret="your_client_secret",
+    username="your_username",
+    password="your_password",
+    base_url="https://your-pim.akeneo.com",
 )
 
 
+@lru_cache(maxsize=None)
+def get_client() -> AkeneoClient:
+    """
+    Return the client shared by every example.
+    
+    Reusing one client keeps a single pooled connection (and OAuth token) warm
+    across all searches instead of paying a new TCP/TLS handshake per example.
+    """
+    client = AkeneoClient(**CLIENT_SETTINGS)
+    atexit.register(client.close)
+    return client
+
+
+# Shared base queries, built once and cloned per call. Freezing them makes any
+# accidental in-place modification raise instead of leaking into other searches.
+READY_FOR_ENRICHMENT = SearchBuilder().filters(lambda f: f.copy_status("10").image_status("10")).freeze()
+FULLY_ENRICHED = SearchBuilder().filters(lambda f: f.copy_status("20").image_status("20")).freeze()
+
+
 def basic_magic_search_examples():
     """Examples of the new magic search functionality."""
     
-    client = AkeneoClient(
-        client_id="your_client_id",
-        client_secret="your_client_secret",
-        username="your_username",
-        password="your_password",
-        base_url="https://your-pim.akeneo.com"
-    )
+    client = get_client()
     
     print("=== Magic Search Examples ===")
     
     # 1. Generic attribute search - the "magic" method
     print("\\n1. Generic attribute search...")
-    products = client.product_models.search_with_builder(
+    count = client.product_models.count(
         lambda f: f.by_attribute("supplier_style", "FI02847")
                   .by_attribute("copy_status", "20")
                   .by_attribute("concession", True)
     )
-    print(f"Found {len(products)} products with supplier style FI02847, copy status 20, and concession=true")
+    print(f"Found {count} products with supplier style FI02847, copy status 20, and concession=true")
     
     # 2. Myer-specific convenience methods
     print("\\n2. Myer-specific convenience methods...")
-    country_road_products = client.product_models.search_with_builder(
+    count = client.product_models.count(
         lambda f: f.brand("Country Road")
                   .online_category("women_accessories")
                   .online_ind(True)
     )
-    print(f"Found {len(country_road_products)} Country Road products in women's accessories that are online")
+    print(f"Found {count} Country Road products in women's accessories that are online")
     
     # 3. Enrichment status searches
     print("\\n3. Enrichment status searches...")
-    ready_for_images = client.product_models.search_with_builder(
+    count = client.product_models.count(
         lambda f: f.image_status("10")  # Status 10 = ready
                   .myer_image_status("10")
     )
-    print(f"Found {len(ready_for_images)} product models ready for image enrichment")
+    print(f"Found {count} product models ready for image enrichment")
     
     # 4. Complex Myer workflows
     print("\\n4. Complex Myer workflows...")
-    enrichment_candidates = client.product_models.search_with_builder(
+    count = client.product_models.count(
         lambda f: f.copy_status("20")  # Copy complete
                   .image_status("10")  # Ready for images
                   .supplier_trust_level(["gold", "silver"])  # High trust suppliers
                   .online_ind(True)  # Available online
     )
-    print(f"Found {len(enrichment_candidates)} models with copy complete, ready for images, from trusted suppliers")
+    print(f"Found {count} models with copy complete, ready for images, from trusted suppliers")
 
 
 def value_filtering_examples():
     """Examples of filtering returned product values."""
     
-    client = AkeneoClient(
-        client_id="your_client_id",
-        client_secret="your_client_secret",
-        username="your_username",
-        password="your_password",
-        base_url="https://your-pim.akeneo.com"
-    )
+    client = get_client()
     
     print("\\n=== Value Filtering Examples ===")
     
@@ -114,92 +129,64 @@ def value_filtering_examples():
     print(f"Found {len(products)} buyable products with only ecommerce scope values")
 
 
-def quick_search_functions_examples():
-    """Examples using the quick search functions."""
-    
-    client = AkeneoClient(
-        client_id="your_client_id",
-        client_secret="your_client_secret",
-        username="your_username",
-        password="your_password",
-        base_url="https://your-pim.akeneo.com"
+async def quick_search_functions_examples():
+    """Examples using the quick search functions, run concurrently."""
+    from myer_pim_sdk import AkeneoAsyncClient
+    from myer_pim_sdk.search import (
+        by_supplier_style, by_brand, ready_for_enrichment, 
+        enrichment_complete, missing_images, by_supplier,
+        concession_products, online_products, clearance_products
     )
     
-    print("\\n=== Quick Search Functions ===")
-    
-    # 1. Search by supplier style
-    print("\\n1. Search by supplier style...")
-    products = client.product_models.search_with_builder(by_supplier_style("FI02847"))
-    print(f"Found {len(products)} products with supplier style FI02847")
-    
-    # 2. Search by brand
-    print("\\n2. Search by brand...")
-    products = client.product_models.search_with_builder(by_brand("Cue"))
-    print(f"Found {len(products)} Cue products")
-    
-    # 3. Find products ready for enrichment
-    print("\\n3. Find products ready for enrichment...")
-    products = client.product_models.search_with_builder(ready_for_enrichment("image", 10))
-    print(f"Found {len(products)} products ready for image enrichment")
-    
-    # 4. Find products with enrichment complete
-    print("\\n4. Find products with enrichment complete...")
-    products = client.product_models.search_with_builder(enrichment_complete("copy", 20))
-    print(f"Found {len(products)} products with copy enrichment complete")
-    
-    # 5. Find products missing images
-    print("\\n5. Find products missing images...")
-    products = client.product_models.search_with_builder(missing_images(1))
-    print(f"Found {len(products)} products missing image 1")
-    
-    # 6. Search by supplier
-    print("\\n6. Search by supplier...")
-    products = client.product_models.search_with_builder(by_supplier("9000395"))
-    print(f"Found {len(products)} products from supplier 9000395")
-    
-    # 7. Find concession products
-    print("\\n7. Find concession products...")
-    products = client.product_models.search_with_builder(concession_products(True))
-    print(f"Found {len(products)} concession products")
-    
-    # 8. Find online products
-    print("\\n8. Find online products...")
-    products = client.product_models.search_with_builder(online_products())
-    print(f"Found {len(products)} online buyable products")
-    
-    # 9. Find clearance products
-    print("\\n9. Find clearance products...")
-    products = client.product_models.search_with_builder(clearance_products())
-    print(f"Found {len(products)} clearance products")
+    client = AkeneoAsyncClient(**CLIENT_SETTINGS)
+    count = client.product_models.count_async
+    
+    try:
+        print("\\n=== Quick Search Functions ===")
+        
+        # The nine searches are independent, so issue them all at once
+        searches = [
+            ("products with supplier style FI02847", by_supplier_style("FI02847")),
+            ("Cue products", by_brand("Cue")),
+            ("products ready for image enrichment", ready_for_enrichment("image", 10)),
+            ("products with copy enrichment complete", enrichment_complete("copy", 20)),
+            ("products missing image 1", missing_images(1)),
+            ("products from supplier 9000395", by_supplier("9000395")),
+            ("concession products", concession_products(True)),
+            ("online buyable products", online_products()),
+            ("clearance products", clearance_products()),
+        ]
+        # Cap in-flight requests in case the Akeneo plan limits concurrency
+        counts = await client.gather(*(count(builder) for _, builder in searches), max_concurrency=6)
+        
+        for i, ((description, _), found) in enumerate(zip(searches, counts), start=1):
+            print(f"\\n{i}. Found {found} {description}")
+        
+    finally:
+        await client.aclose()
 
 
 def complex_enrichment_workflows():
     """Complex real-world enrichment workflow examples."""
     
-    client = AkeneoClient(
-        client_id="your_client_id",
-        client_secret="your_client_secret",
-        username="your_username",
-        password="your_password",
-        base_url="https://your-pim.akeneo.com"
-    )
+    client = get_client()
     
     print("\\n=== Complex Enrichment Workflows ===")
     
     # 1. Products needing both copy and image enrichment
     print("\\n1. Products needing comprehensive enrichment...")
-    products = client.product_models.search_with_builder(
-        lambda f: f.copy_status("10")  # Copy ready
-                  .image_status("10")  # Image ready
-                  .missing_description()  # No description yet
-                  .missing_images(1)  # No images yet
-                  .supplier_trust_level(["gold", "silver"])  # Trusted suppliers only
+    count = client.product_models.count(
+        READY_FOR_ENRICHMENT.clone().filters(
+            lambda f: f.missing_description()  # No description yet
+                       .missing_images(1)  # No images yet
+                       .supplier_trust_level(["gold", "silver"])  # Trusted suppliers only
+        )
     )
-    print(f"Found {len(products)} products needing both copy and image enrichment")
+    print(f"Found {count} products needing both copy and image enrichment")
     
     # 2. Witchery products in women's accessories needing images
     print("\\n2. Witchery women's accessories needing images...")
-    products = client.product_models.search_with_builder(
+    count = client.product_models.count(
         lambda f: f.brand("Witchery")
                   .online_department("women")
                   .online_category("women_accessories")
@@ -208,11 +195,11 @@ def complex_enrichment_workflows():
                   .has_description()  # Has description
                   .missing_images(1)  # Missing images
     )
-    print(f"Found {len(products)} Witchery women's accessories needing images")
+    print(f"Found {count} Witchery women's accessories needing images")
     
     # 3. High-priority enrichment queue
     print("\\n3. High-priority enrichment queue...")
-    products = client.product_models.search_with_builder(
+    count = client.product_models.count(
         lambda f: f.online_ind(True)  # Available online
                   .buyable_ind(True)  # Buyable
                   .concession(False)  # Not concession (direct Myer)
@@ -220,20 +207,20 @@ def complex_enrichment_workflows():
                   .copy_status("10")  # Ready for copy
                   .supplier_trust_level(["gold"])  # Gold suppliers only
     )
-    print(f"Found {len(products)} high-priority products for enrichment")
+    print(f"Found {count} high-priority products for enrichment")
     
     # 4. Audit incomplete enrichment
     print("\\n4. Audit incomplete enrichment...")
-    products = client.product_models.search_with_builder(
+    count = client.product_models.count(
         lambda f: f.copy_status("20")  # Copy supposedly complete
                   .myer_copy_status("10")  # But Myer status disagrees
                   .online_ind(True)
     )
-    print(f"Found {len(products)} products with enrichment status discrepancies")
+    print(f"Found {count} products with enrichment status discrepancies")
     
     # 5. Products ready for final review
     print("\\n5. Products ready for final review...")
-    products = client.product_models.search_with_builder(
+    count = client.product_models.count(
         lambda f: f.copy_status("20")  # Copy complete
                   .image_status("20")  # Images complete
                   .myer_copy_status("20")  # Myer copy complete
@@ -241,170 +228,153 @@ def complex_enrichment_workflows():
                   .has_description()  # Has description
                   .has_images(1)  # Has at least image 1
     )
-    print(f"Found {len(products)} products ready for final review")
+    print(f"Found {count} products ready for final review")
 
 
-def supplier_analysis_examples():
+async def supplier_analysis_examples():
     """Examples for supplier analysis and management."""
     
-    client = AkeneoClient(
-        client_id="your_client_id",
-        client_secret="your_client_secret",
-        username="your_username",
-        password="your_password",
-        base_url="https://your-pim.akeneo.com"
-    )
+    from myer_pim_sdk import AkeneoAsyncClient
     
-    print("\\n=== Supplier Analysis Examples ===")
+    client = AkeneoAsyncClient(**CLIENT_SETTINGS)
+    count = client.product_models.count_async
     
-    # 1. Analyze supplier performance by trust level
-    trust_levels = ["gold", "silver", "bronze"]
-    for level in trust_levels:
-        products = client.product_models.search_with_builder(
-            lambda f: f.supplier_trust_level([level])
-                      .copy_status("20")
-                      .image_status("20")
+    try:
+        print("\\n=== Supplier Analysis Examples ===")
+        
+        # 1. Analyze supplier performance by trust level. Each level is a one-item
+        # with_count request, run concurrently, instead of paging through every model.
+        trust_levels = ["gold", "silver", "bronze"]
+        counts = await asyncio.gather(*(
+            count(FULLY_ENRICHED.clone().filters(lambda f, level=level: f.supplier_trust_level([level])))
+            for level in trust_levels
+        ))
+        
+        for level, level_count in zip(trust_levels, counts):
+            print(f"\\n{level.title()} suppliers: {level_count} products fully enriched")
+        
+        # 2. Find suppliers with enrichment backlogs
+        print("\\n2. Suppliers with enrichment backlogs...")
+        
+        # Count all products ready for enrichment
+        backlog_count = await count(
+            lambda f: f.copy_status("10")  # Ready but not complete
+                      .online_ind(True)
         )
-        print(f"\\n{level.title()} suppliers: {len(products)} products fully enriched")
-    
-    # 2. Find suppliers with enrichment backlogs
-    print("\\n2. Suppliers with enrichment backlogs...")
-    suppliers_with_backlogs = {}
-    
-    # Get all products ready for enrichment
-    backlog_products = client.product_models.search_with_builder(
-        lambda f: f.copy_status("10")  # Ready but not complete
-                  .online_ind(True)
-    )
-    
-    print(f"Found {len(backlog_products)} products in copy enrichment backlog")
-    
-    # 3. Concession vs Direct Myer analysis
-    print("\\n3. Concession vs Direct Myer analysis...")
-    concession_ready = client.product_models.search_with_builder(
-        lambda f: f.concession(True)
-                  .copy_status("10")
-                  .image_status("10")
-    )
-    
-    direct_ready = client.product_models.search_with_builder(
-        lambda f: f.concession(False)
-                  .copy_status("10")
-                  .image_status("10")
-    )
-    
-    print(f"Concession products ready for enrichment: {len(concession_ready)}")
-    print(f"Direct Myer products ready for enrichment: {len(direct_ready)}")
+        
+        print(f"Found {backlog_count} products in copy enrichment backlog")
+        
+        # 3. Concession vs Direct Myer analysis
+        print("\\n3. Concession vs Direct Myer analysis...")
+        concession_ready, direct_ready = await asyncio.gather(
+            count(READY_FOR_ENRICHMENT.clone().filters(lambda f: f.concession(True))),
+            count(READY_FOR_ENRICHMENT.clone().filters(lambda f: f.concession(False)))
+        )
+        
+        print(f"Concession products ready for enrichment: {concession_ready}")
+        print(f"Direct Myer products ready for enrichment: {direct_ready}")
+        
+    finally:
+        await client.aclose()
 
 
 async def async_magic_search_examples():
     """Asynchronous examples of magic search."""
     
-    client = AkeneoAsyncClient(
-        client_id="your_client_id",
-        client_secret="your_client_secret",
-        username="your_username",
-        password="your_password",
-        base_url="https://your-pim.akeneo.com"
-    )
+    from myer_pim_sdk import AkeneoAsyncClient
+    
+    client = AkeneoAsyncClient(**CLIENT_SETTINGS)
     
     try:
         print("\\n=== Async Magic Search Examples ===")
         
-        # 1. Parallel enrichment status checks
+        # 1. Parallel enrichment status checks (counts only, no item payloads)
         print("\\n1. Parallel enrichment status checks...")
+        count = client.product_models.count_async
         results = await asyncio.gather(
-            client.product_models.search_with_builder_async(
-                lambda f: f.copy_status("10")
-            ),
-            client.product_models.search_with_builder_async(
-                lambda f: f.image_status("10")
-            ),
-            client.product_models.search_with_builder_async(
-                lambda f: f.copy_status("20").image_status("20")
-            )
+            count(lambda f: f.copy_status("10")),
+            count(lambda f: f.image_status("10")),
+            count(FULLY_ENRICHED)
         )
         
         copy_ready, image_ready, fully_complete = results
-        print(f"Copy ready: {len(copy_ready)} products")
-        print(f"Image ready: {len(image_ready)} products")
-        print(f"Fully complete: {len(fully_complete)} products")
+        print(f"Copy ready: {copy_ready} products")
+        print(f"Image ready: {image_ready} products")
+        print(f"Fully complete: {fully_complete} products")
         
         # 2. Async supplier analysis
         print("\\n2. Async supplier analysis...")
-        oxford_products = await client.product_models.search_with_builder_async(
+        oxford_products = await count(
             lambda f: f.brand("Oxford")
                       .supplier_trust_level(["gold", "silver"])
                       .online_ind(True)
         )
-        print(f"Found {len(oxford_products)} Oxford products from trusted suppliers")
+        print(f"Found {oxford_products} Oxford products from trusted suppliers")
         
     finally:
-        await client.close()
+        await client.aclose()
 
 
-def practical_usage_examples():
+async def practical_usage_examples():
     """Practical usage examples for daily Myer operations."""
     
-    client = AkeneoClient(
-        client_id="your_client_id",
-        client_secret="your_client_secret",
-        username="your_username",
-        password="your_password",
-        base_url="https://your-pim.akeneo.com"
-    )
-    
-    print("\\n=== Practical Usage Examples ===")
-    
-    # 1. Daily enrichment dashboard
-    print("\\n1. Daily enrichment dashboard...")
+    from myer_pim_sdk import AkeneoAsyncClient
     
-    # Get only the data we need for the dashboard
-    dashboard_builder = (SearchBuilder()
-                        .attributes(["supplier_style", "brand", "copy_status", "image_status", 
-                                   "myer_copy_status", "myer_image_status", "online_name"])
-                        .locales(["en_AU"])
-                        .scope("ecommerce")
-                        .limit(100))
-    
-    # Copy queue
-    copy_queue = client.product_models.search_with_builder(
-        dashboard_builder.filters(lambda f: f.copy_status("10"))
-    )
-    
-    # Image queue  
-    image_queue = client.product_models.search_with_builder(
-        dashboard_builder.filters(lambda f: f.image_status("10"))
-    )
+    client = AkeneoAsyncClient(**CLIENT_SETTINGS)
+    search = client.product_models.search_with_builder_async
+    count = client.product_models.count_async
     
-    print(f"Copy queue: {len(copy_queue)} products")
-    print(f"Image queue: {len(image_queue)} products")
-    
-    # 2. Find specific product by supplier style (common lookup)
-    print("\\n2. Find specific product by supplier style...")
-    product = client.product_models.search_with_builder(
-        lambda f: f.supplier_style("FI02847")
-    )
-    if product:
-        p = product[0]
-        print(f"Found: {p.values.get('online_name', [{}])[0].data if p.values.get('online_name') else 'No name'}")
-        print(f"Brand: {p.values.get('brand', [{}])[0].data if p.values.get('brand') else 'No brand'}")
-        print(f"Copy Status: {p.values.get('copy_status', [{}])[0].data if p.values.get('copy_status') else 'Unknown'}")
-    
-    # 3. Bulk status check for specific supplier styles
-    print("\\n3. Bulk status check for supplier styles...")
-    supplier_styles = ["FI02847", "ABC123", "XYZ789"]  # Example styles
-    
-    products = client.product_models.search_with_builder(
-        lambda f: f.supplier_style(supplier_styles)
-                  .attributes(["supplier_style", "copy_status", "image_status"])
-    )
-    
-    for product in products:
-        style = product.values.get('supplier_style', [{}])[0].data if product.values.get('supplier_style') else 'Unknown'
-        copy_status = product.values.get('copy_status', [{}])[0].data if product.values.get('copy_status') else 'Unknown'
-        image_status = product.values.get('image_status', [{}])[0].data if product.values.get('image_status') else 'Unknown'
-        print(f"  {style}: Copy={copy_status}, Image={image_status}")
+    try:
+        print("\\n=== Practical Usage Examples ===")
+        
+        # 1. Daily enrichment dashboard
+        print("\\n1. Daily enrichment dashboard...")
+        
+        # Get only the data we need for the dashboard. Each queue derives from a
+        # clone of the frozen base so one queue's filters never leak into the next.
+        dashboard_builder = (SearchBuilder()
+                             .attributes(["supplier_style", "brand", "copy_status", "image_status", 
+                                          "myer_copy_status", "myer_image_status", "online_name"])
+                             .locales(["en_AU"])
+                             .scope("ecommerce")
+                             .freeze())
+        
+        # Copy and image queues are independent, so fetch them concurrently
+        copy_queue, image_queue = await asyncio.gather(
+            count(dashboard_builder.clone().filters(lambda f: f.copy_status("10"))),
+            count(dashboard_builder.clone().filters(lambda f: f.image_status("10")))
+        )
+        
+        print(f"Copy queue: {copy_queue} products")
+        print(f"Image queue: {image_queue} products")
+        
+        # 2. Find specific product by supplier style (common lookup)
+        print("\\n2. Find specific product by supplier style...")
+        p = await client.product_models.get_by_supplier_style_async("FI02847")
+        if p:
+            print(f"Found: {p.get_value('online_name', 'No name')}")
+            print(f"Brand: {p.get_value('brand', 'No brand')}")
+            print(f"Copy Status: {p.get_value('copy_status', 'Unknown')}")
+        
+        # 3. Bulk status check for specific supplier styles
+        print("\\n3. Bulk status check for supplier styles...")
+        supplier_styles = ["FI02847", "ABC123", "XYZ789"]  # Example styles
+        
+        status_keys = ["supplier_style", "copy_status", "image_status"]
+        builder = (SearchBuilder()
+                   .filters(lambda f: f.supplier_style(supplier_styles))
+                   .attributes(status_keys)
+                   .limit(len(supplier_styles)))
+        
+        # One page sized to the number of styles covers them in a single round-trip;
+        # read it column-wise instead of walking each item's values
+        page = await search(builder, paginated=True)
+        columns = page.to_columns(status_keys, default="Unknown")
+        for style, copy_status, image_status in zip(*(columns[key] for key in status_keys)):
+            print(f"  {style}: Copy={copy_status}, Image={image_status}")
+        
+    finally:
+        await client.aclose()
 
 
 if __name__ == "__main__":
@@ -420,13 +390,13 @@ if __name__ == "__main__":
     
     # basic_magic_search_examples()
     # value_filtering_examples()
-    # quick_search_functions_examples()
     # complex_enrichment_workflows()
-    # supplier_analysis_examples()
-    # practical_usage_examples()
     
     # For async examples:
     # asyncio.run(async_magic_search_examples())
+    # asyncio.run(quick_search_functions_examples())
+    # asyncio.run(supplier_analysis_examples())
+    # asyncio.run(practical_usage_examples())
     
     print("\\nTo run these examples:")
     print("1. Replace the client credentials with your actual values")
@@ -7,7 +7,6 @@ This file shows how to use the various search methods and filters available
 for products and product models in the Akeneo API.
 """
 
-import asyncio
 from datetime import datetime, timedelta
 from myer_pim_sdk import (
     AkeneoClient, 
@@ -39,18 +38,19 @@ def basic_search_examples():
     
     # 1. Find enabled products
     print("\\n1. Finding enabled products...")
-    enabled_products = client.products.find_enabled()
-    print(f"Found {len(enabled_products)} enabled products")
+    # Only the number is needed, so count instead of fetching the products
+    enabled_count = client.products.find_enabled(count_only=True)
+    print(f"Found {enabled_count} enabled products")
     
     # 2. Find products in specific categories
     print("\\n2. Finding products in winter collection...")
-    winter_products = client.products.find_in_categories(["winter_collection"])
-    print(f"Found {len(winter_products)} products in winter collection")
+    winter_count = client.products.find_in_categories(["winter_collection"], count_only=True)
+    print(f"Found {winter_count} products in winter collection")
     
     # 3. Find products by family
     print("\\n3. Finding products in clothing family...")
-    clothing_products = client.products.find_by_family(["clothing"])
-    print(f"Found {len(clothing_products)} clothing products")
+    clothing_count = client.products.find_by_family(["clothing"], count_only=True)
+    print(f"Found {clothing_count} clothing products")
     
     # 4. Find incomplete products
     print("\\n4. Finding incomplete products...")
@@ -276,12 +276,13 @@ async def async_search_examples():
         models = await client.product_models.find_by_family_async(["shoes"])
         print(f"Found {len(models)} shoe product models")
         
-        # 4. Parallel async searches
+        # 4. Parallel async searches (client.gather caps how many run at once)
         print("\\n4. Running parallel async searches...")
-        results = await asyncio.gather(
+        results = await client.gather(
             client.products.find_enabled_async(categories=["winter_collection"]),
             client.products.find_incomplete_async("ecommerce", 90),
-            client.product_models.find_root_models_async()
+            client.product_models.find_root_models_async(),
+            max_concurrency=8
         )
         
         enabled_winter, incomplete, root_models = results
@@ -313,22 +314,22 @@ def pagination_examples():
     )
     print(f"Page 1: {len(page1.items)} items, has_next: {page1.has_next}")
     
-    # 2. Manual pagination
+    # 2. Manual pagination with search_after cursors (constant cost per page)
     print("\\n2. Manual pagination...")
-    builder = SearchBuilder().filters(lambda f: f.family(["clothing"])).limit(20)
+    builder = SearchBuilder().filters(lambda f: f.family(["clothing"])).limit(20).search_after()
     
     page_num = 1
     total_found = 0
     
     while True:
-        builder.page(page_num)
         page = client.products.search_with_builder(builder, paginated=True)
         
         total_found += len(page.items)
         print(f"Page {page_num}: {len(page.items)} items")
         
-        if not page.has_next or page_num >= 3:  # Limit to 3 pages for example
+        if not page.next_cursor or page_num >= 3:  # Limit to 3 pages for example
             break
+        builder.search_after(page.next_cursor)
         page_num += 1
     
     print(f"Total found across pages: {total_found} items")
@@ -414,7 +415,7 @@ if __name__ == "__main__":
     # filter_combination_examples()
     
     # For async examples:
-    # asyncio.run(async_search_examples())
+    # import asyncio; asyncio.run(async_search_examples())
     
     print("\\nTo run these examples:")
     print("1. Replace the client credentials with your actual values")
@@ -1,6 +1,7 @@
 # Myer PIM SDK - Akeneo REST API Integration
 
 from .client import AkeneoClient, AkeneoAsyncClient
+from .utils import run
 from .exceptions import (
     AkeneoAPIError,
     AuthenticationError,
@@ -12,6 +13,8 @@ from .exceptions import (
 from .search import (
     SearchBuilder,
     FilterBuilder,
+    CompiledSearch,
+    Param,
     ProductPropertyFilter,
     ProductModelPropertyFilter,
     AttributeFilter
@@ -44,6 +47,7 @@ __version__ = "1.0.0"
 __all__ = [
     "AkeneoClient",
     "AkeneoAsyncClient",
+    "run",
     "AkeneoAPIError",
     "AuthenticationError", 
     "ValidationError",
@@ -52,6 +56,8 @@ __all__ = [
     "ServerError",
     "SearchBuilder",
     "FilterBuilder",
+    "CompiledSearch",
+    "Param",
     "ComparisonOperator",
     "ListOperator",
     "DateOperator",
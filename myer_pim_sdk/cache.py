@@ -0,0 +1,110 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_CACHE_MAXSIZE = 512
+DEFAULT_CACHE_TTL = 60.0  # Seconds
+
+
+class TTLCache:
+    """
+    Small thread-safe in-memory cache with per-entry expiry and LRU eviction.
+
+    Entries expire ``ttl`` seconds after they were stored. When ``maxsize`` is
+    reached the least recently used entry is evicted.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_MAXSIZE, ttl: float = DEFAULT_CACHE_TTL):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than 0")
+        if ttl <= 0:
+            raise ValueError("ttl must be greater than 0")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for ``key``, or ``default`` if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, prefix: Optional[str] = None) -> int:
+        """
+        Remove cached entries.
+
+        Args:
+            prefix: Only remove keys starting with this prefix (e.g. an endpoint path).
+                Remove everything when omitted.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            if prefix is None:
+                removed = len(self._data)
+                self._data.clear()
+                return removed
+
+            keys = [key for key in self._data if key.startswith(prefix)]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+
+def make_cache_key(path: str, payload: Dict[str, Any]) -> str:
+    """
+    Build a cache key from a request path and a JSON-serializable payload.
+
+    The path is kept in clear so entries can be invalidated by prefix; the payload
+    is hashed after serializing it with sorted keys.
+    """
+    serialized = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    digest = hashlib.blake2b(serialized.encode("utf-8"), digest_size=16).hexdigest()
+    return f"{path}?{digest}"
+
+
+def cache_prefix_for_path(path: str) -> str:
+    """
+    Get the cache prefix covering every cached read of the endpoint behind ``path``.
+
+    ``/api/rest/v1/products-uuid/<uuid>`` maps to ``/api/rest/v1/products`` so a write
+    through either product endpoint invalidates searches on both.
+    """
+    parts = path.split("/")
+    # ['', 'api', 'rest', 'v1', '<endpoint>', ...]
+    if len(parts) < 5:
+        return path
+
+    endpoint = parts[4]
+    if endpoint.endswith("-uuid"):
+        endpoint = endpoint[:-len("-uuid")]
+    return "/".join(parts[:4] + [endpoint])
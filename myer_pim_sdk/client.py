@@ -1,9 +1,12 @@
 import httpx
 import asyncio
+import functools
+import itertools
 import time
 import base64
 import logging
-from typing import Optional, Any, Dict, Union
+import threading
+from typing import Optional, Any, Awaitable, Callable, Dict, Iterator, List, Tuple, Union
 from urllib.parse import urlparse
 
 from .exceptions import (
@@ -12,6 +15,8 @@ from .exceptions import (
     create_exception_from_response
 )
 from . import utils
+from . import serialization
+from .cache import TTLCache, cache_prefix_for_path, make_cache_key, DEFAULT_CACHE_MAXSIZE
 from .resources import (
     Product,
     ProductModel,
@@ -27,10 +32,34 @@ from .resources import (
 )
 from .throttler import throttler, async_throttler
 
+try:
+    import h2  # noqa: F401  # Optional, enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import brotli  # noqa: F401  # Optional, lets httpx decode Brotli responses
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_TOKEN_BUFFER_SECONDS = 300  # Refresh token 5 minutes before expiry
 DEFAULT_BASE_URL = "https://your-pim.akeneo.com"  # Default, should be overridden
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 50
+DEFAULT_KEEPALIVE_EXPIRY = 30.0  # Seconds an idle pooled connection is kept (httpx default: 5)
+DEFAULT_TRANSPORT_RETRIES = 3  # Connection-level retries (connect errors only)
+DEFAULT_MAX_CONCURRENCY = 32  # Default cap for AkeneoAsyncClient.gather()
+DEFAULT_DOWNLOAD_CHUNK_SIZE = 64 * 1024  # Bytes per chunk when streaming downloads
+# Only advertise encodings httpx can decode; JSON responses compress very well
+ACCEPT_ENCODING = "br, gzip, deflate" if BROTLI_AVAILABLE else "gzip, deflate"
 
 
 class BaseAkeneoClient:
@@ -45,6 +74,13 @@ class BaseAkeneoClient:
         timeout: float = 60.0,
         token_buffer_seconds: int = DEFAULT_TOKEN_BUFFER_SECONDS,
         max_retries: int = 5,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        transport_retries: int = DEFAULT_TRANSPORT_RETRIES,
+        cache_ttl: Optional[float] = None,
+        cache_maxsize: int = DEFAULT_CACHE_MAXSIZE,
+        http2: Optional[bool] = None,
     ):
         if not all([client_id, client_secret, base_url]):
             raise ValueError("client_id, client_secret, and base_url are required.")
@@ -60,8 +96,29 @@ class BaseAkeneoClient:
         self.timeout = timeout
         self.token_buffer_seconds = token_buffer_seconds
         self.max_retries = max_retries
+        self.transport_retries = transport_retries
+        # HTTP/2 lets concurrent requests (async fan-outs, threaded bulk updates) multiplex
+        # over one connection. On by default when the h2 package is installed
+        self.http2 = HTTP2_AVAILABLE if http2 is None else http2
+        # One connection pool per client, shared by every resource and request
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            # Long enough to survive the pauses of a typical sync loop (per-item processing
+            # between calls), so sequential requests don't pay a new TLS handshake
+            keepalive_expiry=keepalive_expiry,
+        )
         self.utils = utils  # Make utils accessible
 
+        # Optional read cache for GET/search responses, disabled unless a TTL is given
+        self.cache: Optional[TTLCache] = TTLCache(maxsize=cache_maxsize, ttl=cache_ttl) if cache_ttl else None
+        # Invalidation generations: a read only stores its response if no invalidation
+        # of its endpoint happened while it was in flight. Values come from one
+        # monotonic counter (next() is atomic), so concurrent bumps never collide
+        self._generation_counter = itertools.count(1)
+        self._cache_generation = 0
+        self._prefix_generations: Dict[str, int] = {}
+
         self._access_token: Optional[str] = None
         self._token_expires_at: float = 0.0
 
@@ -84,6 +141,88 @@ class BaseAkeneoClient:
         self.media_files = MediaFile(client=self)
         self.system = System(client=self)
 
+    def invalidate_cache(self, prefix: Optional[str] = None) -> int:
+        """
+        Drop cached responses.
+        
+        Args:
+            prefix: Only drop entries for this path prefix (e.g. "/api/rest/v1/product-models").
+                Drop everything when omitted.
+        
+        Returns:
+            Number of entries removed
+        """
+        if prefix is None:
+            self._cache_generation = next(self._generation_counter)
+        else:
+            self._prefix_generations[cache_prefix_for_path(prefix)] = next(self._generation_counter)
+        if self.cache is None:
+            return 0
+        return self.cache.invalidate(prefix)
+
+    @staticmethod
+    def _is_write(method: str, path: str) -> bool:
+        """Whether a request can change data (anything but GET and POST */search)."""
+        method = method.upper()
+        return method != "GET" and not (method == "POST" and path.endswith("/search"))
+
+    def _invalidate_cache_for_write(self, path: str) -> None:
+        """Drop cached reads of the endpoint a write request changes."""
+        prefix = cache_prefix_for_path(path)
+        self._prefix_generations[prefix] = next(self._generation_counter)
+        if self.cache is not None:
+            self.cache.invalidate(prefix)
+
+    def _read_generation(self, path: str) -> Tuple[int, int]:
+        """Get the invalidation generation a read of ``path`` starts under."""
+        return self._cache_generation, self._prefix_generations.get(cache_prefix_for_path(path), 0)
+
+    @staticmethod
+    def _read_request_key(
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        json_data: Optional[Dict[str, Any]],
+    ) -> Optional[str]:
+        """Get a key identifying a read-only request (GET or POST */search), or None for writes."""
+        method = method.upper()
+        if method == "GET" or (method == "POST" and path.endswith("/search")):
+            return make_cache_key(path, {"method": method, "params": params, "json": json_data})
+        return None
+
+    def _read_cache_key(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        json_data: Optional[Dict[str, Any]],
+    ) -> Optional[str]:
+        """Get the read cache key for a request, or None if it isn't served from the cache."""
+        if self.cache is None:
+            return None
+        return self._read_request_key(method, path, params, json_data)
+
+    @staticmethod
+    def _decode_body(body: bytes) -> Any:
+        """Decode a successful response body: JSON when possible, text otherwise, {} when empty."""
+        if not body:
+            return {}  # For 204 No Content
+        try:
+            return serialization.loads(body)
+        except ValueError:
+            # Response is not JSON, return text
+            return body.decode("utf-8", errors="replace")
+
+    @staticmethod
+    def _retry_after_seconds(response: httpx.Response) -> Optional[int]:
+        """Get the Retry-After delay of a 429 (rate limited) or 503 (maintenance) response, if any."""
+        if response.status_code not in (429, 503):
+            return None
+        retry_after_header = response.headers.get("Retry-After")
+        if retry_after_header and retry_after_header.isdigit():
+            return int(retry_after_header)
+        return None
+
     def _get_basic_auth_header(self) -> str:
         """Generate Basic Auth header for OAuth2 token request."""
         auth_str = f"{self.client_id}:{self.client_secret}"
@@ -114,7 +253,24 @@ class AkeneoClient(BaseAkeneoClient):
     def __init__(self, *args, **kwargs):
         self._client = None  # Initialize to avoid type checking errors before super().__init__
         super().__init__(*args, **kwargs)
-        self._client = httpx.Client(base_url=self.base_url, timeout=self.timeout)
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            headers={"Accept-Encoding": ACCEPT_ENCODING},
+            transport=httpx.HTTPTransport(
+                retries=self.transport_retries,
+                limits=self.limits,
+                http2=self.http2,
+            ),
+        )
+        # Serializes token refreshes so worker threads sharing the client fetch one token
+        self._token_lock = threading.Lock()
+
+    def __enter__(self) -> "AkeneoClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def _fetch_new_token_sync(self) -> None:
         """Fetch a new OAuth2 access token."""
@@ -129,9 +285,8 @@ class AkeneoClient(BaseAkeneoClient):
         
         logger.info(f"Fetching new OAuth2 token from {self.token_url}")
         try:
-            # Use a separate client for token fetching to avoid circular dependencies
-            with httpx.Client(timeout=self.timeout) as token_client:
-                response = token_client.post(self.token_url, headers=headers, data=data)
+            # Go through the pooled client so the token request reuses its connections
+            response = self._client.post(self.token_url, headers=headers, data=data)
             response.raise_for_status()
             token_data = response.json()
             self._access_token = token_data["access_token"]
@@ -156,10 +311,72 @@ class AkeneoClient(BaseAkeneoClient):
 
     def _ensure_token_valid_sync(self) -> None:
         """Ensure we have a valid access token."""
-        if self._is_token_expired():
-            self._fetch_new_token_sync()
+        if not self._is_token_expired():
+            return
+        with self._token_lock:
+            # Another thread may have refreshed the token while we were waiting
+            if self._is_token_expired():
+                self._fetch_new_token_sync()
+
+    def _stream_request_sync(self, path: str, chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Stream the body of a GET request in chunks instead of loading it into memory.
+        
+        The request (and its rate-limit slot) is only sent once iteration starts.
+        429/503 responses with Retry-After and network errors are retried like
+        _make_request_sync() does, as long as no chunk has been yielded yet.
+        
+        Args:
+            path: API path, relative to the base URL
+            chunk_size: Maximum size of each chunk in bytes
+            
+        Yields:
+            The (decompressed) response body, chunk by chunk
+        """
+        if not isinstance(self._client, httpx.Client):
+            raise TypeError("HTTP client must be an instance of httpx.Client")
+        
+        if not path.startswith('/'):
+            path = '/' + path
+        
+        retries = self.max_retries
+        while True:
+            self._ensure_token_valid_sync()
+            request_headers = {"Authorization": f"Bearer {self._access_token}"}
+            started = False
+            try:
+                throttler.acquire()
+                with self._client.stream("GET", path, headers=request_headers) as response:
+                    if 200 <= response.status_code < 300:
+                        for chunk in response.iter_bytes(chunk_size):
+                            started = True
+                            yield chunk
+                        return
+                    
+                    response.read()
+                    wait_time = self._retry_after_seconds(response)
+                    if wait_time is None or retries <= 0:
+                        self._handle_error_response(response, "GET", path)
+                logger.warning(f"Status {response.status_code}, retrying after {wait_time}s. Retries left: {retries-1}")
+            except AkeneoAPIError as e:
+                if not (getattr(e, 'retry_after', None) and isinstance(e.retry_after, (int, float)) and retries > 0):
+                    raise
+                wait_time = e.retry_after
+                logger.warning(f"Caught {type(e).__name__}, retrying after {wait_time}s. Retries left: {retries-1}")
+            except httpx.RequestError as e:  # Network errors
+                # A body that was partly yielded can't be resumed
+                if started or retries <= 0:
+                    dummy_response = httpx.Response(500, request=httpx.Request("GET", self.base_url + path))
+                    raise AkeneoAPIError(
+                        message=f"Network request failed: {str(e)}",
+                        response=dummy_response
+                    )
+                wait_time = 3
+                logger.warning(f"Network error: {e}. Retrying in 3s. Retries left: {retries-1}")
+            
+            time.sleep(wait_time)
+            retries -= 1
 
-    @throttler.throttle()
     def _make_request_sync(
         self,
         method: str,
@@ -168,18 +385,33 @@ class AkeneoClient(BaseAkeneoClient):
         json_data: Optional[Dict[str, Any]] = None,
         form_data: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
+        content: Optional[Union[str, bytes]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        raw: bool = False,
+        no_cache: bool = False,
     ) -> Any:
-        """Make a synchronous HTTP request to the Akeneo API."""
+        """
+        Make a synchronous HTTP request to the Akeneo API.
         
-        if not isinstance(self._client, httpx.Client):
-            raise TypeError("HTTP client must be an instance of httpx.Client")
+        Reads served from the cache don't take a rate-limit slot. Cached responses are
+        stored as the raw body and decoded again on every hit, so each caller gets its
+        own copy of the result.
         
-        self._ensure_token_valid_sync()
+        Args:
+            method: HTTP method
+            path: API path, relative to the base URL
+            params: Query parameters
+            json_data: JSON body
+            form_data: Form fields (multipart when combined with files)
+            files: Files for a multipart upload
+            content: Raw request body, e.g. an NDJSON payload
+            headers: Extra headers, e.g. the Content-Type of a raw body
+            raw: Return the response body as bytes instead of decoding it as JSON
+            no_cache: Bypass the read cache for this request
+        """
         
-        headers = {
-            "Authorization": f"Bearer {self._access_token}",
-            "Accept": "application/json",
-        }
+        if not isinstance(self._client, httpx.Client):
+            raise TypeError("HTTP client must be an instance of httpx.Client")
         
         params = utils.clean_params(params) if params else {}
         
@@ -187,9 +419,53 @@ class AkeneoClient(BaseAkeneoClient):
         if not path.startswith('/'):
             path = '/' + path
         
+        is_write = self._is_write(method, path)
+        if is_write:
+            self._invalidate_cache_for_write(path)
+        
+        cache_key = None if raw or no_cache else self._read_cache_key(method, path, params, json_data)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return self._decode_body(cached)
+        generation = self._read_generation(path)
+        
+        body = self._send_request_sync(method, path, params, json_data, form_data, files, content, headers)
+        if is_write:
+            # Reads that overlapped the write may have cached what it replaced
+            self._invalidate_cache_for_write(path)
+        if raw:
+            return body
+        if cache_key is not None and self._read_generation(path) == generation:
+            self.cache.set(cache_key, body)
+        return self._decode_body(body)
+
+    def _send_request_sync(
+        self,
+        method: str,
+        path: str,
+        params: Dict[str, Any],
+        json_data: Optional[Dict[str, Any]],
+        form_data: Optional[Dict[str, Any]],
+        files: Optional[Dict[str, Any]],
+        content: Optional[Union[str, bytes]],
+        headers: Optional[Dict[str, str]],
+    ) -> bytes:
+        """Send a request for _make_request_sync() and get the body of the successful response."""
+        self._ensure_token_valid_sync()
+        
+        request_headers = {
+            "Authorization": f"Bearer {self._access_token}",
+            "Accept": "application/json",
+        }
+        if headers:
+            request_headers.update(headers)
+        
         retries = self.max_retries
         while True:
             try:
+                # Every attempt, retries included, takes a rate-limit slot
+                throttler.acquire()
                 response = self._client.request(
                     method,
                     path,
@@ -197,33 +473,24 @@ class AkeneoClient(BaseAkeneoClient):
                     json=json_data,
                     data=form_data,
                     files=files,
-                    headers=headers,
+                    content=content,
+                    headers=request_headers,
                 )
             
                 if 200 <= response.status_code < 300:
-                    if response.content:
-                        try:
-                            return response.json()
-                        except ValueError:
-                            # Response is not JSON, return text
-                            return response.text
-                    return {}  # For 204 No Content
-                
-                retry_after_header = response.headers.get("Retry-After")
-                should_retry_rate_limit = response.status_code == 429 and retry_after_header and retry_after_header.isdigit()
-                should_retry_maintenance = response.status_code == 503 and retry_after_header and retry_after_header.isdigit()
+                    return response.content
                 
-                if (should_retry_rate_limit or should_retry_maintenance) and retries > 0:
-                    wait_time = int(retry_after_header)  # type: ignore
+                wait_time = self._retry_after_seconds(response)
+                if wait_time is not None and retries > 0:
                     logger.warning(f"Status {response.status_code}, retrying after {wait_time}s. Retries left: {retries-1}")
                     time.sleep(wait_time)
                     retries -= 1
                     self._ensure_token_valid_sync()  # Re-check token before retry
-                    headers["Authorization"] = f"Bearer {self._access_token}"  # Re-apply token
+                    request_headers["Authorization"] = f"Bearer {self._access_token}"  # Re-apply token
                     continue
 
                 self._handle_error_response(response, method, path, params=params, json=json_data, data=form_data)
-                return {}  # Should not be reached due to raise in _handle_error_response
+                return b""  # Should not be reached due to raise in _handle_error_response
 
             except AkeneoAPIError as e:
                 if hasattr(e, 'retry_after') and getattr(e, 'retry_after') and isinstance(e.retry_after, (int, float)) and retries > 0:
@@ -231,7 +498,7 @@ class AkeneoClient(BaseAkeneoClient):
                     time.sleep(e.retry_after)
                     retries -= 1
                     self._ensure_token_valid_sync()
-                    headers["Authorization"] = f"Bearer {self._access_token}"
+                    request_headers["Authorization"] = f"Bearer {self._access_token}"
                     continue
                 raise  # Reraise if no retry_after or no retries left
             except httpx.RequestError as e:  # Network errors
@@ -259,7 +526,26 @@ class AkeneoAsyncClient(BaseAkeneoClient):
     def __init__(self, *args, **kwargs):
         self._client = None  # Initialize to avoid type checking errors before super().__init__
         super().__init__(*args, **kwargs)
-        self._client = httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout)
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            headers={"Accept-Encoding": ACCEPT_ENCODING},
+            transport=httpx.AsyncHTTPTransport(
+                retries=self.transport_retries,
+                limits=self.limits,
+                http2=self.http2,
+            ),
+        )
+        # Serializes token refreshes so a burst of concurrent requests fetches one token
+        self._token_lock = asyncio.Lock()
+        # In-flight requests by key, see _single_flight()
+        self._in_flight: Dict[str, "asyncio.Future[Any]"] = {}
+
+    async def __aenter__(self) -> "AkeneoAsyncClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
 
     async def _fetch_new_token_async(self) -> None:
         """Fetch a new OAuth2 access token asynchronously."""
@@ -274,8 +560,8 @@ class AkeneoAsyncClient(BaseAkeneoClient):
 
         logger.info(f"Fetching new OAuth2 token asynchronously from {self.token_url}")
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as token_client:
-                response = await token_client.post(self.token_url, headers=headers, data=data)
+            # Go through the pooled client so the token request reuses its connections
+            response = await self._client.post(self.token_url, headers=headers, data=data)
             response.raise_for_status()
             token_data = response.json()
             self._access_token = token_data["access_token"]
@@ -300,10 +586,58 @@ class AkeneoAsyncClient(BaseAkeneoClient):
 
     async def _ensure_token_valid_async(self) -> None:
         """Ensure we have a valid access token asynchronously."""
-        if self._is_token_expired():
-            await self._fetch_new_token_async()
+        if not self._is_token_expired():
+            return
+        async with self._token_lock:
+            # Another request may have refreshed the token while we were waiting
+            if self._is_token_expired():
+                await self._fetch_new_token_async()
+
+    async def gather(
+        self,
+        *aws: Awaitable[Any],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Run independent client calls concurrently, with at most ``max_concurrency`` in flight.
+        
+        Like asyncio.gather(), results are returned in the order the awaitables were given.
+        
+        Args:
+            *aws: Coroutines to run, e.g. client.products.find_enabled_async()
+            max_concurrency: Maximum number of calls awaited at the same time
+            return_exceptions: Return exceptions as results instead of raising the first one
+        
+        Returns:
+            List of results
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run(aw: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await aw
+        
+        return await asyncio.gather(*(run(aw) for aw in aws), return_exceptions=return_exceptions)
+
+    async def _single_flight(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run ``func`` once for all concurrent callers using the same key.
+        
+        The first caller starts the request; callers arriving while it is in flight await
+        the same result (or exception) instead of sending a duplicate request.
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # Shielded so one caller being cancelled doesn't cancel the request for the others
+        return await asyncio.shield(task)
 
-    @async_throttler.throttle()
     async def _make_request_async(
         self,
         method: str,
@@ -312,28 +646,104 @@ class AkeneoAsyncClient(BaseAkeneoClient):
         json_data: Optional[Dict[str, Any]] = None,
         form_data: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
+        content: Optional[Union[str, bytes]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        raw: bool = False,
+        no_cache: bool = False,
     ) -> Any:
-        """Make an asynchronous HTTP request to the Akeneo API."""
+        """
+        Make an asynchronous HTTP request to the Akeneo API.
         
+        Identical read-only requests (GET and POST */search with the same path, query
+        and body) that overlap in time are coalesced: only the first one is sent and
+        the others await its result. Reads never join a request that started before
+        a write to the same endpoint, and no_cache requests are never coalesced. Reads served from the cache don't take a
+        rate-limit slot, and every caller gets its own decoded copy of the result.
+        
+        Args:
+            method: HTTP method
+            path: API path, relative to the base URL
+            params: Query parameters
+            json_data: JSON body
+            form_data: Form fields (multipart when combined with files)
+            files: Files for a multipart upload
+            content: Raw request body, e.g. an NDJSON payload
+            headers: Extra headers, e.g. the Content-Type of a raw body
+            raw: Return the response body as bytes instead of decoding it as JSON
+            no_cache: Bypass the read cache for this request
+        """
         if not isinstance(self._client, httpx.AsyncClient):
             raise TypeError("HTTP client must be an instance of httpx.AsyncClient")
         
-        await self._ensure_token_valid_async()
-        
         params = utils.clean_params(params) if params else {}
         
-        headers = {
-            "Authorization": f"Bearer {self._access_token}",
-            "Accept": "application/json",
-        }
-        
         # Ensure path starts with /
         if not path.startswith('/'):
             path = '/' + path
+        
+        is_write = self._is_write(method, path)
+        if is_write:
+            self._invalidate_cache_for_write(path)
+        
+        cache_key = None if raw or no_cache else self._read_cache_key(method, path, params, json_data)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return self._decode_body(cached)
+        generation = self._read_generation(path)
+        
+        send = functools.partial(
+            self._send_request_async,
+            method, path, params, json_data, form_data, files, content, headers,
+        )
+        
+        flight_key = None
+        # no_cache callers want a fresh response, so they never join a shared flight
+        if not no_cache and form_data is None and files is None and content is None and not headers:
+            flight_key = self._read_request_key(method, path, params, json_data)
+        if flight_key is None:
+            body = await send()
+        else:
+            # The generation is part of the key, so a read issued after a write has
+            # invalidated the endpoint starts a new request instead of joining an older one
+            body = await self._single_flight(f"{flight_key}|{generation}", send)
+        
+        if is_write:
+            # Reads that overlapped the write may have cached what it replaced
+            self._invalidate_cache_for_write(path)
+        if raw:
+            return body
+        if cache_key is not None and self._read_generation(path) == generation:
+            self.cache.set(cache_key, body)
+        # Coalesced callers share the body bytes but each decodes its own result
+        return self._decode_body(body)
 
+    async def _send_request_async(
+        self,
+        method: str,
+        path: str,
+        params: Dict[str, Any],
+        json_data: Optional[Dict[str, Any]],
+        form_data: Optional[Dict[str, Any]],
+        files: Optional[Dict[str, Any]],
+        content: Optional[Union[str, bytes]],
+        headers: Optional[Dict[str, str]],
+    ) -> bytes:
+        """Send a request for _make_request_async() and get the body of the successful response."""
+        await self._ensure_token_valid_async()
+        
+        request_headers = {
+            "Authorization": f"Bearer {self._access_token}",
+            "Accept": "application/json",
+        }
+        if headers:
+            request_headers.update(headers)
+        
         retries = self.max_retries
         while True:
             try:
+                # Every attempt, retries included, takes a rate-limit slot
+                await async_throttler.acquire_async()
                 response = await self._client.request(
                     method,
                     path,
@@ -341,33 +751,24 @@ class AkeneoAsyncClient(BaseAkeneoClient):
                     json=json_data,
                     data=form_data,
                     files=files,
-                    headers=headers,
+                    content=content,
+                    headers=request_headers,
                 )
                 
                 if 200 <= response.status_code < 300:
-                    if response.content:
-                        try:
-                            return response.json()
-                        except ValueError:
-                            # Response is not JSON, return text
-                            return response.text
-                    return {}
-
-                retry_after_header = response.headers.get("Retry-After")
-                should_retry_rate_limit = response.status_code == 429 and retry_after_header and retry_after_header.isdigit()
-                should_retry_maintenance = response.status_code == 503 and retry_after_header and retry_after_header.isdigit()
-
-                if (should_retry_rate_limit or should_retry_maintenance) and retries > 0:
-                    wait_time = int(retry_after_header)  # type: ignore
+                    return response.content
+
+                wait_time = self._retry_after_seconds(response)
+                if wait_time is not None and retries > 0:
                     logger.warning(f"Status {response.status_code}, retrying after {wait_time}s. Retries left: {retries-1}")
                     await asyncio.sleep(wait_time)
                     retries -= 1
                     await self._ensure_token_valid_async()
-                    headers["Authorization"] = f"Bearer {self._access_token}"
+                    request_headers["Authorization"] = f"Bearer {self._access_token}"
                     continue
                 
                 self._handle_error_response(response, method, path, params=params, json=json_data, data=form_data)
-                return {}  # Should not be reached
+                return b""  # Should not be reached
 
             except AkeneoAPIError as e:
                 if hasattr(e, 'retry_after') and getattr(e, 'retry_after') and isinstance(e.retry_after, (int, float)) and retries > 0:
@@ -375,7 +776,7 @@ class AkeneoAsyncClient(BaseAkeneoClient):
                     await asyncio.sleep(e.retry_after)
                     retries -= 1
                     await self._ensure_token_valid_async()
-                    headers["Authorization"] = f"Bearer {self._access_token}"
+                    request_headers["Authorization"] = f"Bearer {self._access_token}"
                     continue
                 raise
             except httpx.RequestError as e:
@@ -395,3 +796,7 @@ class AkeneoAsyncClient(BaseAkeneoClient):
         """Close the HTTP client asynchronously."""
         if self._client and isinstance(self._client, httpx.AsyncClient):
             await self._client.aclose()
+
+    async def aclose(self):
+        """Alias for close(), mirroring httpx.AsyncClient.aclose()."""
+        await self.close()
@@ -38,6 +38,11 @@ class CategoryWrite(BaseModel):
     labels: Optional[Dict[str, str]] = None
     values: Optional[Dict[str, CategoryValue]] = None
     channel_requirements: Optional[List[str]] = Field(None, alias="channel_requirements")
+    
+    def to_ndjson_line(self) -> bytes:
+        """Get this category as one line of a bulk (NDJSON) request body."""
+        # Serialized by pydantic-core directly, without building an intermediate dict
+        return self.model_dump_json(by_alias=True, exclude_none=True).encode("utf-8")
 
 
 class CategoryCreateWrite(BaseModel):
@@ -95,6 +95,11 @@ class ProductWrite(BaseModel):
         None, alias="quantified_associations"
     )
 
+    def to_ndjson_line(self) -> bytes:
+        """Get this product as one line of a bulk (NDJSON) request body."""
+        # Serialized by pydantic-core directly, without building an intermediate dict
+        return self.model_dump_json(by_alias=True, exclude_none=True).encode("utf-8")
+
 class ProductCreateWrite(BaseModel):
     """Create model for Akeneo products with required fields."""
     
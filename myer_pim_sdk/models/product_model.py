@@ -45,6 +45,12 @@ class ProductModelWrite(BaseModel):
         None, alias="quantified_associations"
     )
 
+    def to_ndjson_line(self) -> bytes:
+        """Get this product model as one line of a bulk (NDJSON) request body."""
+        # Serialized by pydantic-core directly, without building an intermediate dict
+        return self.model_dump_json(by_alias=True, exclude_none=True).encode("utf-8")
+
+
 class ProductModelCreateWrite(BaseModel):
     """Create model for Akeneo product models with required fields."""
     
@@ -1,7 +1,6 @@
 # resources/association_type.py
 
 from typing import Dict, Any, List, Optional, Union, TYPE_CHECKING
-import json
 
 from .base import AkeneoResource
 from ..utils import validate_identifier
@@ -13,6 +12,8 @@ if TYPE_CHECKING:
 class AssociationType(AkeneoResource):
     """Association Type resource for Akeneo API."""
     
+    __slots__ = ()
+    
     endpoint = "association-types"
     
     def get_by_code(self, code: str) -> "AssociationType":
@@ -36,28 +37,12 @@ class AssociationType(AkeneoResource):
     
     def bulk_update(self, association_types: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Update multiple association types at once."""
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
-        # Prepare the NDJSON payload
-        lines = []
-        for association_type_data in association_types:
-            lines.append(json.dumps(association_type_data))
-        
-        ndjson_payload = '\n'.join(lines)
         url = "/api/rest/v1/association-types"
         
-        response = self._client._make_request_sync("PATCH", url, form_data=ndjson_payload)
-        
-        # Parse NDJSON response
-        if isinstance(response, str):
-            results = []
-            for line in response.strip().split('\n'):
-                if line.strip():
-                    results.append(json.loads(line))
-            return results
-        
-        return response if isinstance(response, list) else [response]
+        return self._bulk_update_sync(url, association_types)
     
     # Asynchronous versions
     async def get_by_code_async(self, code: str) -> "AssociationType":
@@ -81,25 +66,9 @@ class AssociationType(AkeneoResource):
     
     async def bulk_update_async(self, association_types: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Update multiple association types at once asynchronously."""
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
         
-        # Prepare the NDJSON payload
-        lines = []
-        for association_type_data in association_types:
-            lines.append(json.dumps(association_type_data))
-        
-        ndjson_payload = '\n'.join(lines)
         url = "/api/rest/v1/association-types"
         
-        response = await self._client._make_request_async("PATCH", url, form_data=ndjson_payload)
-        
-        # Parse NDJSON response
-        if isinstance(response, str):
-            results = []
-            for line in response.strip().split('\n'):
-                if line.strip():
-                    results.append(json.loads(line))
-            return results
-        
-        return response if isinstance(response, list) else [response]
+        return await self._bulk_update_async(url, association_types)
@@ -1,7 +1,6 @@
 # resources/attribute.py
 
 from typing import Dict, Any, List, Optional, Union, TYPE_CHECKING
-import json
 
 from .base import AkeneoResource
 from ..models.attribute import AttributeRead, AttributeWrite, AttributeCreateWrite
@@ -14,6 +13,8 @@ if TYPE_CHECKING:
 class Attribute(AkeneoResource):
     """Attribute resource for Akeneo API."""
     
+    __slots__ = ()
+    
     endpoint = "attributes"
     model_class = AttributeRead
     
@@ -38,32 +39,12 @@ class Attribute(AkeneoResource):
     
     def bulk_update(self, attributes: List[Union[Dict[str, Any], AttributeWrite]]) -> List[Dict[str, Any]]:
         """Update multiple attributes at once."""
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
-        # Prepare the NDJSON payload
-        lines = []
-        for attribute_data in attributes:
-            if hasattr(attribute_data, 'model_dump'):
-                prepared_data = attribute_data.model_dump(by_alias=True, exclude_none=True)
-            else:
-                prepared_data = attribute_data
-            lines.append(json.dumps(prepared_data))
-        
-        ndjson_payload = '\n'.join(lines)
         url = "/api/rest/v1/attributes"
         
-        response = self._client._make_request_sync("PATCH", url, form_data=ndjson_payload)
-        
-        # Parse NDJSON response
-        if isinstance(response, str):
-            results = []
-            for line in response.strip().split('\n'):
-                if line.strip():
-                    results.append(json.loads(line))
-            return results
-        
-        return response if isinstance(response, list) else [response]
+        return self._bulk_update_sync(url, attributes)
     
     # Asynchronous versions
     async def get_by_code_async(self, code: str) -> "Attribute":
@@ -87,37 +68,19 @@ class Attribute(AkeneoResource):
     
     async def bulk_update_async(self, attributes: List[Union[Dict[str, Any], AttributeWrite]]) -> List[Dict[str, Any]]:
         """Update multiple attributes at once asynchronously."""
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
         
-        # Prepare the NDJSON payload
-        lines = []
-        for attribute_data in attributes:
-            if hasattr(attribute_data, 'model_dump'):
-                prepared_data = attribute_data.model_dump(by_alias=True, exclude_none=True)
-            else:
-                prepared_data = attribute_data
-            lines.append(json.dumps(prepared_data))
-        
-        ndjson_payload = '\n'.join(lines)
         url = "/api/rest/v1/attributes"
         
-        response = await self._client._make_request_async("PATCH", url, form_data=ndjson_payload)
-        
-        # Parse NDJSON response
-        if isinstance(response, str):
-            results = []
-            for line in response.strip().split('\n'):
-                if line.strip():
-                    results.append(json.loads(line))
-            return results
-        
-        return response if isinstance(response, list) else [response]
+        return await self._bulk_update_async(url, attributes)
 
 
 class AttributeOption(AkeneoResource):
     """Attribute Option resource for Akeneo API."""
     
+    __slots__ = ("attribute_code",)
+    
     def __init__(self, *, client, attribute_code: Optional[str] = None, **kwargs):
         self.attribute_code = attribute_code
         if attribute_code:
@@ -133,11 +96,11 @@ class AttributeOption(AkeneoResource):
         attribute_code = validate_identifier(attribute_code, "attribute_code")
         option_code = validate_identifier(option_code, "option_code")
         
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
         url = f"/api/rest/v1/attributes/{attribute_code}/options/{option_code}"
-        response = self._client._make_request_sync("GET", url)
+        response = self._request_sync("GET", url)
         
         return self._create_instance(response)
     
@@ -145,26 +108,26 @@ class AttributeOption(AkeneoResource):
         """List attribute options for a specific attribute."""
         attribute_code = validate_identifier(attribute_code, "attribute_code")
         
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
         url = f"/api/rest/v1/attributes/{attribute_code}/options"
         prepared_params = self._prepare_request_params(params)
-        response = self._client._make_request_sync("GET", url, params=prepared_params)
+        response = self._request_sync("GET", url, params=prepared_params)
         
         items = self._extract_items(response)
-        return [self._create_instance(item) for item in items]
+        return list(map(self._create_instance, items))
     
     def create_for_attribute(self, attribute_code: str, data: Dict[str, Any]) -> "AttributeOption":
         """Create an attribute option for a specific attribute."""
         attribute_code = validate_identifier(attribute_code, "attribute_code")
         
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
         url = f"/api/rest/v1/attributes/{attribute_code}/options"
         prepared_data = self._prepare_request_data(data)
-        response = self._client._make_request_sync("POST", url, json_data=prepared_data)
+        response = self._request_sync("POST", url, json_data=prepared_data)
         
         return self._create_instance(response)
     
@@ -173,12 +136,12 @@ class AttributeOption(AkeneoResource):
         attribute_code = validate_identifier(attribute_code, "attribute_code")
         option_code = validate_identifier(option_code, "option_code")
         
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
         url = f"/api/rest/v1/attributes/{attribute_code}/options/{option_code}"
         prepared_data = self._prepare_request_data(data)
-        response = self._client._make_request_sync("PATCH", url, json_data=prepared_data)
+        response = self._request_sync("PATCH", url, json_data=prepared_data)
         
         if response:
             return self._create_instance(response)
@@ -189,28 +152,12 @@ class AttributeOption(AkeneoResource):
         """Update multiple attribute options for a specific attribute."""
         attribute_code = validate_identifier(attribute_code, "attribute_code")
         
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
-        # Prepare the NDJSON payload
-        lines = []
-        for option_data in options:
-            lines.append(json.dumps(option_data))
-        
-        ndjson_payload = '\n'.join(lines)
         url = f"/api/rest/v1/attributes/{attribute_code}/options"
         
-        response = self._client._make_request_sync("PATCH", url, form_data=ndjson_payload)
-        
-        # Parse NDJSON response
-        if isinstance(response, str):
-            results = []
-            for line in response.strip().split('\n'):
-                if line.strip():
-                    results.append(json.loads(line))
-            return results
-        
-        return response if isinstance(response, list) else [response]
+        return self._bulk_update_sync(url, options)
     
     # Asynchronous versions
     async def get_by_code_async(self, attribute_code: str, option_code: str) -> "AttributeOption":
@@ -218,11 +165,11 @@ class AttributeOption(AkeneoResource):
         attribute_code = validate_identifier(attribute_code, "attribute_code")
         option_code = validate_identifier(option_code, "option_code")
         
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
         
         url = f"/api/rest/v1/attributes/{attribute_code}/options/{option_code}"
-        response = await self._client._make_request_async("GET", url)
+        response = await self._request_async("GET", url)
         
         return self._create_instance(response)
     
@@ -230,26 +177,26 @@ class AttributeOption(AkeneoResource):
         """List attribute options for a specific attribute asynchronously."""
         attribute_code = validate_identifier(attribute_code, "attribute_code")
         
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
         
         url = f"/api/rest/v1/attributes/{attribute_code}/options"
         prepared_params = self._prepare_request_params(params)
-        response = await self._client._make_request_async("GET", url, params=prepared_params)
+        response = await self._request_async("GET", url, params=prepared_params)
         
         items = self._extract_items(response)
-        return [self._create_instance(item) for item in items]
+        return list(map(self._create_instance, items))
     
     async def create_for_attribute_async(self, attribute_code: str, data: Dict[str, Any]) -> "AttributeOption":
         """Create an attribute option for a specific attribute asynchronously."""
         attribute_code = validate_identifier(attribute_code, "attribute_code")
         
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
         
         url = f"/api/rest/v1/attributes/{attribute_code}/options"
         prepared_data = self._prepare_request_data(data)
-        response = await self._client._make_request_async("POST", url, json_data=prepared_data)
+        response = await self._request_async("POST", url, json_data=prepared_data)
         
         return self._create_instance(response)
     
@@ -258,12 +205,12 @@ class AttributeOption(AkeneoResource):
         attribute_code = validate_identifier(attribute_code, "attribute_code")
         option_code = validate_identifier(option_code, "option_code")
         
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
         
         url = f"/api/rest/v1/attributes/{attribute_code}/options/{option_code}"
         prepared_data = self._prepare_request_data(data)
-        response = await self._client._make_request_async("PATCH", url, json_data=prepared_data)
+        response = await self._request_async("PATCH", url, json_data=prepared_data)
         
         if response:
             return self._create_instance(response)
@@ -274,6 +221,8 @@ class AttributeOption(AkeneoResource):
 class AttributeGroup(AkeneoResource):
     """Attribute Group resource for Akeneo API."""
     
+    __slots__ = ()
+    
     endpoint = "attribute-groups"
     
     def get_by_code(self, code: str) -> "AttributeGroup":
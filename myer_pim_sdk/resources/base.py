@@ -1,5 +1,6 @@
 # resources/base.py
 
+import asyncio
 import json
 from typing import (
     Any, 
@@ -11,15 +12,35 @@ from typing import (
     Union, 
     Generator,
     AsyncGenerator,
+    Awaitable,
+    Iterable,
     cast,
+    Callable,
     Generic,
     Literal
 )
 from pydantic import BaseModel
 
-from ..utils import clean_params, extract_items_from_response, get_pagination_info
+from ..utils import (
+    clean_params,
+    extract_items_from_response,
+    extract_search_after,
+    first_value,
+    get_pagination_info,
+    encode_ndjson,
+    iter_ndjson,
+    decode_ndjson_async,
+    chunked,
+    BULK_MAX_ITEMS,
+    NDJSON_CONTENT_TYPE
+)
 
 T = TypeVar("T", bound="AkeneoResource")
+
+# Bulk update requests sent at the same time when a batch spans several chunks
+DEFAULT_BULK_CONCURRENCY = 4
+# Requests in flight at the same time for per-resource *_many_async helpers
+DEFAULT_FANOUT_CONCURRENCY = 10
 ModelT = TypeVar("ModelT", bound=BaseModel)
 
 
@@ -37,6 +58,9 @@ class PaginatedResponse(Generic[T]):
     - has_first: Whether there's a first page link
     - has_last: Whether there's a last page link
     - links: The _links object from Akeneo response
+    - next_cursor: The search_after cursor for the next page (search_after pagination)
+    - items_count: Total number of matching items (only when requested with with_count;
+      searches don't ask for it by default, use count()/count_async() instead)
     """
     
     def __init__(self, 
@@ -46,7 +70,8 @@ class PaginatedResponse(Generic[T]):
                 has_previous: bool = False,
                 has_first: bool = False,
                 has_last: bool = False,
-                links: Optional[Dict[str, Any]] = None):
+                links: Optional[Dict[str, Any]] = None,
+                items_count: Optional[int] = None):
         self.items = items
         self.current_page = current_page
         self.has_next = has_next
@@ -54,7 +79,30 @@ class PaginatedResponse(Generic[T]):
         self.has_first = has_first
         self.has_last = has_last
         self.links = links or {}
+        self.items_count = items_count
+        
+    @classmethod
+    def from_response(cls, response: Any, items: List[T]) -> "PaginatedResponse[T]":
+        """
+        Build a paginated response from a raw Akeneo list response.
         
+        Args:
+            response: The decoded JSON response
+            items: The resource instances created from the response items
+        """
+        pagination_data = get_pagination_info(response)
+        is_dict = isinstance(response, dict)
+        return cls(
+            items=items,
+            current_page=pagination_data['current_page'],
+            has_next=pagination_data['has_next'],
+            has_previous=pagination_data['has_previous'],
+            has_first=pagination_data['has_first'],
+            has_last=pagination_data['has_last'],
+            links=response.get('_links', {}) if is_dict else {},
+            items_count=response.get('items_count') if is_dict else None
+        )
+    
     def __len__(self) -> int:
         return len(self.items)
         
@@ -64,6 +112,31 @@ class PaginatedResponse(Generic[T]):
     def __getitem__(self, index):
         return self.items[index]
     
+    def to_columns(self, attributes: List[str], locale: Optional[str] = None,
+                   scope: Optional[str] = None, default: Any = None) -> Dict[str, List[Any]]:
+        """
+        Get attribute values of every item on this page as one list per attribute.
+        
+        Reads the raw "values" of each item, so it suits bulk checks and counting
+        (e.g. Counter(columns["supplier_trust_level"])) better than walking each item.
+        
+        Args:
+            attributes: Attribute codes to extract
+            locale: Only use values for this locale
+            scope: Only use values for this scope/channel
+            default: Value used when an item has no data for an attribute
+            
+        Returns:
+            Dictionary of attribute code to a list of values, in item order
+        """
+        columns: Dict[str, List[Any]] = {code: [] for code in attributes}
+        for item in self.items:
+            data = getattr(item, '_data', item)
+            values = data.get('values') or {}
+            for code in attributes:
+                columns[code].append(first_value(values, code, default, locale, scope))
+        return columns
+    
     @property
     def next_href(self) -> Optional[str]:
         """Get the next page URL if available."""
@@ -88,6 +161,11 @@ class PaginatedResponse(Generic[T]):
     def self_href(self) -> Optional[str]:
         """Get the current page URL."""
         return self.links.get('self', {}).get('href')
+    
+    @property
+    def next_cursor(self) -> Optional[str]:
+        """Get the search_after cursor for the next page when using search_after pagination."""
+        return extract_search_after(self.next_href)
 
 
 class AkeneoResource:
@@ -99,8 +177,22 @@ class AkeneoResource:
     When used without data, it represents the collection.
     """
     
+    # No per-instance __dict__: search and list calls build one resource per row.
+    # Unset slots still fall through to __getattr__ like missing attributes did.
+    __slots__ = (
+        "_client",
+        "_data",
+        "_parent",
+        "_parent_path",
+        "_model",
+        "_request_sync",
+        "_request_async",
+    )
+    
     endpoint: str = ""
     model_class: Optional[Type[BaseModel]] = None
+    # Whether the list endpoint accepts pagination_type=search_after
+    supports_search_after: bool = False
     
     def __init__(
         self,
@@ -115,6 +207,10 @@ class AkeneoResource:
         self._parent = parent
         self._parent_path = parent_path
         self._model: Optional[BaseModel] = None
+        # Bound once so sync/async methods neither probe the client nor look up its
+        # request method on every call; None when the client is of the other kind
+        self._request_sync: Optional[Callable[..., Any]] = getattr(client, '_make_request_sync', None)
+        self._request_async: Optional[Callable[..., Awaitable[Any]]] = getattr(client, '_make_request_async', None)
         
         # Initialize model if data and model_class are provided
         if data and self.model_class:
@@ -181,6 +277,76 @@ class AkeneoResource:
             return data.model_dump(by_alias=True, exclude_none=True)
         return data
 
+    @staticmethod
+    def _bulk_line(item: Any) -> Any:
+        """
+        Get one line of a bulk update body.
+        
+        Models are serialized straight to JSON bytes by pydantic (through a write model's
+        to_ndjson_line() when it has one); dicts are returned as-is for encode_ndjson().
+        """
+        if isinstance(item, BaseModel):
+            to_ndjson_line = getattr(item, "to_ndjson_line", None)
+            if to_ndjson_line is not None:
+                return to_ndjson_line()
+            return item.model_dump_json(by_alias=True, exclude_none=True).encode("utf-8")
+        return item
+
+    def _bulk_payload(self, items: Iterable[Any]) -> bytes:
+        """Build the NDJSON body of a bulk update, one resource per line."""
+        return encode_ndjson(map(self._bulk_line, items))
+
+    def _bulk_update_sync(self, url: str, items: Iterable[Any]) -> List[Dict[str, Any]]:
+        """
+        PATCH resources to a bulk endpoint and return the status line of each one.
+        
+        Items are consumed and encoded one request (BULK_MAX_ITEMS resources) at a time,
+        so only one request body is held in memory however many items are passed.
+        """
+        results: List[Dict[str, Any]] = []
+        for chunk in chunked(items, BULK_MAX_ITEMS):
+            body = self._request_sync(
+                "PATCH", url, content=self._bulk_payload(chunk), headers={"Content-Type": NDJSON_CONTENT_TYPE}, raw=True
+            )
+            results.extend(iter_ndjson(body))
+        return results
+
+    async def _bulk_update_async(
+        self,
+        url: str,
+        items: Iterable[Any],
+        chunk_size: int = BULK_MAX_ITEMS,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> List[Dict[str, Any]]:
+        """PATCH resources to a bulk endpoint asynchronously, see _bulk_bodies_async()."""
+        results: List[Dict[str, Any]] = []
+        for body in await self._bulk_bodies_async(url, items, chunk_size, max_concurrency):
+            results.extend(await decode_ndjson_async(body))
+        return results
+
+    async def _bulk_bodies_async(
+        self,
+        url: str,
+        items: Iterable[Any],
+        chunk_size: int = BULK_MAX_ITEMS,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> List[bytes]:
+        """
+        PATCH resources to a bulk endpoint in chunks of ``chunk_size``, with up to
+        ``max_concurrency`` requests in flight, and return the raw NDJSON response
+        bodies in input order.
+        """
+        async def send(chunk: List[Any]) -> bytes:
+            # model_dump() on a chunk of write models is CPU work, keep it off the event loop
+            payload = await asyncio.to_thread(self._bulk_payload, chunk)
+            return await self._request_async(
+                "PATCH", url, content=payload, headers={"Content-Type": NDJSON_CONTENT_TYPE}, raw=True
+            )
+        
+        return await self._client.gather(
+            *(send(chunk) for chunk in chunked(items, chunk_size)), max_concurrency=max_concurrency
+        )
+
     def _create_instance(self: T, data: Dict[str, Any], instance_cls: Optional[Type[T]] = None) -> T:
         """Create a new instance of this resource with the given data."""
         instance_cls = instance_cls or self.__class__
@@ -190,6 +356,41 @@ class AkeneoResource:
         """Extract pagination information from a response."""
         return get_pagination_info(response)
         
+    async def _iter_cursor_pages_async(
+        self,
+        fetch_page: Callable[[Optional[str]], Awaitable[Any]],
+        prefetch: bool = True,
+    ) -> AsyncGenerator[Any, None]:
+        """
+        Yield raw page responses, following the search_after cursor of each page's next link.
+        
+        Args:
+            fetch_page: Requests one page given its cursor (None for the first page)
+            prefetch: Request the next page before yielding the current one, so the
+                fetch overlaps with the consumer's processing
+        """
+        page_task: Optional[asyncio.Future] = asyncio.ensure_future(fetch_page(None))
+        try:
+            while page_task is not None:
+                response = await page_task
+                page_task = None
+                
+                cursor = None
+                if isinstance(response, dict) and self._extract_items(response):
+                    cursor = extract_search_after(response.get("_links", {}).get("next", {}).get("href"))
+                
+                if cursor and prefetch:
+                    page_task = asyncio.ensure_future(fetch_page(cursor))
+                
+                yield response
+                
+                if cursor and not prefetch:
+                    page_task = asyncio.ensure_future(fetch_page(cursor))
+        finally:
+            # The consumer stopped early (break/aclose), don't leave a page fetch running
+            if page_task is not None and not page_task.done():
+                page_task.cancel()
+
     def _extract_items(self, response: Any) -> List[Dict[str, Any]]:
         """Extract items from a response."""
         return extract_items_from_response(response)
@@ -213,11 +414,11 @@ class AkeneoResource:
         
     def get(self: T, resource_id: str) -> T:
         """Get a single resource by ID."""
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
         url = self._build_url(resource_id)
-        response = self._client._make_request_sync("GET", url)
+        response = self._request_sync("GET", url)
         
         return self._create_instance(response)
         
@@ -236,51 +437,41 @@ class AkeneoResource:
         Returns:
             Either a list of resource instances or a PaginatedResponse object
         """
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
             
         url = self._build_url()
         prepared_params = self._prepare_request_params(params)
-        response = self._client._make_request_sync("GET", url, params=prepared_params)
+        response = self._request_sync("GET", url, params=prepared_params)
         
         # Extract items and pagination data
         items = self._extract_items(response)
-        instances = [self._create_instance(item) for item in items]
+        instances = list(map(self._create_instance, items))
         
         if paginated:
-            pagination_data = self._extract_pagination_data(response)
-            links = response.get('_links', {}) if isinstance(response, dict) else {}
-            return PaginatedResponse(
-                items=instances,
-                current_page=pagination_data.get('current_page', 1),
-                has_next=pagination_data.get('has_next', False),
-                has_previous=pagination_data.get('has_previous', False),
-                has_first=pagination_data.get('has_first', False),
-                has_last=pagination_data.get('has_last', False),
-                links=links
-            )
+            return PaginatedResponse.from_response(response, instances)
         
         return instances
         
     def create(self: T, data: Dict[str, Any]) -> T:
         """Create a new resource."""
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
             
         url = self._build_url()
         prepared_data = self._prepare_request_data(data)
-        response = self._client._make_request_sync("POST", url, json_data=prepared_data)
+        response = self._request_sync("POST", url, json_data=prepared_data)
         
         return self._create_instance(response)
         
     def update(self: T, resource_id: str, data: Dict[str, Any]) -> T:
         """Update an existing resource."""
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
             
         url = self._build_url(resource_id)
         prepared_data = self._prepare_request_data(data)
-        response = self._client._make_request_sync("PATCH", url, json_data=prepared_data)
+        response = self._request_sync("PATCH", url, json_data=prepared_data)
         
         # Akeneo PATCH often returns empty response on success
         if response:
@@ -291,32 +482,37 @@ class AkeneoResource:
         
     def delete(self, resource_id: str) -> None:
         """Delete a resource."""
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
             
         url = self._build_url(resource_id)
-        self._client._make_request_sync("DELETE", url)
+        self._request_sync("DELETE", url)
 
     def paginate(self: T, **params) -> Generator[T, None, None]:
         """
         Generator that yields all resources matching the given parameters.
         
+        Endpoints that support it are walked with search_after cursors, which keeps
+        the cost of each page constant on large catalogs. Pass an explicit ``page``
+        to use page numbers instead.
+        
         Args:
             **params: Filter parameters for the request
             
         Yields:
             Resource instances one at a time
         """
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
-        page = 1
-        limit = params.get("limit", 10)
+        params.setdefault("limit", 10)
+        use_cursor = self.supports_search_after and "page" not in params
+        if use_cursor:
+            params["pagination_type"] = "search_after"
+        else:
+            params.setdefault("page", 1)
         
         while True:
-            params["page"] = page
-            params["limit"] = limit
-            
             page_response = self.list(paginated=True, **params)
             
             if not isinstance(page_response, PaginatedResponse):
@@ -327,21 +523,26 @@ class AkeneoResource:
                 
             for item in page_response.items:
                 yield item
-                
-            if not page_response.has_next:
-                break
-                
-            page += 1
+            
+            if use_cursor:
+                cursor = page_response.next_cursor
+                if not cursor:
+                    break
+                params["search_after"] = cursor
+            else:
+                if not page_response.has_next:
+                    break
+                params["page"] += 1
         
     # Asynchronous methods
     
     async def get_async(self: T, resource_id: str) -> T:
         """Get a single resource by ID asynchronously."""
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
         
         url = self._build_url(resource_id)
-        response = await self._client._make_request_async("GET", url)
+        response = await self._request_async("GET", url)
         
         return self._create_instance(response)
 
@@ -360,51 +561,41 @@ class AkeneoResource:
         Returns:
             Either a list of resource instances or a PaginatedResponse object
         """
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
             
         url = self._build_url()
         prepared_params = self._prepare_request_params(params)
-        response = await self._client._make_request_async("GET", url, params=prepared_params)
+        response = await self._request_async("GET", url, params=prepared_params)
         
         # Extract items and pagination data
         items = self._extract_items(response)
-        instances = [self._create_instance(item) for item in items]
+        instances = list(map(self._create_instance, items))
         
         if paginated:
-            pagination_data = self._extract_pagination_data(response)
-            links = response.get('_links', {}) if isinstance(response, dict) else {}
-            return PaginatedResponse(
-                items=instances,
-                current_page=pagination_data.get('current_page', 1),
-                has_next=pagination_data.get('has_next', False),
-                has_previous=pagination_data.get('has_previous', False),
-                has_first=pagination_data.get('has_first', False),
-                has_last=pagination_data.get('has_last', False),
-                links=links
-            )
+            return PaginatedResponse.from_response(response, instances)
         
         return instances
         
     async def create_async(self: T, data: Dict[str, Any]) -> T:
         """Create a new resource asynchronously."""
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
             
         url = self._build_url()
         prepared_data = self._prepare_request_data(data)
-        response = await self._client._make_request_async("POST", url, json_data=prepared_data)
+        response = await self._request_async("POST", url, json_data=prepared_data)
         
         return self._create_instance(response)
         
     async def update_async(self: T, resource_id: str, data: Dict[str, Any]) -> T:
         """Update an existing resource asynchronously."""
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
             
         url = self._build_url(resource_id)
         prepared_data = self._prepare_request_data(data)
-        response = await self._client._make_request_async("PATCH", url, json_data=prepared_data)
+        response = await self._request_async("PATCH", url, json_data=prepared_data)
         
         # Akeneo PATCH often returns empty response on success
         if response:
@@ -415,44 +606,71 @@ class AkeneoResource:
         
     async def delete_async(self, resource_id: str) -> None:
         """Delete a resource asynchronously."""
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
             
         url = self._build_url(resource_id)
-        await self._client._make_request_async("DELETE", url)
+        await self._request_async("DELETE", url)
 
-    async def paginate_async(self: T, **params) -> AsyncGenerator[T, None]:
+    async def paginate_async(self: T, prefetch: bool = True, **params) -> AsyncGenerator[T, None]:
         """
         Async generator that yields all resources matching the given parameters.
         
+        Endpoints that support it are walked with search_after cursors, which keeps
+        the cost of each page constant on large catalogs. Pass an explicit ``page``
+        to use page numbers instead.
+        
+        While the items of one page are being consumed the next page is already
+        being fetched in the background, so page latency overlaps with processing.
+        
         Args:
+            prefetch: Fetch the next page while the current one is consumed
             **params: Filter parameters for the request
             
         Yields:
             Resource instances one at a time
         """
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
         
-        page = 1
-        limit = params.get("limit", 10)
+        params.setdefault("limit", 10)
+        use_cursor = self.supports_search_after and "page" not in params
+        if use_cursor:
+            params["pagination_type"] = "search_after"
+        else:
+            params.setdefault("page", 1)
         
-        while True:
-            params["page"] = page
-            params["limit"] = limit
-
-            page_response = await self.list_async(paginated=True, **params)
-            
-            if not isinstance(page_response, PaginatedResponse):
-                raise TypeError("Expected PaginatedResponse, got {}".format(type(page_response)))
-
-            if not page_response.items:
-                break
+        page_task: Optional[asyncio.Future] = asyncio.ensure_future(self.list_async(paginated=True, **params))
+        try:
+            while page_task is not None:
+                page_response = await page_task
+                page_task = None
                 
-            for item in page_response.items:
-                yield item
+                if not isinstance(page_response, PaginatedResponse):
+                    raise TypeError("Expected PaginatedResponse, got {}".format(type(page_response)))
                 
-            if not page_response.has_next:
-                break
+                if not page_response.items:
+                    break
+                
+                has_more = False
+                if use_cursor:
+                    cursor = page_response.next_cursor
+                    if cursor:
+                        params["search_after"] = cursor
+                        has_more = True
+                elif page_response.has_next:
+                    params["page"] += 1
+                    has_more = True
+                
+                if has_more and prefetch:
+                    page_task = asyncio.ensure_future(self.list_async(paginated=True, **params))
+                
+                for item in page_response.items:
+                    yield item
                 
-            page += 1
+                if has_more and not prefetch:
+                    page_task = asyncio.ensure_future(self.list_async(paginated=True, **params))
+        finally:
+            # The consumer stopped early (break/aclose), don't leave a page fetch running
+            if page_task is not None and not page_task.done():
+                page_task.cancel()
@@ -1,11 +1,20 @@
 # resources/category.py
 
-from typing import Dict, Any, List, Optional, Union, TYPE_CHECKING, Callable
-import json
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Union, TYPE_CHECKING, Callable
 
-from .base import AkeneoResource
+from .base import AkeneoResource, PaginatedResponse, DEFAULT_BULK_CONCURRENCY
+from .. import serialization
 from ..models.category import CategoryRead, CategoryWrite, CategoryCreateWrite
-from ..utils import validate_identifier
+from ..utils import (
+    validate_identifier,
+    iter_ndjson,
+    read_upload_file,
+    chunked,
+    BULK_MAX_ITEMS,
+    NDJSON_CONTENT_TYPE
+)
 from ..search import SearchBuilder, FilterBuilder
 
 if TYPE_CHECKING:
@@ -15,11 +24,18 @@ if TYPE_CHECKING:
 class Category(AkeneoResource):
     """Category resource for Akeneo API."""
     
+    __slots__ = ()
+    
     endpoint = "categories"
     model_class = CategoryRead
     
     def get_by_code(self, code: str) -> "Category":
-        """Get a category by its code."""
+        """
+        Get a category by its code.
+        
+        Served from the client's read cache when one is configured (see ``cache_ttl``),
+        so resolving the same category repeatedly costs one request per TTL.
+        """
         code = validate_identifier(code, "code")
         return self.get(code)
     
@@ -49,7 +65,7 @@ class Category(AkeneoResource):
         Returns:
             List of categories or PaginatedResponse
         """
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
         # Handle different builder types
@@ -66,24 +82,13 @@ class Category(AkeneoResource):
         
         url = "/api/rest/v1/categories"
         prepared_params = self._prepare_request_params(search_params)
-        response = self._client._make_request_sync("GET", url, params=prepared_params)
+        response = self._request_sync("GET", url, params=prepared_params)
         
         items = self._extract_items(response)
-        instances = [self._create_instance(item) for item in items]
+        instances = list(map(self._create_instance, items))
         
         if paginated:
-            pagination_data = self._extract_pagination_data(response)
-            links = response.get('_links', {}) if isinstance(response, dict) else {}
-            from .base import PaginatedResponse
-            return PaginatedResponse(
-                items=instances,
-                current_page=pagination_data.get('current_page', 1),
-                has_next=pagination_data.get('has_next', False),
-                has_previous=pagination_data.get('has_previous', False),
-                has_first=pagination_data.get('has_first', False),
-                has_last=pagination_data.get('has_last', False),
-                links=links
-            )
+            return PaginatedResponse.from_response(response, instances)
         
         return instances
     
@@ -140,34 +145,61 @@ class Category(AkeneoResource):
             lambda f: f.raw_filter("updated", "SINCE LAST N DAYS", days)
         )
     
-    def bulk_update(self, categories: List[Union[Dict[str, Any], CategoryWrite]]) -> List[Dict[str, Any]]:
-        """Update multiple categories at once."""
-        if not hasattr(self._client, '_make_request_sync'):
-            raise TypeError("This method requires a synchronous client")
+    def bulk_update(
+        self,
+        categories: List[Union[Dict[str, Any], CategoryWrite]],
+        chunk_size: int = BULK_MAX_ITEMS,
+        max_workers: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> List[Dict[str, Any]]:
+        """
+        Update multiple categories at once.
         
-        # Prepare the NDJSON payload
-        lines = []
-        for category_data in categories:
-            if hasattr(category_data, 'model_dump'):
-                prepared_data = category_data.model_dump(by_alias=True, exclude_none=True)
-            else:
-                prepared_data = category_data
-            lines.append(json.dumps(prepared_data))
+        See bulk_update_iter() for how large updates are split into requests.
+        """
+        return list(self.bulk_update_iter(categories, chunk_size=chunk_size, max_workers=max_workers))
+    
+    def bulk_update_iter(
+        self,
+        categories: Iterable[Union[Dict[str, Any], CategoryWrite]],
+        chunk_size: int = BULK_MAX_ITEMS,
+        max_workers: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Update multiple categories at once, decoding the per-category results lazily.
         
-        ndjson_payload = '\n'.join(lines)
-        url = "/api/rest/v1/categories"
+        Akeneo accepts at most 100 categories per request, so larger updates are split
+        into chunks that are sent concurrently from a small thread pool. The results
+        keep the order of the input.
+        
+        Args:
+            categories: Categories to create or update
+            chunk_size: Maximum number of categories per request
+            max_workers: Maximum number of requests in flight at the same time
+            
+        Returns:
+            Iterator over the NDJSON response lines, one status dict per category
+        """
+        if self._request_sync is None:
+            raise TypeError("This method requires a synchronous client")
         
-        response = self._client._make_request_sync("PATCH", url, form_data=ndjson_payload)
+        chunks = list(chunked(categories, chunk_size))
+        if len(chunks) <= 1 or max_workers <= 1:
+            bodies = [self._bulk_update_chunk(chunk) for chunk in chunks]
+        else:
+            # httpx.Client is thread-safe, so the workers share its connection pool
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+                bodies = list(executor.map(self._bulk_update_chunk, chunks))
         
-        # Parse NDJSON response
-        if isinstance(response, str):
-            results = []
-            for line in response.strip().split('\n'):
-                if line.strip():
-                    results.append(json.loads(line))
-            return results
+        return itertools.chain.from_iterable(map(iter_ndjson, bodies))
+    
+    def _bulk_update_chunk(self, categories: List[Union[Dict[str, Any], CategoryWrite]]) -> bytes:
+        """Send one bulk update request and return the raw NDJSON response body."""
+        payload = self._bulk_payload(categories)
+        url = "/api/rest/v1/categories"
         
-        return response if isinstance(response, list) else [response]
+        return self._request_sync(
+            "PATCH", url, content=payload, headers={"Content-Type": NDJSON_CONTENT_TYPE}, raw=True
+        )
     
     def create_media_file(self, category_code: str, attribute_code: str, file_path: str, 
                          scope: Optional[str] = None, locale: Optional[str] = None) -> Dict[str, Any]:
@@ -181,7 +213,7 @@ class Category(AkeneoResource):
             scope: Channel scope (optional)
             locale: Locale (optional)
         """
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
         category_code = validate_identifier(category_code, "category_code")
@@ -202,28 +234,49 @@ class Category(AkeneoResource):
                 'file': f,
             }
             form_data = {
-                'category': json.dumps(category_json)
+                'category': serialization.dumps(category_json)
             }
             
-            response = self._client._make_request_sync("POST", url, form_data=form_data, files=files)
+            response = self._request_sync("POST", url, form_data=form_data, files=files)
         
         return response
     
     def download_media_file(self, file_path: str) -> bytes:
         """Download a category media file."""
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
         url = f"/api/rest/v1/category-media-files/{file_path}/download"
-        response = self._client._make_request_sync("GET", url)
+        return self._request_sync("GET", url, raw=True)
+    
+    def stream_media_file(self, file_path: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """
+        Download a category media file in chunks, without holding it in memory.
         
-        # For binary content, we need to access the raw response
-        # This might need to be adjusted based on how the client handles binary responses
-        return response
+        Args:
+            file_path: Path of the media file
+            chunk_size: Maximum size of each chunk in bytes
+            
+        Returns:
+            Iterator over the file content
+        """
+        if self._request_sync is None:
+            raise TypeError("This method requires a synchronous client")
+        
+        url = f"/api/rest/v1/category-media-files/{file_path}/download"
+        return self._client._stream_request_sync(url, chunk_size=chunk_size)
     
     # Asynchronous versions
     async def get_by_code_async(self, code: str) -> "Category":
-        """Get a category by its code asynchronously."""
+        """
+        Get a category by its code asynchronously.
+        
+        Served from the client's read cache when one is configured, and concurrent
+        lookups of the same code share a single request.
+        """
+        if self._request_async is None:
+            raise TypeError("This method requires an asynchronous client")
+        
         code = validate_identifier(code, "code")
         return await self.get_async(code)
     
@@ -241,34 +294,49 @@ class Category(AkeneoResource):
         code = validate_identifier(code, "code")
         await self.delete_async(code)
     
-    async def bulk_update_async(self, categories: List[Union[Dict[str, Any], CategoryWrite]]) -> List[Dict[str, Any]]:
-        """Update multiple categories at once asynchronously."""
-        if not hasattr(self._client, '_make_request_async'):
-            raise TypeError("This method requires an asynchronous client")
+    async def bulk_update_async(
+        self,
+        categories: List[Union[Dict[str, Any], CategoryWrite]],
+        chunk_size: int = BULK_MAX_ITEMS,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> List[Dict[str, Any]]:
+        """
+        Update multiple categories at once asynchronously.
         
-        # Prepare the NDJSON payload
-        lines = []
-        for category_data in categories:
-            if hasattr(category_data, 'model_dump'):
-                prepared_data = category_data.model_dump(by_alias=True, exclude_none=True)
-            else:
-                prepared_data = category_data
-            lines.append(json.dumps(prepared_data))
+        See bulk_update_iter_async() for how large updates are split into requests.
+        """
+        if self._request_async is None:
+            raise TypeError("This method requires an asynchronous client")
         
-        ndjson_payload = '\n'.join(lines)
         url = "/api/rest/v1/categories"
+        return await self._bulk_update_async(url, categories, chunk_size, max_concurrency)
+    
+    async def bulk_update_iter_async(
+        self,
+        categories: Iterable[Union[Dict[str, Any], CategoryWrite]],
+        chunk_size: int = BULK_MAX_ITEMS,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Update multiple categories at once asynchronously, decoding the per-category results lazily.
         
-        response = await self._client._make_request_async("PATCH", url, form_data=ndjson_payload)
+        Akeneo accepts at most 100 categories per request, so larger updates are split
+        into chunks that are sent concurrently. The results keep the order of the input.
         
-        # Parse NDJSON response
-        if isinstance(response, str):
-            results = []
-            for line in response.strip().split('\n'):
-                if line.strip():
-                    results.append(json.loads(line))
-            return results
+        Args:
+            categories: Categories to create or update
+            chunk_size: Maximum number of categories per request
+            max_concurrency: Maximum number of requests in flight at the same time
+            
+        Returns:
+            Iterator over the NDJSON response lines, one status dict per category
+        """
+        if self._request_async is None:
+            raise TypeError("This method requires an asynchronous client")
         
-        return response if isinstance(response, list) else [response]
+        url = "/api/rest/v1/categories"
+        bodies = await self._bulk_bodies_async(url, categories, chunk_size, max_concurrency)
+        return itertools.chain.from_iterable(map(iter_ndjson, bodies))
     
     async def create_media_file_async(self, category_code: str, attribute_code: str, file_path: str, 
                                     scope: Optional[str] = None, locale: Optional[str] = None) -> Dict[str, Any]:
@@ -282,7 +350,7 @@ class Category(AkeneoResource):
             scope: Channel scope (optional)
             locale: Locale (optional)
         """
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
         
         category_code = validate_identifier(category_code, "category_code")
@@ -297,26 +365,22 @@ class Category(AkeneoResource):
             "locale": locale
         }
         
-        # Prepare the multipart form data
-        with open(file_path, 'rb') as f:
-            files = {
-                'file': f,
-            }
-            form_data = {
-                'category': json.dumps(category_json)
-            }
-            
-            response = await self._client._make_request_async("POST", url, form_data=form_data, files=files)
+        # Read the file in a worker thread so a large upload doesn't block the event loop
+        files = {
+            'file': await read_upload_file(file_path),
+        }
+        form_data = {
+            'category': serialization.dumps(category_json)
+        }
+        
+        response = await self._request_async("POST", url, form_data=form_data, files=files)
         
         return response
     
     async def download_media_file_async(self, file_path: str) -> bytes:
         """Download a category media file asynchronously."""
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
         
         url = f"/api/rest/v1/category-media-files/{file_path}/download"
-        response = await self._client._make_request_async("GET", url)
-        
-        # For binary content, we need to access the raw response
-        return response
+        return await self._request_async("GET", url, raw=True)
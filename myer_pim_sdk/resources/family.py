@@ -1,7 +1,6 @@
 # resources/family.py
 
 from typing import Dict, Any, List, Optional, Union, TYPE_CHECKING
-import json
 
 from .base import AkeneoResource
 from ..models.family import FamilyRead, FamilyWrite, FamilyCreateWrite
@@ -14,6 +13,8 @@ if TYPE_CHECKING:
 class Family(AkeneoResource):
     """Family resource for Akeneo API."""
     
+    __slots__ = ()
+    
     endpoint = "families"
     model_class = FamilyRead
     
@@ -38,32 +39,12 @@ class Family(AkeneoResource):
     
     def bulk_update(self, families: List[Union[Dict[str, Any], FamilyWrite]]) -> List[Dict[str, Any]]:
         """Update multiple families at once."""
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
-        # Prepare the NDJSON payload
-        lines = []
-        for family_data in families:
-            if hasattr(family_data, 'model_dump'):
-                prepared_data = family_data.model_dump(by_alias=True, exclude_none=True)
-            else:
-                prepared_data = family_data
-            lines.append(json.dumps(prepared_data))
-        
-        ndjson_payload = '\n'.join(lines)
         url = "/api/rest/v1/families"
         
-        response = self._client._make_request_sync("PATCH", url, form_data=ndjson_payload)
-        
-        # Parse NDJSON response
-        if isinstance(response, str):
-            results = []
-            for line in response.strip().split('\n'):
-                if line.strip():
-                    results.append(json.loads(line))
-            return results
-        
-        return response if isinstance(response, list) else [response]
+        return self._bulk_update_sync(url, families)
     
     # Asynchronous versions
     async def get_by_code_async(self, code: str) -> "Family":
@@ -87,37 +68,19 @@ class Family(AkeneoResource):
     
     async def bulk_update_async(self, families: List[Union[Dict[str, Any], FamilyWrite]]) -> List[Dict[str, Any]]:
         """Update multiple families at once asynchronously."""
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
         
-        # Prepare the NDJSON payload
-        lines = []
-        for family_data in families:
-            if hasattr(family_data, 'model_dump'):
-                prepared_data = family_data.model_dump(by_alias=True, exclude_none=True)
-            else:
-                prepared_data = family_data
-            lines.append(json.dumps(prepared_data))
-        
-        ndjson_payload = '\n'.join(lines)
         url = "/api/rest/v1/families"
         
-        response = await self._client._make_request_async("PATCH", url, form_data=ndjson_payload)
-        
-        # Parse NDJSON response
-        if isinstance(response, str):
-            results = []
-            for line in response.strip().split('\n'):
-                if line.strip():
-                    results.append(json.loads(line))
-            return results
-        
-        return response if isinstance(response, list) else [response]
+        return await self._bulk_update_async(url, families)
 
 
 class FamilyVariant(AkeneoResource):
     """Family Variant resource for Akeneo API."""
     
+    __slots__ = ("family_code",)
+    
     def __init__(self, *, client, family_code: Optional[str] = None, **kwargs):
         self.family_code = family_code
         if family_code:
@@ -133,11 +96,11 @@ class FamilyVariant(AkeneoResource):
         family_code = validate_identifier(family_code, "family_code")
         variant_code = validate_identifier(variant_code, "variant_code")
         
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
         url = f"/api/rest/v1/families/{family_code}/variants/{variant_code}"
-        response = self._client._make_request_sync("GET", url)
+        response = self._request_sync("GET", url)
         
         return self._create_instance(response)
     
@@ -145,26 +108,26 @@ class FamilyVariant(AkeneoResource):
         """List family variants for a specific family."""
         family_code = validate_identifier(family_code, "family_code")
         
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
         url = f"/api/rest/v1/families/{family_code}/variants"
         prepared_params = self._prepare_request_params(params)
-        response = self._client._make_request_sync("GET", url, params=prepared_params)
+        response = self._request_sync("GET", url, params=prepared_params)
         
         items = self._extract_items(response)
-        return [self._create_instance(item) for item in items]
+        return list(map(self._create_instance, items))
     
     def create_for_family(self, family_code: str, data: Dict[str, Any]) -> "FamilyVariant":
         """Create a family variant for a specific family."""
         family_code = validate_identifier(family_code, "family_code")
         
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
         url = f"/api/rest/v1/families/{family_code}/variants"
         prepared_data = self._prepare_request_data(data)
-        response = self._client._make_request_sync("POST", url, json_data=prepared_data)
+        response = self._request_sync("POST", url, json_data=prepared_data)
         
         return self._create_instance(response)
     
@@ -173,12 +136,12 @@ class FamilyVariant(AkeneoResource):
         family_code = validate_identifier(family_code, "family_code")
         variant_code = validate_identifier(variant_code, "variant_code")
         
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
         url = f"/api/rest/v1/families/{family_code}/variants/{variant_code}"
         prepared_data = self._prepare_request_data(data)
-        response = self._client._make_request_sync("PATCH", url, json_data=prepared_data)
+        response = self._request_sync("PATCH", url, json_data=prepared_data)
         
         if response:
             return self._create_instance(response)
@@ -191,11 +154,11 @@ class FamilyVariant(AkeneoResource):
         family_code = validate_identifier(family_code, "family_code")
         variant_code = validate_identifier(variant_code, "variant_code")
         
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
         
         url = f"/api/rest/v1/families/{family_code}/variants/{variant_code}"
-        response = await self._client._make_request_async("GET", url)
+        response = await self._request_async("GET", url)
         
         return self._create_instance(response)
     
@@ -203,26 +166,26 @@ class FamilyVariant(AkeneoResource):
         """List family variants for a specific family asynchronously."""
         family_code = validate_identifier(family_code, "family_code")
         
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
         
         url = f"/api/rest/v1/families/{family_code}/variants"
         prepared_params = self._prepare_request_params(params)
-        response = await self._client._make_request_async("GET", url, params=prepared_params)
+        response = await self._request_async("GET", url, params=prepared_params)
         
         items = self._extract_items(response)
-        return [self._create_instance(item) for item in items]
+        return list(map(self._create_instance, items))
     
     async def create_for_family_async(self, family_code: str, data: Dict[str, Any]) -> "FamilyVariant":
         """Create a family variant for a specific family asynchronously."""
         family_code = validate_identifier(family_code, "family_code")
         
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
         
         url = f"/api/rest/v1/families/{family_code}/variants"
         prepared_data = self._prepare_request_data(data)
-        response = await self._client._make_request_async("POST", url, json_data=prepared_data)
+        response = await self._request_async("POST", url, json_data=prepared_data)
         
         return self._create_instance(response)
     
@@ -231,12 +194,12 @@ class FamilyVariant(AkeneoResource):
         family_code = validate_identifier(family_code, "family_code")
         variant_code = validate_identifier(variant_code, "variant_code")
         
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
         
         url = f"/api/rest/v1/families/{family_code}/variants/{variant_code}"
         prepared_data = self._prepare_request_data(data)
-        response = await self._client._make_request_async("PATCH", url, json_data=prepared_data)
+        response = await self._request_async("PATCH", url, json_data=prepared_data)
         
         if response:
             return self._create_instance(response)
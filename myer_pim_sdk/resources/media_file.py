@@ -1,11 +1,11 @@
 # resources/media_file.py
 
-from typing import Dict, Any, List, Optional, Union, TYPE_CHECKING
+from typing import Dict, Any, Iterator, List, Optional, Union, TYPE_CHECKING
 import json
 
 from .base import AkeneoResource
 from ..models.media_file import MediaFileRead, MediaFileUpload
-from ..utils import validate_identifier
+from ..utils import validate_identifier, read_upload_file
 
 if TYPE_CHECKING:
     from ..client import AkeneoClient, AkeneoAsyncClient
@@ -19,6 +19,8 @@ class MediaFile(AkeneoResource):
     as suppliers need to upload product images.
     """
     
+    __slots__ = ()
+    
     endpoint = "media-files"
     model_class = MediaFileRead
     
@@ -42,7 +44,7 @@ class MediaFile(AkeneoResource):
         Returns:
             MediaFile instance representing the uploaded file
         """
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
         product_identifier = validate_identifier(product_identifier, "product_identifier")
@@ -66,7 +68,7 @@ class MediaFile(AkeneoResource):
                 'product': json.dumps(product_json)
             }
             
-            response = self._client._make_request_sync("POST", url, form_data=form_data, files=files)
+            response = self._request_sync("POST", url, form_data=form_data, files=files)
         
         return self._create_instance(response)
     
@@ -88,7 +90,7 @@ class MediaFile(AkeneoResource):
         Returns:
             MediaFile instance representing the uploaded file
         """
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
         product_model_code = validate_identifier(product_model_code, "product_model_code")
@@ -112,7 +114,7 @@ class MediaFile(AkeneoResource):
                 'product_model': json.dumps(product_model_json)
             }
             
-            response = self._client._make_request_sync("POST", url, form_data=form_data, files=files)
+            response = self._request_sync("POST", url, form_data=form_data, files=files)
         
         return self._create_instance(response)
     
@@ -126,15 +128,31 @@ class MediaFile(AkeneoResource):
         Returns:
             Binary content of the file
         """
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
         code = validate_identifier(code, "code")
         url = f"/api/rest/v1/media-files/{code}/download"
         
-        # This will return binary content
-        response = self._client._make_request_sync("GET", url)
-        return response
+        return self._request_sync("GET", url, raw=True)
+    
+    def stream(self, code: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """
+        Download a media file by its code in chunks, without holding it in memory.
+        
+        Args:
+            code: Media file code
+            chunk_size: Maximum size of each chunk in bytes
+            
+        Returns:
+            Iterator over the file content
+        """
+        if self._request_sync is None:
+            raise TypeError("This method requires a synchronous client")
+        
+        code = validate_identifier(code, "code")
+        url = f"/api/rest/v1/media-files/{code}/download"
+        return self._client._stream_request_sync(url, chunk_size=chunk_size)
     
     def get_file_info(self, code: str) -> "MediaFile":
         """
@@ -170,7 +188,7 @@ class MediaFile(AkeneoResource):
         Returns:
             MediaFile instance representing the uploaded file
         """
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
         
         product_identifier = validate_identifier(product_identifier, "product_identifier")
@@ -185,16 +203,15 @@ class MediaFile(AkeneoResource):
             "locale": locale
         }
         
-        # Prepare the multipart form data
-        with open(file_path, 'rb') as f:
-            files = {
-                'file': f,
-            }
-            form_data = {
-                'product': json.dumps(product_json)
-            }
-            
-            response = await self._client._make_request_async("POST", url, form_data=form_data, files=files)
+        # Read the file in a worker thread so a large upload doesn't block the event loop
+        files = {
+            'file': await read_upload_file(file_path),
+        }
+        form_data = {
+            'product': json.dumps(product_json)
+        }
+        
+        response = await self._request_async("POST", url, form_data=form_data, files=files)
         
         return self._create_instance(response)
     
@@ -216,7 +233,7 @@ class MediaFile(AkeneoResource):
         Returns:
             MediaFile instance representing the uploaded file
         """
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
         
         product_model_code = validate_identifier(product_model_code, "product_model_code")
@@ -231,16 +248,15 @@ class MediaFile(AkeneoResource):
             "locale": locale
         }
         
-        # Prepare the multipart form data
-        with open(file_path, 'rb') as f:
-            files = {
-                'file': f,
-            }
-            form_data = {
-                'product_model': json.dumps(product_model_json)
-            }
-            
-            response = await self._client._make_request_async("POST", url, form_data=form_data, files=files)
+        # Read the file in a worker thread so a large upload doesn't block the event loop
+        files = {
+            'file': await read_upload_file(file_path),
+        }
+        form_data = {
+            'product_model': json.dumps(product_model_json)
+        }
+        
+        response = await self._request_async("POST", url, form_data=form_data, files=files)
         
         return self._create_instance(response)
     
@@ -254,15 +270,13 @@ class MediaFile(AkeneoResource):
         Returns:
             Binary content of the file
         """
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
         
         code = validate_identifier(code, "code")
         url = f"/api/rest/v1/media-files/{code}/download"
         
-        # This will return binary content
-        response = await self._client._make_request_async("GET", url)
-        return response
+        return await self._request_async("GET", url, raw=True)
     
     async def get_file_info_async(self, code: str) -> "MediaFile":
         """
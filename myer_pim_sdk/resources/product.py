@@ -1,17 +1,21 @@
 # resources/product.py
 
-from typing import Dict, Any, List, Optional, Union, TYPE_CHECKING, Callable
-import json
+from typing import Dict, Any, List, Optional, Union, TYPE_CHECKING, Callable, Generator, AsyncGenerator
 
-from .base import AkeneoResource
+from .. import serialization
+from .base import AkeneoResource, PaginatedResponse, DEFAULT_BULK_CONCURRENCY, DEFAULT_FANOUT_CONCURRENCY
 from ..models.product import ProductRead, ProductWrite, ProductCreateWrite
-from ..utils import validate_identifier
-from ..search import SearchBuilder, FilterBuilder
+from ..utils import validate_identifier, first_value, BULK_MAX_ITEMS
+from ..search import SearchBuilder, FilterBuilder, CompiledSearch
 from ..search.filters import ProductPropertyFilter, AttributeFilter
 
 if TYPE_CHECKING:
     from ..client import AkeneoClient, AkeneoAsyncClient
 
+PRODUCTS_URL = "/api/rest/v1/products"
+PRODUCTS_UUID_URL = "/api/rest/v1/products-uuid"
+PRODUCTS_UUID_SEARCH_URL = PRODUCTS_UUID_URL + "/search"
+
 
 class Product(AkeneoResource):
     """
@@ -21,81 +25,101 @@ class Product(AkeneoResource):
     For Myer's system, products are SKU-level items (Level 2).
     """
     
+    __slots__ = ()
+    
     endpoint = "products"
     model_class = ProductRead
+    supports_search_after = True
+
+    def get_value(self, code: str, default: Any = None,
+                  locale: Optional[str] = None, scope: Optional[str] = None) -> Any:
+        """Get the data of the first value of an attribute (optionally for a locale/scope)."""
+        return first_value(self._data.get('values') or {}, code, default, locale, scope)
+    
+    def flat(self, keys: List[str], default: Any = None) -> Dict[str, Any]:
+        """
+        Get the first value of several attributes in one pass over the raw values.
+        
+        Args:
+            keys: Attribute codes to extract
+            default: Value used for attributes without data
+            
+        Returns:
+            Dictionary of attribute code to value data
+        """
+        values = self._data.get('values') or {}
+        return {key: first_value(values, key, default) for key in keys}
+    
+    # Path building and validation shared by the sync and async methods
+    
+    @staticmethod
+    def _uuid_url(uuid: str) -> str:
+        """Get the path of a product on the UUID endpoint."""
+        return f"{PRODUCTS_UUID_URL}/{validate_identifier(uuid, 'UUID')}"
+    
+    @staticmethod
+    def _identifier_url(identifier: str) -> str:
+        """Get the path of a product on the identifier endpoint."""
+        return f"{PRODUCTS_URL}/{validate_identifier(identifier, 'identifier')}"
     
     # Synchronous methods
     
     def get_by_uuid(self, uuid: str) -> "Product":
         """Get a product by its UUID."""
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
-        uuid = validate_identifier(uuid, "UUID")
-        url = f"/api/rest/v1/products-uuid/{uuid}"
-        response = self._client._make_request_sync("GET", url)
+        url = self._uuid_url(uuid)
+        response = self._request_sync("GET", url)
         
         return self._create_instance(response)
     
     def get_by_identifier(self, identifier: str) -> "Product":
         """Get a product by its identifier (SKU).""" 
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
-        identifier = validate_identifier(identifier, "identifier")
-        url = f"/api/rest/v1/products/{identifier}"
-        response = self._client._make_request_sync("GET", url)
+        url = self._identifier_url(identifier)
+        response = self._request_sync("GET", url)
         
         return self._create_instance(response)
     
     def list_by_uuid(self, paginated: bool = False, **params) -> Union[List["Product"], "PaginatedResponse[Product]"]:
         """List products using the UUID endpoint."""
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
             
-        url = "/api/rest/v1/products-uuid"
+        url = PRODUCTS_UUID_URL
         prepared_params = self._prepare_request_params(params)
-        response = self._client._make_request_sync("GET", url, params=prepared_params)
+        response = self._request_sync("GET", url, params=prepared_params)
         
         items = self._extract_items(response)
-        instances = [self._create_instance(item) for item in items]
+        instances = list(map(self._create_instance, items))
         
         if paginated:
-            pagination_data = self._extract_pagination_data(response)
-            links = response.get('_links', {}) if isinstance(response, dict) else {}
-            from .base import PaginatedResponse
-            return PaginatedResponse(
-                items=instances,
-                current_page=pagination_data.get('current_page', 1),
-                has_next=pagination_data.get('has_next', False),
-                has_previous=pagination_data.get('has_previous', False),
-                has_first=pagination_data.get('has_first', False),
-                has_last=pagination_data.get('has_last', False),
-                links=links
-            )
+            return PaginatedResponse.from_response(response, instances)
         
         return instances
     
     def create_with_uuid(self, data: Union[Dict[str, Any], ProductCreateWrite]) -> "Product":
         """Create a new product using the UUID endpoint."""
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
             
-        url = "/api/rest/v1/products-uuid"
+        url = PRODUCTS_UUID_URL
         prepared_data = self._prepare_request_data(data)
-        response = self._client._make_request_sync("POST", url, json_data=prepared_data)
+        response = self._request_sync("POST", url, json_data=prepared_data)
         
         return self._create_instance(response)
     
     def update_by_uuid(self, uuid: str, data: Union[Dict[str, Any], ProductWrite]) -> "Product":
         """Update a product by UUID."""
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
             
-        uuid = validate_identifier(uuid, "UUID")
-        url = f"/api/rest/v1/products-uuid/{uuid}"
+        url = self._uuid_url(uuid)
         prepared_data = self._prepare_request_data(data)
-        response = self._client._make_request_sync("PATCH", url, json_data=prepared_data)
+        response = self._request_sync("PATCH", url, json_data=prepared_data)
         
         # Akeneo PATCH often returns empty response, so fetch the updated product
         if response:
@@ -105,13 +129,12 @@ class Product(AkeneoResource):
     
     def update_by_identifier(self, identifier: str, data: Union[Dict[str, Any], ProductWrite]) -> "Product":
         """Update a product by identifier."""
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
             
-        identifier = validate_identifier(identifier, "identifier")
-        url = f"/api/rest/v1/products/{identifier}"
+        url = self._identifier_url(identifier)
         prepared_data = self._prepare_request_data(data)
-        response = self._client._make_request_sync("PATCH", url, json_data=prepared_data)
+        response = self._request_sync("PATCH", url, json_data=prepared_data)
         
         # Akeneo PATCH often returns empty response, so fetch the updated product
         if response:
@@ -121,21 +144,19 @@ class Product(AkeneoResource):
     
     def delete_by_uuid(self, uuid: str) -> None:
         """Delete a product by UUID."""
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
             
-        uuid = validate_identifier(uuid, "UUID")
-        url = f"/api/rest/v1/products-uuid/{uuid}"
-        self._client._make_request_sync("DELETE", url)
+        url = self._uuid_url(uuid)
+        self._request_sync("DELETE", url)
     
     def delete_by_identifier(self, identifier: str) -> None:
         """Delete a product by identifier."""
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
             
-        identifier = validate_identifier(identifier, "identifier")
-        url = f"/api/rest/v1/products/{identifier}"
-        self._client._make_request_sync("DELETE", url)
+        url = self._identifier_url(identifier)
+        self._request_sync("DELETE", url)
     
     def bulk_update(self, products: List[Union[Dict[str, Any], ProductWrite]], use_uuid: bool = False) -> List[Dict[str, Any]]:
         """
@@ -148,38 +169,20 @@ class Product(AkeneoResource):
         Returns:
             List of status responses for each product update
         """
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
-        # Prepare the NDJSON payload
-        lines = []
-        for product_data in products:
-            if hasattr(product_data, 'model_dump'):
-                prepared_data = product_data.model_dump(by_alias=True, exclude_none=True)
-            else:
-                prepared_data = product_data
-            lines.append(json.dumps(prepared_data))
-        
-        ndjson_payload = '\n'.join(lines)
-        
         # Choose endpoint based on use_uuid flag
-        url = "/api/rest/v1/products-uuid" if use_uuid else "/api/rest/v1/products"
-        
-        headers = {
-            "Content-Type": "application/vnd.akeneo.collection+json"
-        }
+        url = PRODUCTS_UUID_URL if use_uuid else PRODUCTS_URL
         
-        response = self._client._make_request_sync("PATCH", url, form_data=ndjson_payload)
-        
-        # Parse NDJSON response
-        if isinstance(response, str):
-            results = []
-            for line in response.strip().split('\n'):
-                if line.strip():
-                    results.append(json.loads(line))
-            return results
-        
-        return response if isinstance(response, list) else [response]
+        return self._bulk_update_sync(url, products)
+    
+    @staticmethod
+    def _search_request_body(search_criteria: Optional[Dict[str, Any]], params: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the JSON body of a POST search request."""
+        # One pass over the search field and the extra params, dropping None values
+        search = serialization.dumps(search_criteria) if search_criteria else None
+        return {k: v for k, v in (("search", search), *params.items()) if v is not None}
     
     def search(self, search_criteria: Dict[str, Any], **params) -> List["Product"]:
         """
@@ -192,32 +195,25 @@ class Product(AkeneoResource):
         Returns:
             List of matching products
         """
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
-        url = "/api/rest/v1/products-uuid/search"
-        
-        # Prepare request body
-        request_body = {
-            "search": json.dumps(search_criteria) if search_criteria else None,
-            **params
-        }
+        url = PRODUCTS_UUID_SEARCH_URL
         
-        # Clean None values
-        request_body = {k: v for k, v in request_body.items() if v is not None}
+        request_body = self._search_request_body(search_criteria, params)
         
-        response = self._client._make_request_sync("POST", url, json_data=request_body)
+        response = self._request_sync("POST", url, json_data=request_body)
         
         items = self._extract_items(response)
-        return [self._create_instance(item) for item in items]
+        return list(map(self._create_instance, items))
     
-    def search_with_builder(self, builder: Union[SearchBuilder, Callable[[FilterBuilder], None]],
+    def search_with_builder(self, builder: Union[SearchBuilder, CompiledSearch, Callable[[FilterBuilder], None]],
                            use_uuid: bool = True, paginated: bool = False) -> Union[List["Product"], "PaginatedResponse[Product]"]:
         """
         Search for products using SearchBuilder or FilterBuilder.
         
         Args:
-            builder: SearchBuilder instance or function that configures a FilterBuilder
+            builder: SearchBuilder, bound CompiledSearch, or function that configures a FilterBuilder
             use_uuid: Whether to use UUID endpoint (default: True)
             paginated: Whether to return paginated response
             
@@ -234,7 +230,7 @@ class Product(AkeneoResource):
                 lambda f: f.enabled(True).categories(["winter_collection"])
             )
         """
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
         # Handle different builder types
@@ -251,32 +247,84 @@ class Product(AkeneoResource):
         
         # Choose endpoint based on use_uuid
         if use_uuid:
-            url = "/api/rest/v1/products-uuid"
+            url = PRODUCTS_UUID_URL
         else:
-            url = "/api/rest/v1/products"
+            url = PRODUCTS_URL
         
         prepared_params = self._prepare_request_params(search_params)
-        response = self._client._make_request_sync("GET", url, params=prepared_params)
+        response = self._request_sync("GET", url, params=prepared_params)
         
         items = self._extract_items(response)
-        instances = [self._create_instance(item) for item in items]
+        instances = list(map(self._create_instance, items))
         
         if paginated:
-            pagination_data = self._extract_pagination_data(response)
-            links = response.get('_links', {}) if isinstance(response, dict) else {}
-            from .base import PaginatedResponse
-            return PaginatedResponse(
-                items=instances,
-                current_page=pagination_data.get('current_page', 1),
-                has_next=pagination_data.get('has_next', False),
-                has_previous=pagination_data.get('has_previous', False),
-                has_first=pagination_data.get('has_first', False),
-                has_last=pagination_data.get('has_last', False),
-                links=links
-            )
+            return PaginatedResponse.from_response(response, instances)
         
         return instances
     
+    def search_with_builder_stream(self, builder: Union[SearchBuilder, CompiledSearch, Callable[[FilterBuilder], None]],
+                                   page_size: int = 100, use_uuid: bool = True) -> Generator["Product", None, None]:
+        """
+        Stream every product matching a search, one page at a time.
+        
+        Pages are fetched with search_after cursors, so only one page of results
+        is held in memory regardless of the size of the result set.
+        
+        Args:
+            builder: SearchBuilder, bound CompiledSearch, or function that configures a FilterBuilder
+            page_size: Number of items requested per page (Akeneo allows up to 100)
+            use_uuid: Whether to use UUID endpoint (default: True)
+            
+        Yields:
+            Product instances one at a time
+            
+        Examples:
+            count = sum(1 for _ in client.products.search_with_builder_stream(
+                lambda f: f.enabled(True)
+            ))
+        """
+        if self._request_sync is None:
+            raise TypeError("This method requires a synchronous client")
+        
+        # Work on a copy so the caller's builder keeps its own pagination settings
+        if isinstance(builder, (SearchBuilder, CompiledSearch)):
+            search_builder = builder.clone()
+        else:
+            search_builder = SearchBuilder().filters(builder)
+        search_builder.limit(page_size).search_after()
+        
+        while True:
+            page = self.search_with_builder(search_builder, use_uuid=use_uuid, paginated=True)
+            yield from page
+            
+            cursor = page.next_cursor
+            if not cursor:
+                break
+            search_builder.search_after(cursor)
+    
+    def count(self, builder: Union[SearchBuilder, CompiledSearch, Callable[[FilterBuilder], None]], use_uuid: bool = True) -> int:
+        """
+        Count the products matching a search without downloading them.
+        
+        Issues a single one-item request with with_count=true (see
+        SearchBuilder.count_only()). Searches only pay for the server-side count
+        when it is requested like this; search_with_builder never asks for it.
+        
+        Args:
+            builder: SearchBuilder, bound CompiledSearch, or function that configures a FilterBuilder
+            use_uuid: Whether to use UUID endpoint (default: True)
+            
+        Returns:
+            Total number of matching products
+        """
+        if isinstance(builder, (SearchBuilder, CompiledSearch)):
+            search_builder = builder.clone()
+        else:
+            search_builder = SearchBuilder().filters(builder)
+        
+        page = self.search_with_builder(search_builder.count_only(), use_uuid=use_uuid, paginated=True)
+        return page.items_count or 0
+    
     def find_by_uuid(self, uuids: List[str]) -> List["Product"]:
         """
         Find products by a list of UUIDs.
@@ -291,15 +339,16 @@ class Product(AkeneoResource):
             lambda f: f.uuid(uuids)
         )
     
-    def find_enabled(self, **filters) -> List["Product"]:
+    def find_enabled(self, count_only: bool = False, **filters) -> Union[List["Product"], int]:
         """
         Find enabled products with optional additional filters.
         
         Args:
+            count_only: Return the number of matches instead, using a single one-item request
             **filters: Additional search parameters
             
         Returns:
-            List of enabled products
+            List of enabled products, or their count when count_only is True
         """
         builder = SearchBuilder().raw_filter("enabled", "=", True)
         
@@ -312,35 +361,42 @@ class Product(AkeneoResource):
             elif key == "updated_since_days":
                 builder.raw_filter("updated", "SINCE LAST N DAYS", value)
         
+        if count_only:
+            return self.count(builder)
         return self.search_with_builder(builder)
     
-    def find_in_categories(self, category_codes: List[str], include_children: bool = False) -> List["Product"]:
+    def find_in_categories(self, category_codes: List[str], include_children: bool = False,
+                           count_only: bool = False) -> Union[List["Product"], int]:
         """
         Find products in specific categories.
         
         Args:
             category_codes: List of category codes
             include_children: Whether to include child categories
+            count_only: Return the number of matches instead, using a single one-item request
             
         Returns:
-            List of products in the categories
+            List of products in the categories, or their count when count_only is True
         """
         operator = "IN CHILDREN" if include_children else "IN"
-        return self.search_with_builder(
+        search = self.count if count_only else self.search_with_builder
+        return search(
             lambda f: f.categories(category_codes, operator)
         )
     
-    def find_by_family(self, family_codes: List[str]) -> List["Product"]:
+    def find_by_family(self, family_codes: List[str], count_only: bool = False) -> Union[List["Product"], int]:
         """
         Find products by family codes.
         
         Args:
             family_codes: List of family codes
+            count_only: Return the number of matches instead, using a single one-item request
             
         Returns:
-            List of products in the families
+            List of products in the families, or their count when count_only is True
         """
-        return self.search_with_builder(
+        search = self.count if count_only else self.search_with_builder
+        return search(
             lambda f: f.family(family_codes)
         )
     
@@ -439,74 +495,60 @@ class Product(AkeneoResource):
     
     async def get_by_uuid_async(self, uuid: str) -> "Product":
         """Get a product by its UUID asynchronously."""
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
         
-        uuid = validate_identifier(uuid, "UUID")
-        url = f"/api/rest/v1/products-uuid/{uuid}"
-        response = await self._client._make_request_async("GET", url)
+        url = self._uuid_url(uuid)
+        response = await self._request_async("GET", url)
         
         return self._create_instance(response)
     
     async def get_by_identifier_async(self, identifier: str) -> "Product":
         """Get a product by its identifier (SKU) asynchronously."""
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
         
-        identifier = validate_identifier(identifier, "identifier")
-        url = f"/api/rest/v1/products/{identifier}"
-        response = await self._client._make_request_async("GET", url)
+        url = self._identifier_url(identifier)
+        response = await self._request_async("GET", url)
         
         return self._create_instance(response)
     
     async def list_by_uuid_async(self, paginated: bool = False, **params) -> Union[List["Product"], "PaginatedResponse[Product]"]:
         """List products using the UUID endpoint asynchronously."""
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
             
-        url = "/api/rest/v1/products-uuid"
+        url = PRODUCTS_UUID_URL
         prepared_params = self._prepare_request_params(params)
-        response = await self._client._make_request_async("GET", url, params=prepared_params)
+        response = await self._request_async("GET", url, params=prepared_params)
         
         items = self._extract_items(response)
-        instances = [self._create_instance(item) for item in items]
+        instances = list(map(self._create_instance, items))
         
         if paginated:
-            pagination_data = self._extract_pagination_data(response)
-            links = response.get('_links', {}) if isinstance(response, dict) else {}
-            from .base import PaginatedResponse
-            return PaginatedResponse(
-                items=instances,
-                current_page=pagination_data.get('current_page', 1),
-                has_next=pagination_data.get('has_next', False),
-                has_previous=pagination_data.get('has_previous', False),
-                has_first=pagination_data.get('has_first', False),
-                has_last=pagination_data.get('has_last', False),
-                links=links
-            )
+            return PaginatedResponse.from_response(response, instances)
         
         return instances
     
     async def create_with_uuid_async(self, data: Union[Dict[str, Any], ProductCreateWrite]) -> "Product":
         """Create a new product using the UUID endpoint asynchronously."""
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
             
-        url = "/api/rest/v1/products-uuid"
+        url = PRODUCTS_UUID_URL
         prepared_data = self._prepare_request_data(data)
-        response = await self._client._make_request_async("POST", url, json_data=prepared_data)
+        response = await self._request_async("POST", url, json_data=prepared_data)
         
         return self._create_instance(response)
     
     async def update_by_uuid_async(self, uuid: str, data: Union[Dict[str, Any], ProductWrite]) -> "Product":
         """Update a product by UUID asynchronously."""
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
             
-        uuid = validate_identifier(uuid, "UUID")
-        url = f"/api/rest/v1/products-uuid/{uuid}"
+        url = self._uuid_url(uuid)
         prepared_data = self._prepare_request_data(data)
-        response = await self._client._make_request_async("PATCH", url, json_data=prepared_data)
+        response = await self._request_async("PATCH", url, json_data=prepared_data)
         
         # Akeneo PATCH often returns empty response, so fetch the updated product
         if response:
@@ -516,13 +558,12 @@ class Product(AkeneoResource):
     
     async def update_by_identifier_async(self, identifier: str, data: Union[Dict[str, Any], ProductWrite]) -> "Product":
         """Update a product by identifier asynchronously."""
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
             
-        identifier = validate_identifier(identifier, "identifier")
-        url = f"/api/rest/v1/products/{identifier}"
+        url = self._identifier_url(identifier)
         prepared_data = self._prepare_request_data(data)
-        response = await self._client._make_request_async("PATCH", url, json_data=prepared_data)
+        response = await self._request_async("PATCH", url, json_data=prepared_data)
         
         # Akeneo PATCH often returns empty response, so fetch the updated product
         if response:
@@ -532,61 +573,169 @@ class Product(AkeneoResource):
     
     async def delete_by_uuid_async(self, uuid: str) -> None:
         """Delete a product by UUID asynchronously."""
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
             
-        uuid = validate_identifier(uuid, "UUID")
-        url = f"/api/rest/v1/products-uuid/{uuid}"
-        await self._client._make_request_async("DELETE", url)
+        url = self._uuid_url(uuid)
+        await self._request_async("DELETE", url)
     
     async def delete_by_identifier_async(self, identifier: str) -> None:
         """Delete a product by identifier asynchronously."""
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
+            raise TypeError("This method requires an asynchronous client")
+            
+        url = self._identifier_url(identifier)
+        await self._request_async("DELETE", url)
+    
+    async def get_many_by_uuid_async(
+        self,
+        uuids: List[str],
+        max_concurrency: int = DEFAULT_FANOUT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> List["Product"]:
+        """
+        Get several products by UUID concurrently.
+        
+        Akeneo has no batch endpoint for this, so one request is sent per product, with
+        at most ``max_concurrency`` in flight.
+        
+        Args:
+            uuids: Product UUIDs
+            max_concurrency: Maximum number of requests in flight at the same time
+            return_exceptions: Return errors (e.g. NotFoundError) in place of the failed
+                results instead of raising the first one
+            
+        Returns:
+            Products in the order of ``uuids``
+        """
+        if self._request_async is None:
+            raise TypeError("This method requires an asynchronous client")
+        
+        return await self._client.gather(
+            *(self.get_by_uuid_async(uuid) for uuid in uuids),
+            max_concurrency=max_concurrency,
+            return_exceptions=return_exceptions,
+        )
+    
+    async def get_many_by_identifier_async(
+        self,
+        identifiers: List[str],
+        max_concurrency: int = DEFAULT_FANOUT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> List["Product"]:
+        """
+        Get several products by identifier concurrently.
+        
+        Akeneo has no batch endpoint for this, so one request is sent per product, with
+        at most ``max_concurrency`` in flight.
+        
+        Args:
+            identifiers: Product identifiers
+            max_concurrency: Maximum number of requests in flight at the same time
+            return_exceptions: Return errors (e.g. NotFoundError) in place of the failed
+                results instead of raising the first one
+            
+        Returns:
+            Products in the order of ``identifiers``
+        """
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
+        
+        return await self._client.gather(
+            *(self.get_by_identifier_async(identifier) for identifier in identifiers),
+            max_concurrency=max_concurrency,
+            return_exceptions=return_exceptions,
+        )
+    
+    async def delete_many_by_uuid_async(
+        self,
+        uuids: List[str],
+        max_concurrency: int = DEFAULT_FANOUT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Delete several products by UUID concurrently.
+        
+        Akeneo has no batch endpoint for this, so one request is sent per product, with
+        at most ``max_concurrency`` in flight.
+        
+        Args:
+            uuids: Product UUIDs
+            max_concurrency: Maximum number of requests in flight at the same time
+            return_exceptions: Return errors (e.g. NotFoundError) in place of the failed
+                results instead of raising the first one
             
-        identifier = validate_identifier(identifier, "identifier")
-        url = f"/api/rest/v1/products/{identifier}"
-        await self._client._make_request_async("DELETE", url)
+        Returns:
+            One result (None, or the error) per UUID
+        """
+        if self._request_async is None:
+            raise TypeError("This method requires an asynchronous client")
+        
+        return await self._client.gather(
+            *(self.delete_by_uuid_async(uuid) for uuid in uuids),
+            max_concurrency=max_concurrency,
+            return_exceptions=return_exceptions,
+        )
+    
+    async def delete_many_by_identifier_async(
+        self,
+        identifiers: List[str],
+        max_concurrency: int = DEFAULT_FANOUT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Delete several products by identifier concurrently.
+        
+        Akeneo has no batch endpoint for this, so one request is sent per product, with
+        at most ``max_concurrency`` in flight.
+        
+        Args:
+            identifiers: Product identifiers
+            max_concurrency: Maximum number of requests in flight at the same time
+            return_exceptions: Return errors (e.g. NotFoundError) in place of the failed
+                results instead of raising the first one
+            
+        Returns:
+            One result (None, or the error) per identifier
+        """
+        if self._request_async is None:
+            raise TypeError("This method requires an asynchronous client")
+        
+        return await self._client.gather(
+            *(self.delete_by_identifier_async(identifier) for identifier in identifiers),
+            max_concurrency=max_concurrency,
+            return_exceptions=return_exceptions,
+        )
     
-    async def bulk_update_async(self, products: List[Union[Dict[str, Any], ProductWrite]], use_uuid: bool = False) -> List[Dict[str, Any]]:
+    async def bulk_update_async(
+        self,
+        products: List[Union[Dict[str, Any], ProductWrite]],
+        use_uuid: bool = False,
+        chunk_size: int = BULK_MAX_ITEMS,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> List[Dict[str, Any]]:
         """
         Update multiple products at once asynchronously.
         
+        Akeneo accepts at most 100 products per request, so larger updates are split
+        into chunks that are sent concurrently. The results keep the order of the input.
+        
         Args:
             products: List of product data to update
             use_uuid: Whether to use the UUID endpoint (default: identifier endpoint)
+            chunk_size: Maximum number of products per request
+            max_concurrency: Maximum number of requests in flight at the same time
             
         Returns:
             List of status responses for each product update
         """
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
         
-        # Prepare the NDJSON payload
-        lines = []
-        for product_data in products:
-            if hasattr(product_data, 'model_dump'):
-                prepared_data = product_data.model_dump(by_alias=True, exclude_none=True)
-            else:
-                prepared_data = product_data
-            lines.append(json.dumps(prepared_data))
-        
-        ndjson_payload = '\n'.join(lines)
-        
         # Choose endpoint based on use_uuid flag
-        url = "/api/rest/v1/products-uuid" if use_uuid else "/api/rest/v1/products"
+        url = PRODUCTS_UUID_URL if use_uuid else PRODUCTS_URL
         
-        response = await self._client._make_request_async("PATCH", url, form_data=ndjson_payload)
-        
-        # Parse NDJSON response
-        if isinstance(response, str):
-            results = []
-            for line in response.strip().split('\n'):
-                if line.strip():
-                    results.append(json.loads(line))
-            return results
-        
-        return response if isinstance(response, list) else [response]
+        return await self._bulk_update_async(url, products, chunk_size, max_concurrency)
     
     async def search_async(self, search_criteria: Dict[str, Any], **params) -> List["Product"]:
         """
@@ -599,39 +748,66 @@ class Product(AkeneoResource):
         Returns:
             List of matching products
         """
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
         
-        url = "/api/rest/v1/products-uuid/search"
+        url = PRODUCTS_UUID_SEARCH_URL
         
-        # Prepare request body
-        request_body = {
-            "search": json.dumps(search_criteria) if search_criteria else None,
-            **params
-        }
+        request_body = self._search_request_body(search_criteria, params)
         
-        # Clean None values
-        request_body = {k: v for k, v in request_body.items() if v is not None}
-        
-        response = await self._client._make_request_async("POST", url, json_data=request_body)
+        response = await self._request_async("POST", url, json_data=request_body)
         
         items = self._extract_items(response)
-        return [self._create_instance(item) for item in items]
+        return list(map(self._create_instance, items))
+    
+    async def iter_search_async(self, search_criteria: Dict[str, Any], page_size: int = 100,
+                                prefetch: bool = True, **params) -> AsyncGenerator["Product", None]:
+        """
+        Iterate over every product matching a search, following search_after cursors.
+        
+        Unlike search_async(), which returns a single page, this walks all pages. The
+        next page is requested before the current one is handed out, so its latency
+        overlaps with the caller's processing.
+        
+        Args:
+            search_criteria: Search criteria in Akeneo format
+            page_size: Number of items requested per page (Akeneo allows up to 100)
+            prefetch: Fetch the next page while the current one is consumed
+            **params: Additional body parameters
+            
+        Yields:
+            Product instances one at a time
+        """
+        if self._request_async is None:
+            raise TypeError("This method requires an asynchronous client")
+        
+        url = PRODUCTS_UUID_SEARCH_URL
+        request_body = self._search_request_body(
+            search_criteria, {**params, "pagination_type": "search_after", "limit": page_size}
+        )
+        
+        async def fetch_page(cursor: Optional[str]) -> Any:
+            body = request_body if cursor is None else {**request_body, "search_after": cursor}
+            return await self._request_async("POST", url, json_data=body)
+        
+        async for response in self._iter_cursor_pages_async(fetch_page, prefetch=prefetch):
+            for item in self._extract_items(response):
+                yield self._create_instance(item)
     
-    async def search_with_builder_async(self, builder: Union[SearchBuilder, Callable[[FilterBuilder], None]],
+    async def search_with_builder_async(self, builder: Union[SearchBuilder, CompiledSearch, Callable[[FilterBuilder], None]],
                                        use_uuid: bool = True, paginated: bool = False) -> Union[List["Product"], "PaginatedResponse[Product]"]:
         """
         Search for products using SearchBuilder or FilterBuilder asynchronously.
         
         Args:
-            builder: SearchBuilder instance or function that configures a FilterBuilder
+            builder: SearchBuilder, bound CompiledSearch, or function that configures a FilterBuilder
             use_uuid: Whether to use UUID endpoint (default: True)
             paginated: Whether to return paginated response
             
         Returns:
             List of products or PaginatedResponse
         """
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
         
         # Handle different builder types
@@ -648,40 +824,72 @@ class Product(AkeneoResource):
         
         # Choose endpoint based on use_uuid
         if use_uuid:
-            url = "/api/rest/v1/products-uuid"
+            url = PRODUCTS_UUID_URL
         else:
-            url = "/api/rest/v1/products"
+            url = PRODUCTS_URL
         
         prepared_params = self._prepare_request_params(search_params)
-        response = await self._client._make_request_async("GET", url, params=prepared_params)
+        response = await self._request_async("GET", url, params=prepared_params)
         
         items = self._extract_items(response)
-        instances = [self._create_instance(item) for item in items]
+        instances = list(map(self._create_instance, items))
         
         if paginated:
-            pagination_data = self._extract_pagination_data(response)
-            links = response.get('_links', {}) if isinstance(response, dict) else {}
-            from .base import PaginatedResponse
-            return PaginatedResponse(
-                items=instances,
-                current_page=pagination_data.get('current_page', 1),
-                has_next=pagination_data.get('has_next', False),
-                has_previous=pagination_data.get('has_previous', False),
-                has_first=pagination_data.get('has_first', False),
-                has_last=pagination_data.get('has_last', False),
-                links=links
-            )
+            return PaginatedResponse.from_response(response, instances)
         
         return instances
     
+    async def search_with_builder_stream_async(self, builder: Union[SearchBuilder, CompiledSearch, Callable[[FilterBuilder], None]],
+                                               page_size: int = 100, use_uuid: bool = True) -> AsyncGenerator["Product", None]:
+        """
+        Stream every product matching a search asynchronously, one page at a time.
+        
+        Args:
+            builder: SearchBuilder, bound CompiledSearch, or function that configures a FilterBuilder
+            page_size: Number of items requested per page (Akeneo allows up to 100)
+            use_uuid: Whether to use UUID endpoint (default: True)
+            
+        Yields:
+            Product instances one at a time
+        """
+        if self._request_async is None:
+            raise TypeError("This method requires an asynchronous client")
+        
+        # Work on a copy so the caller's builder keeps its own pagination settings
+        if isinstance(builder, (SearchBuilder, CompiledSearch)):
+            search_builder = builder.clone()
+        else:
+            search_builder = SearchBuilder().filters(builder)
+        search_builder.limit(page_size).search_after()
+        
+        while True:
+            page = await self.search_with_builder_async(search_builder, use_uuid=use_uuid, paginated=True)
+            for item in page:
+                yield item
+            
+            cursor = page.next_cursor
+            if not cursor:
+                break
+            search_builder.search_after(cursor)
+    
     # Async versions of convenience methods
     
+    async def count_async(self, builder: Union[SearchBuilder, CompiledSearch, Callable[[FilterBuilder], None]], use_uuid: bool = True) -> int:
+        """Count the products matching a search without downloading them, asynchronously."""
+        if isinstance(builder, (SearchBuilder, CompiledSearch)):
+            search_builder = builder.clone()
+        else:
+            search_builder = SearchBuilder().filters(builder)
+        
+        page = await self.search_with_builder_async(search_builder.count_only(), use_uuid=use_uuid, paginated=True)
+        return page.items_count or 0
+    
     async def find_by_uuid_async(self, uuids: List[str]) -> List["Product"]:
         """Find products by UUIDs asynchronously."""
         return await self.search_with_builder_async(lambda f: f.uuid(uuids))
     
-    async def find_enabled_async(self, **filters) -> List["Product"]:
-        """Find enabled products asynchronously."""
+    async def find_enabled_async(self, count_only: bool = False, **filters) -> Union[List["Product"], int]:
+        """Find enabled products asynchronously (or just count them with count_only=True)."""
         builder = SearchBuilder().raw_filter("enabled", "=", True)
         
         for key, value in filters.items():
@@ -692,16 +900,21 @@ class Product(AkeneoResource):
             elif key == "updated_since_days":
                 builder.raw_filter("updated", "SINCE LAST N DAYS", value)
         
+        if count_only:
+            return await self.count_async(builder)
         return await self.search_with_builder_async(builder)
     
-    async def find_in_categories_async(self, category_codes: List[str], include_children: bool = False) -> List["Product"]:
-        """Find products in categories asynchronously."""
+    async def find_in_categories_async(self, category_codes: List[str], include_children: bool = False,
+                                       count_only: bool = False) -> Union[List["Product"], int]:
+        """Find products in categories asynchronously (or just count them with count_only=True)."""
         operator = "IN CHILDREN" if include_children else "IN"
-        return await self.search_with_builder_async(lambda f: f.categories(category_codes, operator))
+        search = self.count_async if count_only else self.search_with_builder_async
+        return await search(lambda f: f.categories(category_codes, operator))
     
-    async def find_by_family_async(self, family_codes: List[str]) -> List["Product"]:
-        """Find products by family asynchronously."""
-        return await self.search_with_builder_async(lambda f: f.family(family_codes))
+    async def find_by_family_async(self, family_codes: List[str], count_only: bool = False) -> Union[List["Product"], int]:
+        """Find products by family asynchronously (or just count them with count_only=True)."""
+        search = self.count_async if count_only else self.search_with_builder_async
+        return await search(lambda f: f.family(family_codes))
     
     async def find_incomplete_async(self, scope: str, threshold: int = 100, 
                                    locales: Optional[List[str]] = None) -> List["Product"]:
@@ -1,12 +1,11 @@
 # resources/product_model.py
 
-from typing import Dict, Any, List, Optional, Union, TYPE_CHECKING, Callable
-import json
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union, TYPE_CHECKING, Callable, Generator, AsyncGenerator
 
-from .base import AkeneoResource, PaginatedResponse
+from .base import AkeneoResource, PaginatedResponse, DEFAULT_BULK_CONCURRENCY
 from ..models.product_model import ProductModelRead, ProductModelWrite, ProductModelCreateWrite
-from ..utils import validate_identifier
-from ..search import SearchBuilder, FilterBuilder
+from ..utils import validate_identifier, first_value, BULK_MAX_ITEMS
+from ..search import SearchBuilder, FilterBuilder, CompiledSearch
 from ..search.filters import ProductModelPropertyFilter, AttributeFilter
 
 if TYPE_CHECKING:
@@ -21,28 +20,50 @@ class ProductModel(AkeneoResource):
     where copy and image enrichment is performed.
     """
     
+    __slots__ = ()
+    
     endpoint = "product-models"
     model_class = ProductModelRead
+    supports_search_after = True
+
+    def get_value(self, code: str, default: Any = None,
+                  locale: Optional[str] = None, scope: Optional[str] = None) -> Any:
+        """Get the data of the first value of an attribute (optionally for a locale/scope)."""
+        return first_value(self._data.get('values') or {}, code, default, locale, scope)
+    
+    def flat(self, keys: List[str], default: Any = None) -> Dict[str, Any]:
+        """
+        Get the first value of several attributes in one pass over the raw values.
+        
+        Args:
+            keys: Attribute codes to extract
+            default: Value used for attributes without data
+            
+        Returns:
+            Dictionary of attribute code to value data
+        """
+        values = self._data.get('values') or {}
+        return {key: first_value(values, key, default) for key in keys}
     
     # Synchronous methods
     
     def search(self, **filter) -> List["ProductModel"]:
         """Search for product models."""
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
         url = f"/api/rest/v1/{self.endpoint}"
-        response = self._client._make_request_sync("GET", url)
+        response = self._request_sync("GET", url)
         
-        return [self._create_instance(item) for item in response.get('_embedded', {}).get('items', [])]
+        return list(map(self._create_instance, response.get('_embedded', {}).get('items', [])))
     
-    def search_with_builder(self, builder: Union[SearchBuilder, Callable[[FilterBuilder], None]],
+    def search_with_builder(self, builder: Union[SearchBuilder, CompiledSearch, Callable[[FilterBuilder], None]],
                            paginated: bool = False) -> Union[List["ProductModel"], "PaginatedResponse[ProductModel]"]:
         """
         Search for product models using SearchBuilder or FilterBuilder.
         
         Args:
-            builder: SearchBuilder instance or function that configures a FilterBuilder
+            builder: SearchBuilder, bound CompiledSearch, or function that configures a FilterBuilder
             paginated: Whether to return paginated response
             
         Returns:
@@ -58,7 +79,7 @@ class ProductModel(AkeneoResource):
                 lambda f: f.categories(["winter_collection"])
             )
         """
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
         # Handle different builder types
@@ -75,27 +96,55 @@ class ProductModel(AkeneoResource):
         
         url = "/api/rest/v1/product-models"
         prepared_params = self._prepare_request_params(search_params)
-        response = self._client._make_request_sync("GET", url, params=prepared_params)
+        response = self._request_sync("GET", url, params=prepared_params)
         
         items = self._extract_items(response)
-        instances = [self._create_instance(item) for item in items]
+        instances = list(map(self._create_instance, items))
         
         if paginated:
-            pagination_data = self._extract_pagination_data(response)
-            links = response.get('_links', {}) if isinstance(response, dict) else {}
-            from .base import PaginatedResponse
-            return PaginatedResponse(
-                items=instances,
-                current_page=pagination_data.get('current_page', 1),
-                has_next=pagination_data.get('has_next', False),
-                has_previous=pagination_data.get('has_previous', False),
-                has_first=pagination_data.get('has_first', False),
-                has_last=pagination_data.get('has_last', False),
-                links=links
-            )
+            return PaginatedResponse.from_response(response, instances)
         
         return instances
     
+    def search_with_builder_stream(self, builder: Union[SearchBuilder, CompiledSearch, Callable[[FilterBuilder], None]],
+                                   page_size: int = 100) -> Generator["ProductModel", None, None]:
+        """
+        Stream every product model matching a search, one page at a time.
+        
+        Pages are fetched with search_after cursors, so only one page of results
+        is held in memory regardless of the size of the result set.
+        
+        Args:
+            builder: SearchBuilder, bound CompiledSearch, or function that configures a FilterBuilder
+            page_size: Number of items requested per page (Akeneo allows up to 100)
+            
+        Yields:
+            ProductModel instances one at a time
+            
+        Examples:
+            count = sum(1 for _ in client.product_models.search_with_builder_stream(
+                lambda f: f.copy_status("10")
+            ))
+        """
+        if self._request_sync is None:
+            raise TypeError("This method requires a synchronous client")
+        
+        # Work on a copy so the caller's builder keeps its own pagination settings
+        if isinstance(builder, (SearchBuilder, CompiledSearch)):
+            search_builder = builder.clone()
+        else:
+            search_builder = SearchBuilder().filters(builder)
+        search_builder.limit(page_size).search_after()
+        
+        while True:
+            page = self.search_with_builder(search_builder, paginated=True)
+            yield from page
+            
+            cursor = page.next_cursor
+            if not cursor:
+                break
+            search_builder.search_after(cursor)
+    
     def find_by_identifier(self, identifiers: List[str]) -> List["ProductModel"]:
         """
         Find product models by identifiers.
@@ -110,33 +159,82 @@ class ProductModel(AkeneoResource):
             lambda f: f.identifier(identifiers)
         )
     
-    def find_in_categories(self, category_codes: List[str], include_children: bool = False) -> List["ProductModel"]:
+    def count(self, builder: Union[SearchBuilder, CompiledSearch, Callable[[FilterBuilder], None]]) -> int:
+        """
+        Count the product models matching a search without downloading them.
+        
+        Issues a single one-item request with with_count=true (see
+        SearchBuilder.count_only()). Searches only pay for the server-side count
+        when it is requested like this; search_with_builder never asks for it.
+        
+        Args:
+            builder: SearchBuilder, bound CompiledSearch, or function that configures a FilterBuilder
+            
+        Returns:
+            Total number of matching product models
+        """
+        if isinstance(builder, (SearchBuilder, CompiledSearch)):
+            search_builder = builder.clone()
+        else:
+            search_builder = SearchBuilder().filters(builder)
+        
+        page = self.search_with_builder(search_builder.count_only(), paginated=True)
+        return page.items_count or 0
+    
+    def get_by_supplier_style(self, style: str, attributes: Optional[List[str]] = None) -> Optional["ProductModel"]:
+        """
+        Get the product model for a supplier style.
+        
+        Supplier style is an attribute rather than the model code, so there is no
+        single-record endpoint for it; this issues a one-item search instead of
+        fetching a full page of results.
+        
+        Args:
+            style: Supplier style value
+            attributes: Only return these attribute values (all when omitted)
+            
+        Returns:
+            The matching product model, or None if there is none
+        """
+        builder = SearchBuilder().filters(lambda f: f.supplier_style(style)).limit(1)
+        if attributes:
+            builder.attributes(attributes)
+        
+        models = self.search_with_builder(builder)
+        return models[0] if models else None
+    
+    def find_in_categories(self, category_codes: List[str], include_children: bool = False,
+                           count_only: bool = False) -> Union[List["ProductModel"], int]:
         """
         Find product models in specific categories.
         
         Args:
             category_codes: List of category codes
             include_children: Whether to include child categories
+            count_only: Return the number of matches instead, using a single one-item request
             
         Returns:
-            List of product models in the categories
+            List of product models in the categories, or their count when count_only is True
         """
         operator = "IN CHILDREN" if include_children else "IN"
-        return self.search_with_builder(
+        search = self.count if count_only else self.search_with_builder
+        return search(
             lambda f: f.categories(category_codes, operator)
         )
     
-    def find_by_family(self, family_codes: List[str]) -> List["ProductModel"]:
+    def find_by_family(self, family_codes: List[str], count_only: bool = False) -> Union[List["ProductModel"], int]:
         """
         Find product models by family codes.
         
         Args:
             family_codes: List of family codes
+            count_only: Return the number of matches instead, using a single one-item request
             
         Returns:
-            List of product models in the families
+            List of product models in the families, or their count when count_only is True
         """
-        return self.search_with_builder(
+        search = self.count if count_only else self.search_with_builder
+        return search(
             lambda f: f.family(family_codes)
         )
     
@@ -254,35 +352,35 @@ class ProductModel(AkeneoResource):
     
     def get_by_code(self, code: str) -> "ProductModel":
         """Get a product model by its code."""
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
         code = validate_identifier(code, "code")
         url = f"/api/rest/v1/product-models/{code}"
-        response = self._client._make_request_sync("GET", url)
+        response = self._request_sync("GET", url)
         
         return self._create_instance(response)
     
     def create_product_model(self, data: Union[Dict[str, Any], ProductModelCreateWrite]) -> "ProductModel":
         """Create a new product model."""
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
             
         url = "/api/rest/v1/product-models"
         prepared_data = self._prepare_request_data(data)
-        response = self._client._make_request_sync("POST", url, json_data=prepared_data)
+        response = self._request_sync("POST", url, json_data=prepared_data)
         
         return self._create_instance(response)
     
     def update_by_code(self, code: str, data: Union[Dict[str, Any], ProductModelWrite]) -> "ProductModel":
         """Update a product model by code."""
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
             
         code = validate_identifier(code, "code")
         url = f"/api/rest/v1/product-models/{code}"
         prepared_data = self._prepare_request_data(data)
-        response = self._client._make_request_sync("PATCH", url, json_data=prepared_data)
+        response = self._request_sync("PATCH", url, json_data=prepared_data)
         
         # Akeneo PATCH often returns empty response, so fetch the updated product model
         if response:
@@ -292,12 +390,12 @@ class ProductModel(AkeneoResource):
     
     def delete_by_code(self, code: str) -> None:
         """Delete a product model by code."""
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
             
         code = validate_identifier(code, "code")
         url = f"/api/rest/v1/product-models/{code}"
-        self._client._make_request_sync("DELETE", url)
+        self._request_sync("DELETE", url)
     
     def bulk_update(self, product_models: List[Union[Dict[str, Any], ProductModelWrite]]) -> List[Dict[str, Any]]:
         """
@@ -309,33 +407,29 @@ class ProductModel(AkeneoResource):
         Returns:
             List of status responses for each product model update
         """
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
-        # Prepare the NDJSON payload
-        lines = []
-        for product_model_data in product_models:
-            if hasattr(product_model_data, 'model_dump'):
-                prepared_data = product_model_data.model_dump(by_alias=True, exclude_none=True)
-            else:
-                prepared_data = product_model_data
-            lines.append(json.dumps(prepared_data))
-        
-        ndjson_payload = '\n'.join(lines)
-        
         url = "/api/rest/v1/product-models"
         
-        response = self._client._make_request_sync("PATCH", url, form_data=ndjson_payload)
-        
-        # Parse NDJSON response
-        if isinstance(response, str):
-            results = []
-            for line in response.strip().split('\n'):
-                if line.strip():
-                    results.append(json.loads(line))
-            return results
-        
-        return response if isinstance(response, list) else [response]
+        return self._bulk_update_sync(url, product_models)
+    
+    @staticmethod
+    def _enrichment_status_data(status_type: str, status_value: int) -> Dict[str, Any]:
+        """Build the update body setting one enrichment status attribute."""
+        # This would typically update a specific attribute value
+        # The exact implementation depends on how Myer structures their enrichment status
+        return {
+            "values": {
+                f"{status_type}_status": [
+                    {
+                        "data": status_value,
+                        "locale": None,
+                        "scope": None
+                    }
+                ]
+            }
+        }
     
     def update_enrichment_status(self, code: str, status_type: str, status_value: int) -> None:
         """
@@ -344,47 +438,56 @@ class ProductModel(AkeneoResource):
         This is specific to Myer's implementation where enrichment status
         is tracked (e.g., image status 10, copy status 10, etc.)
         
+        Sends one request per call; use bulk_update_enrichment_status() to update
+        many product models.
+        
         Args:
             code: Product model code
             status_type: Type of status (e.g., 'image', 'copy')
             status_value: Status value (e.g., 10, 20, 30)
         """
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
         code = validate_identifier(code, "code")
         
-        # This would typically update a specific attribute value
-        # The exact implementation depends on how Myer structures their enrichment status
-        status_data = {
-            "values": {
-                f"{status_type}_status": [
-                    {
-                        "data": status_value,
-                        "locale": None,
-                        "scope": None
-                    }
-                ]
-            }
-        }
+        status_data = self._enrichment_status_data(status_type, status_value)
         
         self.update_by_code(code, status_data)
     
+    def bulk_update_enrichment_status(self, updates: Iterable[Tuple[str, str, int]]) -> List[Dict[str, Any]]:
+        """
+        Update the enrichment status of many product models with bulk requests.
+        
+        Args:
+            updates: (code, status_type, status_value) tuples, e.g. ("STYLE123", "copy", 10)
+            
+        Returns:
+            List of status responses, one per product model
+        """
+        if self._request_sync is None:
+            raise TypeError("This method requires a synchronous client")
+        
+        return self.bulk_update([
+            {"code": validate_identifier(code, "code"), **self._enrichment_status_data(status_type, status_value)}
+            for code, status_type, status_value in updates
+        ])
+    
     # Asynchronous search methods
     
-    async def search_with_builder_async(self, builder: Union[SearchBuilder, Callable[[FilterBuilder], None]],
+    async def search_with_builder_async(self, builder: Union[SearchBuilder, CompiledSearch, Callable[[FilterBuilder], None]],
                                        paginated: bool = False) -> Union[List["ProductModel"], "PaginatedResponse[ProductModel]"]:
         """
         Search for product models using SearchBuilder or FilterBuilder asynchronously.
         
         Args:
-            builder: SearchBuilder instance or function that configures a FilterBuilder
+            builder: SearchBuilder, bound CompiledSearch, or function that configures a FilterBuilder
             paginated: Whether to return paginated response
             
         Returns:
             List of product models or PaginatedResponse
         """
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
         
         # Handle different builder types
@@ -401,41 +504,84 @@ class ProductModel(AkeneoResource):
         
         url = "/api/rest/v1/product-models"
         prepared_params = self._prepare_request_params(search_params)
-        response = await self._client._make_request_async("GET", url, params=prepared_params)
+        response = await self._request_async("GET", url, params=prepared_params)
         
         items = self._extract_items(response)
-        instances = [self._create_instance(item) for item in items]
+        instances = list(map(self._create_instance, items))
         
         if paginated:
-            pagination_data = self._extract_pagination_data(response)
-            links = response.get('_links', {}) if isinstance(response, dict) else {}
-            from .base import PaginatedResponse
-            return PaginatedResponse(
-                items=instances,
-                current_page=pagination_data.get('current_page', 1),
-                has_next=pagination_data.get('has_next', False),
-                has_previous=pagination_data.get('has_previous', False),
-                has_first=pagination_data.get('has_first', False),
-                has_last=pagination_data.get('has_last', False),
-                links=links
-            )
+            return PaginatedResponse.from_response(response, instances)
         
         return instances
     
+    async def search_with_builder_stream_async(self, builder: Union[SearchBuilder, CompiledSearch, Callable[[FilterBuilder], None]],
+                                               page_size: int = 100) -> AsyncGenerator["ProductModel", None]:
+        """
+        Stream every product model matching a search asynchronously, one page at a time.
+        
+        Args:
+            builder: SearchBuilder, bound CompiledSearch, or function that configures a FilterBuilder
+            page_size: Number of items requested per page (Akeneo allows up to 100)
+            
+        Yields:
+            ProductModel instances one at a time
+        """
+        if self._request_async is None:
+            raise TypeError("This method requires an asynchronous client")
+        
+        # Work on a copy so the caller's builder keeps its own pagination settings
+        if isinstance(builder, (SearchBuilder, CompiledSearch)):
+            search_builder = builder.clone()
+        else:
+            search_builder = SearchBuilder().filters(builder)
+        search_builder.limit(page_size).search_after()
+        
+        while True:
+            page = await self.search_with_builder_async(search_builder, paginated=True)
+            for item in page:
+                yield item
+            
+            cursor = page.next_cursor
+            if not cursor:
+                break
+            search_builder.search_after(cursor)
+    
     # Async versions of convenience methods
     
     async def find_by_identifier_async(self, identifiers: List[str]) -> List["ProductModel"]:
         """Find product models by identifiers asynchronously."""
         return await self.search_with_builder_async(lambda f: f.identifier(identifiers))
     
-    async def find_in_categories_async(self, category_codes: List[str], include_children: bool = False) -> List["ProductModel"]:
-        """Find product models in categories asynchronously."""
+    async def count_async(self, builder: Union[SearchBuilder, CompiledSearch, Callable[[FilterBuilder], None]]) -> int:
+        """Count the product models matching a search without downloading them, asynchronously."""
+        if isinstance(builder, (SearchBuilder, CompiledSearch)):
+            search_builder = builder.clone()
+        else:
+            search_builder = SearchBuilder().filters(builder)
+        
+        page = await self.search_with_builder_async(search_builder.count_only(), paginated=True)
+        return page.items_count or 0
+    
+    async def get_by_supplier_style_async(self, style: str, attributes: Optional[List[str]] = None) -> Optional["ProductModel"]:
+        """Get the product model for a supplier style asynchronously."""
+        builder = SearchBuilder().filters(lambda f: f.supplier_style(style)).limit(1)
+        if attributes:
+            builder.attributes(attributes)
+        
+        models = await self.search_with_builder_async(builder)
+        return models[0] if models else None
+    
+    async def find_in_categories_async(self, category_codes: List[str], include_children: bool = False,
+                                       count_only: bool = False) -> Union[List["ProductModel"], int]:
+        """Find product models in categories asynchronously (or just count them with count_only=True)."""
         operator = "IN CHILDREN" if include_children else "IN"
-        return await self.search_with_builder_async(lambda f: f.categories(category_codes, operator))
+        search = self.count_async if count_only else self.search_with_builder_async
+        return await search(lambda f: f.categories(category_codes, operator))
     
-    async def find_by_family_async(self, family_codes: List[str]) -> List["ProductModel"]:
-        """Find product models by family asynchronously."""
-        return await self.search_with_builder_async(lambda f: f.family(family_codes))
+    async def find_by_family_async(self, family_codes: List[str], count_only: bool = False) -> Union[List["ProductModel"], int]:
+        """Find product models by family asynchronously (or just count them with count_only=True)."""
+        search = self.count_async if count_only else self.search_with_builder_async
+        return await search(lambda f: f.family(family_codes))
     
     async def find_complete_async(self, scope: str, locale: Optional[str] = None,
                                  locales: Optional[List[str]] = None) -> List["ProductModel"]:
@@ -483,35 +629,35 @@ class ProductModel(AkeneoResource):
     
     async def get_by_code_async(self, code: str) -> "ProductModel":
         """Get a product model by its code asynchronously."""
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
         
         code = validate_identifier(code, "code")
         url = f"/api/rest/v1/product-models/{code}"
-        response = await self._client._make_request_async("GET", url)
+        response = await self._request_async("GET", url)
         
         return self._create_instance(response)
     
     async def create_product_model_async(self, data: Union[Dict[str, Any], ProductModelCreateWrite]) -> "ProductModel":
         """Create a new product model asynchronously."""
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
             
         url = "/api/rest/v1/product-models"
         prepared_data = self._prepare_request_data(data)
-        response = await self._client._make_request_async("POST", url, json_data=prepared_data)
+        response = await self._request_async("POST", url, json_data=prepared_data)
         
         return self._create_instance(response)
     
     async def update_by_code_async(self, code: str, data: Union[Dict[str, Any], ProductModelWrite]) -> "ProductModel":
         """Update a product model by code asynchronously."""
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
             
         code = validate_identifier(code, "code")
         url = f"/api/rest/v1/product-models/{code}"
         prepared_data = self._prepare_request_data(data)
-        response = await self._client._make_request_async("PATCH", url, json_data=prepared_data)
+        response = await self._request_async("PATCH", url, json_data=prepared_data)
         
         # Akeneo PATCH often returns empty response, so fetch the updated product model
         if response:
@@ -521,50 +667,39 @@ class ProductModel(AkeneoResource):
     
     async def delete_by_code_async(self, code: str) -> None:
         """Delete a product model by code asynchronously."""
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
             
         code = validate_identifier(code, "code")
         url = f"/api/rest/v1/product-models/{code}"
-        await self._client._make_request_async("DELETE", url)
+        await self._request_async("DELETE", url)
     
-    async def bulk_update_async(self, product_models: List[Union[Dict[str, Any], ProductModelWrite]]) -> List[Dict[str, Any]]:
+    async def bulk_update_async(
+        self,
+        product_models: List[Union[Dict[str, Any], ProductModelWrite]],
+        chunk_size: int = BULK_MAX_ITEMS,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> List[Dict[str, Any]]:
         """
         Update multiple product models at once asynchronously.
         
+        Akeneo accepts at most 100 product models per request, so larger updates are
+        split into chunks that are sent concurrently. The results keep the order of the input.
+        
         Args:
             product_models: List of product model data to update
+            chunk_size: Maximum number of product models per request
+            max_concurrency: Maximum number of requests in flight at the same time
             
         Returns:
             List of status responses for each product model update
         """
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
         
-        # Prepare the NDJSON payload
-        lines = []
-        for product_model_data in product_models:
-            if hasattr(product_model_data, 'model_dump'):
-                prepared_data = product_model_data.model_dump(by_alias=True, exclude_none=True)
-            else:
-                prepared_data = product_model_data
-            lines.append(json.dumps(prepared_data))
-        
-        ndjson_payload = '\n'.join(lines)
-        
         url = "/api/rest/v1/product-models"
         
-        response = await self._client._make_request_async("PATCH", url, form_data=ndjson_payload)
-        
-        # Parse NDJSON response
-        if isinstance(response, str):
-            results = []
-            for line in response.strip().split('\n'):
-                if line.strip():
-                    results.append(json.loads(line))
-            return results
-        
-        return response if isinstance(response, list) else [response]
+        return await self._bulk_update_async(url, product_models, chunk_size, max_concurrency)
     
     async def update_enrichment_status_async(self, code: str, status_type: str, status_value: int) -> None:
         """
@@ -573,28 +708,37 @@ class ProductModel(AkeneoResource):
         This is specific to Myer's implementation where enrichment status
         is tracked (e.g., image status 10, copy status 10, etc.)
         
+        Sends one request per call; use bulk_update_enrichment_status_async() to
+        update many product models.
+        
         Args:
             code: Product model code
             status_type: Type of status (e.g., 'image', 'copy')
             status_value: Status value (e.g., 10, 20, 30)
         """
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
         
         code = validate_identifier(code, "code")
         
-        # This would typically update a specific attribute value
-        # The exact implementation depends on how Myer structures their enrichment status
-        status_data = {
-            "values": {
-                f"{status_type}_status": [
-                    {
-                        "data": status_value,
-                        "locale": None,
-                        "scope": None
-                    }
-                ]
-            }
-        }
+        status_data = self._enrichment_status_data(status_type, status_value)
         
         await self.update_by_code_async(code, status_data)
+    
+    async def bulk_update_enrichment_status_async(self, updates: Iterable[Tuple[str, str, int]]) -> List[Dict[str, Any]]:
+        """
+        Update the enrichment status of many product models with bulk requests asynchronously.
+        
+        Args:
+            updates: (code, status_type, status_value) tuples, e.g. ("STYLE123", "copy", 10)
+            
+        Returns:
+            List of status responses, one per product model
+        """
+        if self._request_async is None:
+            raise TypeError("This method requires an asynchronous client")
+        
+        return await self.bulk_update_async([
+            {"code": validate_identifier(code, "code"), **self._enrichment_status_data(status_type, status_value)}
+            for code, status_type, status_value in updates
+        ])
@@ -11,6 +11,8 @@ if TYPE_CHECKING:
 class System(AkeneoResource):
     """System resource for Akeneo API."""
     
+    __slots__ = ()
+    
     def get_endpoints(self) -> Dict[str, Any]:
         """
         Get list of all available endpoints.
@@ -20,14 +22,14 @@ class System(AkeneoResource):
         Returns:
             Dictionary containing all available endpoints
         """
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
         url = "/api/rest/v1"
         
         # For this endpoint, we don't need authentication
         # but we'll use the client's request method anyway
-        response = self._client._make_request_sync("GET", url)
+        response = self._request_sync("GET", url)
         return response
     
     def get_system_information(self) -> Dict[str, Any]:
@@ -39,11 +41,11 @@ class System(AkeneoResource):
             - version: Version of the PIM
             - edition: Edition of the PIM (CE, EE, Serenity, etc.)
         """
-        if not hasattr(self._client, '_make_request_sync'):
+        if self._request_sync is None:
             raise TypeError("This method requires a synchronous client")
         
         url = "/api/rest/v1/system-information"
-        response = self._client._make_request_sync("GET", url)
+        response = self._request_sync("GET", url)
         return response
     
     def check_health(self) -> bool:
@@ -88,11 +90,11 @@ class System(AkeneoResource):
         Returns:
             Dictionary containing all available endpoints
         """
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
         
         url = "/api/rest/v1"
-        response = await self._client._make_request_async("GET", url)
+        response = await self._request_async("GET", url)
         return response
     
     async def get_system_information_async(self) -> Dict[str, Any]:
@@ -102,11 +104,11 @@ class System(AkeneoResource):
         Returns:
             Dictionary containing system information
         """
-        if not hasattr(self._client, '_make_request_async'):
+        if self._request_async is None:
             raise TypeError("This method requires an asynchronous client")
         
         url = "/api/rest/v1/system-information"
-        response = await self._client._make_request_async("GET", url)
+        response = await self._request_async("GET", url)
         return response
     
     async def check_health_async(self) -> bool:
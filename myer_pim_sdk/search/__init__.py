@@ -1,6 +1,20 @@
 # search/__init__.py
 
-from .builder import SearchBuilder, FilterBuilder
+from .builder import (
+    SearchBuilder,
+    FilterBuilder,
+    CompiledSearch,
+    Param,
+    by_supplier_style,
+    by_brand,
+    ready_for_enrichment,
+    enrichment_complete,
+    missing_images,
+    by_supplier,
+    concession_products,
+    online_products,
+    clearance_products
+)
 from .operators import (
     ComparisonOperator,
     ListOperator,
@@ -18,6 +32,8 @@ from .filters import (
 __all__ = [
     "SearchBuilder",
     "FilterBuilder", 
+    "CompiledSearch",
+    "Param",
     "ComparisonOperator",
     "ListOperator",
     "DateOperator",
@@ -26,5 +42,15 @@ __all__ = [
     "BooleanOperator",
     "ProductPropertyFilter",
     "ProductModelPropertyFilter",
-    "AttributeFilter"
+    "AttributeFilter",
+    # Magic search functions
+    "by_supplier_style",
+    "by_brand",
+    "ready_for_enrichment",
+    "enrichment_complete",
+    "missing_images",
+    "by_supplier",
+    "concession_products",
+    "online_products",
+    "clearance_products"
 ]
@@ -1,96 +1,176 @@
 # search/builder.py
 
 import json
-from typing import Any, Dict, List, Optional, Union
+from functools import lru_cache, wraps
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Union
+
+from .. import serialization
 from .filters import BaseFilter, ProductPropertyFilter, ProductModelPropertyFilter, AttributeFilter
+from .operators import (
+    BooleanOperator,
+    CategoryOperator,
+    ComparisonOperator,
+    CompletenessOperator,
+    DateOperator,
+    ListOperator,
+    ParentOperator,
+    QualityScoreOperator,
+    TextOperator,
+)
+
+# Filter keys that are product/product model properties rather than attribute codes
+_PROPERTY_FILTERS = frozenset({
+    "uuid", "identifier", "categories", "enabled", "completeness", "family", "groups",
+    "created", "updated", "parent", "quality_score"
+})
+
+# Operators whose list values are sets, so their order doesn't change the result
+_UNORDERED_OPERATORS = frozenset({
+    "IN", "NOT IN", "IN OR UNCLASSIFIED", "IN CHILDREN", "NOT IN CHILDREN"
+})
+
+# Operator string -> enum member for every operator enum FilterBuilder accepts
+_OPERATOR_LOOKUPS = {
+    operator_class: {member.value: member for member in operator_class}
+    for operator_class in (
+        BooleanOperator, CategoryOperator, ComparisonOperator, CompletenessOperator,
+        DateOperator, ListOperator, ParentOperator, QualityScoreOperator, TextOperator,
+    )
+}
+
+
+def _operator(operator_class: type, operator: Any) -> Any:
+    """Coerce an operator string to ``operator_class`` with a dict lookup."""
+    member = _OPERATOR_LOOKUPS[operator_class].get(operator)
+    # Fall back to the enum itself for members passed directly and for invalid values
+    return member if member is not None else operator_class(operator)
+
+
+def _text_value(value: Any) -> Any:
+    """Coerce a text filter value to str, leaving Param placeholders for compile() untouched."""
+    return value if isinstance(value, Param) else str(value)
+
+
+def _dedupe_conditions(conditions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Drop exact duplicate conditions, keeping the first occurrence of each.
+    
+    Conditions on a property are ANDed, so a repeated one never changes the result.
+    Returns the list unchanged when it has no duplicates or can't be compared.
+    """
+    if len(conditions) < 2:
+        return conditions
+    
+    seen = set()
+    unique = []
+    try:
+        for condition in conditions:
+            key = json.dumps(condition, sort_keys=True, default=str)
+            if key not in seen:
+                seen.add(key)
+                unique.append(condition)
+    except (TypeError, ValueError):
+        return conditions
+    
+    return unique if len(unique) < len(conditions) else conditions
+
+
+def _dedupe_criteria(criteria: Dict[str, List[Dict[str, Any]]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Apply _dedupe_conditions to every property, copying the dict only if something changed."""
+    deduped = None
+    for property_name, conditions in criteria.items():
+        unique = _dedupe_conditions(conditions)
+        if unique is not conditions:
+            if deduped is None:
+                deduped = dict(criteria)
+            deduped[property_name] = unique
+    return criteria if deduped is None else deduped
 
 
 class FilterBuilder:
     """Helper class for building filters with a fluent interface."""
     
+    __slots__ = ("_criteria",)
+    
     def __init__(self):
-        self._filters: List[BaseFilter] = []
+        # Conditions per property, merged as filters are added
+        self._criteria: Dict[str, List[Dict[str, Any]]] = {}
+    
+    def _add(self, filter_obj: BaseFilter) -> "FilterBuilder":
+        """Merge a filter's conditions into the criteria."""
+        criteria = self._criteria
+        for property_name, conditions in filter_obj.to_dict().items():
+            criteria.setdefault(property_name, []).extend(conditions)
+        return self
     
     # Product property filters
     def uuid(self, uuids: List[str], operator: str = "IN") -> "FilterBuilder":
         """Filter by product UUIDs."""
-        from .operators import ListOperator
-        self._filters.append(ProductPropertyFilter.uuid(uuids, ListOperator(operator)))
+        self._add(ProductPropertyFilter.uuid(uuids, _operator(ListOperator, operator)))
         return self
     
     def categories(self, category_codes: List[str], operator: str = "IN") -> "FilterBuilder":
         """Filter by categories."""
-        from .operators import CategoryOperator
-        self._filters.append(ProductPropertyFilter.categories(category_codes, CategoryOperator(operator)))
+        self._add(ProductPropertyFilter.categories(category_codes, _operator(CategoryOperator, operator)))
         return self
     
     def enabled(self, is_enabled: bool, operator: str = "=") -> "FilterBuilder":
         """Filter by enabled status."""
-        from .operators import BooleanOperator
-        self._filters.append(ProductPropertyFilter.enabled(is_enabled, BooleanOperator(operator)))
+        self._add(ProductPropertyFilter.enabled(is_enabled, _operator(BooleanOperator, operator)))
         return self
     
     def completeness(self, value: int, scope: str, operator: str = "=", 
                     locales: Optional[List[str]] = None) -> "FilterBuilder":
         """Filter by completeness."""
-        from .operators import CompletenessOperator
-        self._filters.append(ProductPropertyFilter.completeness(
-            value, scope, CompletenessOperator(operator), locales
+        self._add(ProductPropertyFilter.completeness(
+            value, scope, _operator(CompletenessOperator, operator), locales
         ))
         return self
     
     def family(self, family_codes: List[str], operator: str = "IN") -> "FilterBuilder":
         """Filter by family."""
-        from .operators import ListOperator
-        self._filters.append(ProductPropertyFilter.family(family_codes, ListOperator(operator)))
+        self._add(ProductPropertyFilter.family(family_codes, _operator(ListOperator, operator)))
         return self
     
     def groups(self, group_codes: List[str], operator: str = "IN") -> "FilterBuilder":
         """Filter by groups."""
-        from .operators import ListOperator
-        self._filters.append(ProductPropertyFilter.groups(group_codes, ListOperator(operator)))
+        self._add(ProductPropertyFilter.groups(group_codes, _operator(ListOperator, operator)))
         return self
     
     def created(self, date_value: Union[str, List[str]], operator: str = "=") -> "FilterBuilder":
         """Filter by creation date."""
-        from .operators import DateOperator
-        self._filters.append(ProductPropertyFilter.created(date_value, DateOperator(operator)))
+        self._add(ProductPropertyFilter.created(date_value, _operator(DateOperator, operator)))
         return self
     
     def updated(self, date_value: Union[str, List[str]], operator: str = "=") -> "FilterBuilder":
         """Filter by update date."""
-        from .operators import DateOperator
-        self._filters.append(ProductPropertyFilter.updated(date_value, DateOperator(operator)))
+        self._add(ProductPropertyFilter.updated(date_value, _operator(DateOperator, operator)))
         return self
     
     def parent(self, parent_codes: Union[str, List[str]], operator: str = "=") -> "FilterBuilder":
         """Filter by parent product model."""
-        from .operators import ParentOperator
-        self._filters.append(ProductPropertyFilter.parent(parent_codes, ParentOperator(operator)))
+        self._add(ProductPropertyFilter.parent(parent_codes, _operator(ParentOperator, operator)))
         return self
     
     def quality_score(self, scores: List[str], scope: str, locale: str, 
                      operator: str = "IN") -> "FilterBuilder":
         """Filter by quality score."""
-        from .operators import QualityScoreOperator
-        self._filters.append(ProductPropertyFilter.quality_score(
-            scores, scope, locale, QualityScoreOperator(operator)
+        self._add(ProductPropertyFilter.quality_score(
+            scores, scope, locale, _operator(QualityScoreOperator, operator)
         ))
         return self
     
     # Product model specific filters
     def identifier(self, identifiers: List[str], operator: str = "IN") -> "FilterBuilder":
         """Filter by product model identifiers."""
-        from .operators import ListOperator
-        self._filters.append(ProductModelPropertyFilter.identifier(identifiers, ListOperator(operator)))
+        self._add(ProductModelPropertyFilter.identifier(identifiers, _operator(ListOperator, operator)))
         return self
     
     def model_completeness(self, scope: str, operator: str, locale: Optional[str] = None,
                           locales: Optional[List[str]] = None) -> "FilterBuilder":
         """Filter by product model completeness."""
-        from .operators import CompletenessOperator
-        self._filters.append(ProductModelPropertyFilter.completeness(
-            scope, CompletenessOperator(operator), locale, locales
+        self._add(ProductModelPropertyFilter.completeness(
+            scope, _operator(CompletenessOperator, operator), locale, locales
         ))
         return self
     
@@ -99,9 +179,8 @@ class FilterBuilder:
                       operator: str = "=", locale: Optional[str] = None, 
                       scope: Optional[str] = None) -> "FilterBuilder":
         """Filter by text attribute."""
-        from .operators import TextOperator
-        self._filters.append(AttributeFilter.text(
-            attribute_code, value, TextOperator(operator), locale, scope
+        self._add(AttributeFilter.text(
+            attribute_code, value, _operator(TextOperator, operator), locale, scope
         ))
         return self
     
@@ -109,9 +188,8 @@ class FilterBuilder:
                         operator: str = "=", locale: Optional[str] = None,
                         scope: Optional[str] = None) -> "FilterBuilder":
         """Filter by numeric attribute."""
-        from .operators import ComparisonOperator
-        self._filters.append(AttributeFilter.number(
-            attribute_code, value, ComparisonOperator(operator), locale, scope
+        self._add(AttributeFilter.number(
+            attribute_code, value, _operator(ComparisonOperator, operator), locale, scope
         ))
         return self
     
@@ -119,9 +197,8 @@ class FilterBuilder:
                         operator: str = "IN", locale: Optional[str] = None,
                         scope: Optional[str] = None) -> "FilterBuilder":
         """Filter by select attribute."""
-        from .operators import ListOperator
-        self._filters.append(AttributeFilter.select(
-            attribute_code, option_codes, ListOperator(operator), locale, scope
+        self._add(AttributeFilter.select(
+            attribute_code, option_codes, _operator(ListOperator, operator), locale, scope
         ))
         return self
     
@@ -129,9 +206,8 @@ class FilterBuilder:
                          operator: str = "=", locale: Optional[str] = None,
                          scope: Optional[str] = None) -> "FilterBuilder":
         """Filter by boolean attribute."""
-        from .operators import BooleanOperator
-        self._filters.append(AttributeFilter.boolean(
-            attribute_code, value, BooleanOperator(operator), locale, scope
+        self._add(AttributeFilter.boolean(
+            attribute_code, value, _operator(BooleanOperator, operator), locale, scope
         ))
         return self
     
@@ -139,25 +215,23 @@ class FilterBuilder:
                       operator: str = "=", locale: Optional[str] = None,
                       scope: Optional[str] = None) -> "FilterBuilder":
         """Filter by date attribute."""
-        from .operators import DateOperator
-        self._filters.append(AttributeFilter.date(
-            attribute_code, value, DateOperator(operator), locale, scope
+        self._add(AttributeFilter.date(
+            attribute_code, value, _operator(DateOperator, operator), locale, scope
         ))
         return self
     
     def attribute_empty(self, attribute_code: str, is_empty: bool = True,
                        locale: Optional[str] = None, scope: Optional[str] = None) -> "FilterBuilder":
         """Filter by empty/not empty attribute."""
-        self._filters.append(AttributeFilter.empty(attribute_code, is_empty, locale, scope))
+        self._add(AttributeFilter.empty(attribute_code, is_empty, locale, scope))
         return self
     
     def attribute_file(self, attribute_code: str, filename: str,
                       operator: str = "=", locale: Optional[str] = None,
                       scope: Optional[str] = None) -> "FilterBuilder":
         """Filter by file/image attribute."""
-        from .operators import TextOperator
-        self._filters.append(AttributeFilter.file(
-            attribute_code, filename, TextOperator(operator), locale, scope
+        self._add(AttributeFilter.file(
+            attribute_code, filename, _operator(TextOperator, operator), locale, scope
         ))
         return self
     
@@ -172,7 +246,7 @@ class FilterBuilder:
         elif isinstance(value, list):
             return self.attribute_select(attribute_code, value, operator, locale, scope)
         else:
-            return self.attribute_text(attribute_code, str(value), operator, locale, scope)
+            return self.attribute_text(attribute_code, _text_value(value), operator, locale, scope)
     
     # Myer-specific convenience methods for common product values
     def supplier_style(self, value: Union[str, List[str]], operator: str = "=", 
@@ -196,19 +270,19 @@ class FilterBuilder:
     
     def copy_status(self, value: Union[int, str], operator: str = "=") -> "FilterBuilder":
         """Filter by copy enrichment status."""
-        return self.attribute_text("copy_status", str(value), operator)
+        return self.attribute_text("copy_status", _text_value(value), operator)
     
     def image_status(self, value: Union[int, str], operator: str = "=") -> "FilterBuilder":
         """Filter by image enrichment status."""
-        return self.attribute_text("image_status", str(value), operator)
+        return self.attribute_text("image_status", _text_value(value), operator)
     
     def myer_copy_status(self, value: Union[int, str], operator: str = "=") -> "FilterBuilder":
         """Filter by Myer copy status."""
-        return self.attribute_text("myer_copy_status", str(value), operator)
+        return self.attribute_text("myer_copy_status", _text_value(value), operator)
     
     def myer_image_status(self, value: Union[int, str], operator: str = "=") -> "FilterBuilder":
         """Filter by Myer image status."""
-        return self.attribute_text("myer_image_status", str(value), operator)
+        return self.attribute_text("myer_image_status", _text_value(value), operator)
     
     def supplier_trust_level(self, value: Union[str, List[str]], operator: str = "IN") -> "FilterBuilder":
         """Filter by supplier trust level (gold, silver, bronze)."""
@@ -280,33 +354,80 @@ class FilterBuilder:
     
     def build(self) -> Dict[str, Any]:
         """Build the final search criteria dictionary."""
-        search_dict = {}
-        
-        for filter_obj in self._filters:
-            filter_dict = filter_obj.to_dict()
-            
-            # Merge filters for the same property
-            for property_name, conditions in filter_dict.items():
-                if property_name in search_dict:
-                    search_dict[property_name].extend(conditions)
-                else:
-                    search_dict[property_name] = conditions
-        
-        return search_dict
+        # Copy the lists so filters added later don't change a dict already handed out
+        return _dedupe_criteria({
+            property_name: list(conditions)
+            for property_name, conditions in self._criteria.items()
+        })
+
+
+def _cached_prototype(func):
+    """
+    Cache the builder a quick search function (or SearchBuilder factory classmethod)
+    produces for each set of arguments.
+    
+    The cached builder is frozen and every call returns a clone of it, so callers
+    can keep chaining (.limit(), .attributes(), ...) without affecting the cache.
+    List arguments are accepted and cached as tuples.
+    """
+    @lru_cache(maxsize=128)
+    def prototype(*args, **kwargs):
+        args = [list(arg) if isinstance(arg, tuple) else arg for arg in args]
+        kwargs = {key: list(value) if isinstance(value, tuple) else value for key, value in kwargs.items()}
+        return func(*args, **kwargs).freeze()
+    
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        args = [tuple(arg) if isinstance(arg, list) else arg for arg in args]
+        kwargs = {key: tuple(value) if isinstance(value, list) else value for key, value in kwargs.items()}
+        return prototype(*args, **kwargs).clone()
+    
+    wrapper.cache_clear = prototype.cache_clear
+    return wrapper
 
 
 class SearchBuilder:
     """Main search builder for constructing Akeneo API search queries."""
     
+    __slots__ = (
+        "_search_criteria",
+        "_search_locale",
+        "_search_scope",
+        "_pagination_params",
+        "_value_filters",
+        "_frozen",
+    )
+    
     def __init__(self):
         self._search_criteria: Dict[str, Any] = {}
         self._search_locale: Optional[str] = None
         self._search_scope: Optional[str] = None
         self._pagination_params: Dict[str, Any] = {}
         self._value_filters: Dict[str, Any] = {}  # For attributes, locales, scope filtering
+        self._frozen = False
+    
+    @property
+    def frozen(self) -> bool:
+        """Whether this builder has been frozen against further changes."""
+        return self._frozen
+    
+    def freeze(self) -> "SearchBuilder":
+        """
+        Make this builder read-only.
+        
+        Frozen builders can be shared safely (e.g. as cached prototypes); any
+        further modification raises TypeError. Use clone() to get an editable copy.
+        """
+        self._frozen = True
+        return self
+    
+    def _check_mutable(self) -> None:
+        if self._frozen:
+            raise TypeError("This SearchBuilder is frozen; call clone() to get an editable copy")
     
     def filters(self, builder_func) -> "SearchBuilder":
         """Add filters using a builder function."""
+        self._check_mutable()
         filter_builder = FilterBuilder()
         builder_func(filter_builder)
         self._search_criteria.update(filter_builder.build())
@@ -314,13 +435,10 @@ class SearchBuilder:
     
     def add_filter(self, filter_obj: BaseFilter) -> "SearchBuilder":
         """Add a single filter object."""
-        filter_dict = filter_obj.to_dict()
-        
-        for property_name, conditions in filter_dict.items():
-            if property_name in self._search_criteria:
-                self._search_criteria[property_name].extend(conditions)
-            else:
-                self._search_criteria[property_name] = conditions
+        self._check_mutable()
+        search_criteria = self._search_criteria
+        for property_name, conditions in filter_obj.to_dict().items():
+            search_criteria.setdefault(property_name, []).extend(conditions)
         
         return self
     
@@ -328,6 +446,7 @@ class SearchBuilder:
                    locale: Optional[str] = None, scope: Optional[str] = None,
                    locales: Optional[List[str]] = None) -> "SearchBuilder":
         """Add a raw filter condition."""
+        self._check_mutable()
         condition = {"operator": operator}
         
         if value is not None:
@@ -339,57 +458,108 @@ class SearchBuilder:
         if locales is not None:
             condition["locales"] = locales
         
-        if property_name in self._search_criteria:
-            self._search_criteria[property_name].append(condition)
-        else:
-            self._search_criteria[property_name] = [condition]
+        self._search_criteria.setdefault(property_name, []).append(condition)
         
         return self
     
     # Enhanced value filtering methods
     def attributes(self, attribute_codes: List[str]) -> "SearchBuilder":
         """Filter to only return specific attributes in the response."""
+        self._check_mutable()
         self._value_filters["attributes"] = ",".join(attribute_codes)
         return self
     
     def locales(self, locale_codes: List[str]) -> "SearchBuilder":
         """Filter to only return values for specific locales."""
+        self._check_mutable()
         self._value_filters["locales"] = ",".join(locale_codes)
         return self
     
     def scope(self, scope_code: str) -> "SearchBuilder":
         """Filter to only return values for a specific scope/channel."""
+        self._check_mutable()
         self._value_filters["scope"] = scope_code
         return self
     
     def search_locale(self, locale: str) -> "SearchBuilder":
         """Set the default locale for all localizable filters."""
+        self._check_mutable()
         self._search_locale = locale
         return self
     
     def search_scope(self, scope: str) -> "SearchBuilder":
         """Set the default scope for all scopable filters."""
+        self._check_mutable()
         self._search_scope = scope
         return self
     
     def page(self, page: int) -> "SearchBuilder":
         """Set the page number."""
+        self._check_mutable()
         self._pagination_params["page"] = page
         return self
     
     def limit(self, limit: int) -> "SearchBuilder":
         """Set the page size limit."""
+        self._check_mutable()
         self._pagination_params["limit"] = limit
         return self
     
+    def search_after(self, cursor: Optional[str] = None) -> "SearchBuilder":
+        """
+        Use Akeneo's search_after pagination instead of page numbers.
+        
+        Args:
+            cursor: The search_after value from the previous page's next link
+                (see PaginatedResponse.next_cursor). Omit it to fetch the first page.
+        """
+        self._check_mutable()
+        self._pagination_params.pop("page", None)
+        self._pagination_params["pagination_type"] = "search_after"
+        if cursor is not None:
+            self._pagination_params["search_after"] = cursor
+        else:
+            self._pagination_params.pop("search_after", None)
+        return self
+    
     def with_count(self, with_count: bool = True) -> "SearchBuilder":
         """Include count in response."""
+        self._check_mutable()
         self._pagination_params["with_count"] = with_count
         return self
     
+    def count_only(self, attribute: Optional[str] = None) -> "SearchBuilder":
+        """
+        Configure the search to fetch just the total match count.
+        
+        Requests a single item with with_count=true so the total is read from
+        PaginatedResponse.items_count, and projects values to one attribute so
+        the returned item stays small. Page-number pagination is used since
+        Akeneo doesn't return counts with search_after.
+        
+        Args:
+            attribute: Attribute to project values to. Defaults to the first
+                attribute filtered on, if any.
+        """
+        self._check_mutable()
+        self._pagination_params.pop("pagination_type", None)
+        self._pagination_params.pop("search_after", None)
+        self._pagination_params.pop("page", None)
+        self._pagination_params["limit"] = 1
+        self._pagination_params["with_count"] = True
+        
+        if attribute is None:
+            attribute = next(
+                (code for code in self._search_criteria if code not in _PROPERTY_FILTERS), None
+            )
+        if attribute is not None:
+            self._value_filters["attributes"] = attribute
+        return self
+    
     def pagination(self, page: Optional[int] = None, limit: Optional[int] = None,
                   with_count: Optional[bool] = None) -> "SearchBuilder":
         """Set pagination parameters."""
+        self._check_mutable()
         if page is not None:
             self._pagination_params["page"] = page
         if limit is not None:
@@ -404,7 +574,7 @@ class SearchBuilder:
         
         # Add search criteria if any
         if self._search_criteria:
-            params["search"] = json.dumps(self._search_criteria)
+            params["search"] = serialization.dumps(_dedupe_criteria(self._search_criteria))
         
         # Add search locale and scope
         if self._search_locale:
@@ -422,10 +592,97 @@ class SearchBuilder:
     
     def build_search_criteria(self) -> Dict[str, Any]:
         """Build just the search criteria (for POST search endpoints)."""
-        return self._search_criteria.copy()
+        criteria = _dedupe_criteria(self._search_criteria)
+        # _dedupe_criteria already returns a fresh dict whenever it dropped duplicates
+        return dict(criteria) if criteria is self._search_criteria else criteria
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get a normalized, deterministic representation of the whole search.
+
+        Properties are sorted by name and the values of unordered list operators
+        (IN, NOT IN, ...) are sorted, so equivalent searches produce equal dicts
+        regardless of the order they were built in. Used for cache keys.
+        """
+        criteria = _dedupe_criteria(self._search_criteria)
+        search = {}
+        for property_name in sorted(criteria):
+            conditions = []
+            for condition in criteria[property_name]:
+                condition = dict(condition)
+                value = condition.get("value")
+                if condition.get("operator") in _UNORDERED_OPERATORS and isinstance(value, list):
+                    condition["value"] = sorted(value, key=str)
+                conditions.append(condition)
+            search[property_name] = sorted(conditions, key=lambda c: json.dumps(c, sort_keys=True, default=str))
+
+        return {
+            "search": search,
+            "search_locale": self._search_locale,
+            "search_scope": self._search_scope,
+            "value_filters": dict(sorted(self._value_filters.items())),
+            "pagination": dict(sorted(self._pagination_params.items())),
+        }
+    
+    def clone(self) -> "SearchBuilder":
+        """
+        Create an independent copy of this builder.
+        
+        Useful for reusing a shared base query: clone it and add the filters that
+        vary per call instead of rebuilding the common part each time.
+        """
+        clone = self.__class__()
+        clone._search_criteria = {
+            property_name: [dict(condition) for condition in conditions]
+            for property_name, conditions in self._search_criteria.items()
+        }
+        clone._search_locale = self._search_locale
+        clone._search_scope = self._search_scope
+        clone._pagination_params = dict(self._pagination_params)
+        clone._value_filters = dict(self._value_filters)
+        return clone
+    
+    def compile(self) -> "CompiledSearch":
+        """
+        Serialize this search once so it can be reused without rebuilding it.
+        
+        Filter values given as Param("name") placeholders are left open and filled
+        in with CompiledSearch.bind(), which only substitutes them into the
+        pre-serialized criteria.
+        
+        Example:
+            by_supplier = (SearchBuilder()
+                           .filters(lambda f: f.supplier(Param("supplier")).online_ind(True))
+                           .attributes(["supplier", "brand"])
+                           .compile())
+            
+            for supplier in suppliers:
+                client.product_models.search_with_builder(by_supplier.bind(supplier=supplier))
+        """
+        placeholders: Set[str] = set()
+        
+        def encode_param(obj: Any) -> Any:
+            if isinstance(obj, Param):
+                placeholders.add(obj.name)
+                return obj.token
+            raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+        
+        search = None
+        if self._search_criteria:
+            search = serialization.dumps(_dedupe_criteria(self._search_criteria), default=encode_param)
+        
+        return CompiledSearch(
+            search=search,
+            search_locale=self._search_locale,
+            search_scope=self._search_scope,
+            value_filters=self._value_filters,
+            pagination_params=self._pagination_params,
+            placeholders=frozenset(placeholders),
+        )
     
     def clear(self) -> "SearchBuilder":
         """Clear all search criteria and parameters."""
+        self._check_mutable()
         self._search_criteria.clear()
         self._search_locale = None
         self._search_scope = None
@@ -446,6 +703,7 @@ class SearchBuilder:
         return cls()
     
     @classmethod
+    @_cached_prototype
     def enabled_products(cls) -> "SearchBuilder":
         """Create a search builder for enabled products only."""
         builder = cls()
@@ -453,6 +711,7 @@ class SearchBuilder:
         return builder
     
     @classmethod
+    @_cached_prototype
     def products_in_categories(cls, category_codes: List[str]) -> "SearchBuilder":
         """Create a search builder for products in specific categories."""
         builder = cls()
@@ -460,6 +719,7 @@ class SearchBuilder:
         return builder
     
     @classmethod
+    @_cached_prototype
     def products_with_family(cls, family_codes: List[str]) -> "SearchBuilder":
         """Create a search builder for products with specific families."""
         builder = cls()
@@ -467,6 +727,7 @@ class SearchBuilder:
         return builder
     
     @classmethod
+    @_cached_prototype
     def recently_updated(cls, days: int) -> "SearchBuilder":
         """Create a search builder for recently updated products."""
         builder = cls()
@@ -474,6 +735,7 @@ class SearchBuilder:
         return builder
     
     @classmethod
+    @_cached_prototype
     def incomplete_products(cls, scope: str, threshold: int = 100) -> "SearchBuilder":
         """Create a search builder for incomplete products."""
         builder = cls()
@@ -481,6 +743,138 @@ class SearchBuilder:
         return builder
 
 
+class Param:
+    """Placeholder for a filter value that is supplied later with CompiledSearch.bind()."""
+    
+    __slots__ = ("name",)
+    
+    def __init__(self, name: str):
+        self.name = name
+    
+    def __repr__(self) -> str:
+        return f"Param({self.name!r})"
+    
+    @property
+    def token(self) -> str:
+        """The string standing in for this placeholder in the serialized criteria."""
+        return f"__param:{self.name}__"
+
+
+class CompiledSearch:
+    """
+    A search serialized ahead of time by SearchBuilder.compile().
+    
+    It can be passed anywhere a SearchBuilder is accepted once all of its
+    placeholders are bound. Binding substitutes the values into the stored JSON,
+    so reusing a compiled search doesn't re-run the builder chain.
+    """
+    
+    __slots__ = (
+        "_search",
+        "_search_locale",
+        "_search_scope",
+        "_value_filters",
+        "_pagination_params",
+        "_placeholders",
+    )
+    
+    def __init__(self, search: Optional[str], search_locale: Optional[str], search_scope: Optional[str],
+                 value_filters: Dict[str, Any], pagination_params: Dict[str, Any],
+                 placeholders: FrozenSet[str] = frozenset()):
+        self._search = search
+        self._search_locale = search_locale
+        self._search_scope = search_scope
+        self._value_filters = dict(value_filters)
+        self._pagination_params = dict(pagination_params)
+        self._placeholders = placeholders
+    
+    @property
+    def placeholders(self) -> FrozenSet[str]:
+        """Names of the placeholders that still need a value."""
+        return self._placeholders
+    
+    @property
+    def frozen(self) -> bool:
+        """Compiled searches are always read-only; use clone() for an editable builder."""
+        return True
+    
+    def bind(self, **values: Any) -> "CompiledSearch":
+        """
+        Fill in placeholders.
+        
+        Args:
+            **values: JSON-serializable value for each placeholder, by name
+            
+        Returns:
+            A new CompiledSearch; placeholders not given here stay open
+        """
+        unknown = set(values) - self._placeholders
+        if unknown:
+            raise ValueError(f"Unknown placeholders: {', '.join(sorted(unknown))}")
+        
+        search = self._search
+        for name, value in values.items():
+            search = search.replace(serialization.dumps(Param(name).token), serialization.dumps(value))
+        
+        return CompiledSearch(
+            search=search,
+            search_locale=self._search_locale,
+            search_scope=self._search_scope,
+            value_filters=self._value_filters,
+            pagination_params=self._pagination_params,
+            placeholders=self._placeholders.difference(values),
+        )
+    
+    def _check_bound(self) -> None:
+        if self._placeholders:
+            raise ValueError(
+                f"Unbound placeholders: {', '.join(sorted(self._placeholders))}; call bind() first"
+            )
+    
+    def build_search_params(self) -> Dict[str, Any]:
+        """Build the complete search parameters for API request."""
+        self._check_bound()
+        params = {}
+        
+        if self._search:
+            params["search"] = self._search
+        if self._search_locale:
+            params["search_locale"] = self._search_locale
+        if self._search_scope:
+            params["search_scope"] = self._search_scope
+        
+        params.update(self._value_filters)
+        params.update(self._pagination_params)
+        
+        return params
+    
+    def build_search_criteria(self) -> Dict[str, Any]:
+        """Build just the search criteria (for POST search endpoints)."""
+        self._check_bound()
+        return serialization.loads(self._search) if self._search else {}
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Get a deterministic representation of the whole search. Used for cache keys."""
+        return {
+            "search": self._search,
+            "search_locale": self._search_locale,
+            "search_scope": self._search_scope,
+            "value_filters": dict(sorted(self._value_filters.items())),
+            "pagination": dict(sorted(self._pagination_params.items())),
+        }
+    
+    def clone(self) -> SearchBuilder:
+        """Get an editable SearchBuilder equivalent to this search."""
+        self._check_bound()
+        builder = SearchBuilder()
+        builder._search_criteria = self.build_search_criteria()
+        builder._search_locale = self._search_locale
+        builder._search_scope = self._search_scope
+        builder._value_filters = dict(self._value_filters)
+        builder._pagination_params = dict(self._pagination_params)
+        return builder
+
+
 # Convenience functions for quick searches
 
 def search_products() -> SearchBuilder:
@@ -503,50 +897,59 @@ def simple_search(property_name: str, operator: str, value: Any = None,
 
 # Myer-specific magic search functions
 
+@_cached_prototype
 def by_supplier_style(style: str) -> SearchBuilder:
     """Quick search by supplier style."""
     return SearchBuilder().filters(lambda f: f.supplier_style(style))
 
 
+@_cached_prototype
 def by_brand(brand: str) -> SearchBuilder:
     """Quick search by brand."""
     return SearchBuilder().filters(lambda f: f.brand(brand))
 
 
+@_cached_prototype
 def ready_for_enrichment(status_type: str = "image", status_value: int = 10) -> SearchBuilder:
     """Find product models ready for enrichment."""
     return SearchBuilder().filters(
-        lambda f: f.by_attribute(f"{status_type}_status", str(status_value))
+        lambda f: f.by_attribute(f"{status_type}_status", _text_value(status_value))
     )
 
 
+@_cached_prototype
 def enrichment_complete(status_type: str = "image", status_value: int = 20) -> SearchBuilder:
     """Find product models with enrichment complete."""
     return SearchBuilder().filters(
-        lambda f: f.by_attribute(f"{status_type}_status", str(status_value))
+        lambda f: f.by_attribute(f"{status_type}_status", _text_value(status_value))
     )
 
 
+@_cached_prototype
 def missing_images(image_num: int = 1) -> SearchBuilder:
     """Find products missing specific image numbers."""
     return SearchBuilder().filters(lambda f: f.missing_images(image_num))
 
 
+@_cached_prototype
 def by_supplier(supplier_code: str) -> SearchBuilder:
     """Quick search by supplier code."""
     return SearchBuilder().filters(lambda f: f.supplier(supplier_code))
 
 
+@_cached_prototype
 def concession_products(is_concession: bool = True) -> SearchBuilder:
     """Find concession or non-concession products."""
     return SearchBuilder().filters(lambda f: f.concession(is_concession))
 
 
+@_cached_prototype
 def online_products() -> SearchBuilder:
     """Find products available online."""
     return SearchBuilder().filters(lambda f: f.online_ind(True).buyable_ind(True))
 
 
+@_cached_prototype
 def clearance_products() -> SearchBuilder:
     """Find clearance products."""
     return SearchBuilder().filters(lambda f: f.clearance_ind(True))
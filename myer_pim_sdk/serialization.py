@@ -0,0 +1,37 @@
+import json
+from typing import Any, Callable, Optional, Union
+
+# JSON encoding/decoding for request and response bodies. Uses orjson when it is
+# installed (pip install myer-pim-sdk[speedups]) and the standard library otherwise.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+ORJSON_AVAILABLE = orjson is not None
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Decode a JSON document."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """
+    Encode an object as a compact JSON string.
+    
+    ``default`` is called for objects that can't be serialized natively and should
+    return a serializable replacement or raise TypeError.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=default).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), default=default)
+
+
+def dumps_bytes(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Encode an object as compact UTF-8 JSON bytes (see dumps() for ``default``)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=default)
+    return json.dumps(obj, separators=(",", ":"), default=default).encode("utf-8")
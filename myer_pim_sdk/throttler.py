@@ -1,17 +1,80 @@
 import asyncio
+import functools
+import threading
 import time
-from typing import Optional
+from typing import Any, Callable, TypeVar
 
-from leakybucket import LeakyBucket, AsyncLeakyBucket
-from leakybucket.persistence import InMemoryLeakyBucketStorage
+F = TypeVar("F", bound=Callable[..., Any])
 
 # Myer's API allows max 20 calls per minute = 20/60 = 0.333 calls per second
 # We'll be conservative and use 18 calls per minute to account for timing variations
-storage = InMemoryLeakyBucketStorage(
-    max_rate=18,
-    time_period=60.0
-)
+MAX_RATE = 18
+TIME_PERIOD = 60.0  # Seconds
 
 
-throttler = LeakyBucket(storage)
-async_throttler = AsyncLeakyBucket(storage)
\ No newline at end of file
+class Throttler:
+    """
+    Leaky-bucket rate limiter backed by a single monotonic timestamp.
+
+    Allows bursts of up to ``max_rate`` calls, then spaces calls
+    ``time_period / max_rate`` seconds apart. Each call reserves its slot up front
+    and only sleeps when that slot is in the future, so there's no per-call storage
+    and one instance can be shared by sync and async callers.
+    """
+
+    __slots__ = ("_interval", "_burst", "_next", "_lock")
+
+    def __init__(self, max_rate: int = MAX_RATE, time_period: float = TIME_PERIOD):
+        if max_rate <= 0:
+            raise ValueError("max_rate must be greater than 0")
+        if time_period <= 0:
+            raise ValueError("time_period must be greater than 0")
+
+        self._interval = time_period / max_rate
+        # How far ahead of now reservations may run before callers have to wait
+        self._burst = time_period - self._interval
+        self._next = 0.0
+        # Only guards the reservation arithmetic, never held while sleeping
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Reserve the next slot and get how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next, now)
+            self._next = slot + self._interval
+        return slot - self._burst - now
+
+    def acquire(self) -> None:
+        """Block until a call is allowed."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait, without blocking the event loop, until a call is allowed."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def throttle(self) -> Callable[[F], F]:
+        """Decorator that acquires a slot before each call of a function or coroutine function."""
+        def decorator(func: F) -> F:
+            if asyncio.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                    await self.acquire_async()
+                    return await func(*args, **kwargs)
+                return async_wrapper  # type: ignore[return-value]
+
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                self.acquire()
+                return func(*args, **kwargs)
+            return wrapper  # type: ignore[return-value]
+        return decorator
+
+
+# Sync and async clients draw from the same budget
+throttler = Throttler()
+async_throttler = throttler
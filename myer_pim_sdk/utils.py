@@ -1,14 +1,30 @@
+import asyncio
+import io
+import itertools
+import os
 import re
-from typing import Any, Dict, List, Optional, Union, Generator
-from urllib.parse import urlencode
+from typing import Any, Awaitable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union, Generator
+from urllib.parse import urlencode, urlparse, parse_qs
+
+from . import serialization
+
+# Content type of Akeneo's bulk (PATCH collection) endpoints, which exchange NDJSON
+NDJSON_CONTENT_TYPE = "application/vnd.akeneo.collection+json"
+# Maximum number of resources Akeneo accepts in a single bulk PATCH
+BULK_MAX_ITEMS = 100
+
+T = TypeVar("T")
+
+_WORD_START_RE = re.compile('(.)([A-Z][a-z]+)')
+_WORD_BOUNDARY_RE = re.compile('([a-z0-9])([A-Z])')
 
 
 def to_snake_case(string: str) -> str:
     """Convert CamelCase to snake_case."""
     # Insert an underscore before any uppercase letter that follows a lowercase letter
-    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', string)
+    s1 = _WORD_START_RE.sub(r'\1_\2', string)
     # Insert an underscore before any uppercase letter that follows a lowercase letter or digit
-    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+    return _WORD_BOUNDARY_RE.sub(r'\1_\2', s1).lower()
 
 
 def to_camel_case(string: str) -> str:
@@ -74,6 +90,15 @@ def parse_pagination_links(links: Dict[str, Any]) -> Dict[str, Optional[str]]:
     return parsed_links
 
 
+def extract_search_after(href: Optional[str]) -> Optional[str]:
+    """Extract the search_after cursor from an Akeneo pagination link."""
+    if not href:
+        return None
+    
+    values = parse_qs(urlparse(href).query).get('search_after')
+    return values[0] if values else None
+
+
 def extract_items_from_response(response: Any) -> List[Dict[str, Any]]:
     """Extract items from an Akeneo API response."""
     if isinstance(response, dict):
@@ -121,6 +146,38 @@ def get_pagination_info(response: Dict[str, Any]) -> Dict[str, Any]:
     return pagination_info
 
 
+def first_value(values: Dict[str, Any], code: str, default: Any = None,
+                locale: Optional[str] = None, scope: Optional[str] = None) -> Any:
+    """
+    Get the data of the first value of an attribute in an Akeneo "values" mapping.
+    
+    Args:
+        values: The product or product model "values" dict (raw JSON or parsed models)
+        code: Attribute code
+        default: Returned when the attribute has no matching value
+        locale: Only consider values for this locale
+        scope: Only consider values for this scope/channel
+    """
+    entries = values.get(code)
+    if not entries:
+        return default
+    
+    if locale is None and scope is None:
+        # Common case: one dict lookup and no per-entry filtering
+        entry = entries[0]
+        return entry.get('data', default) if isinstance(entry, dict) else entry.data
+    
+    for entry in entries:
+        is_dict = isinstance(entry, dict)
+        if locale is not None and (entry.get('locale') if is_dict else entry.locale) != locale:
+            continue
+        if scope is not None and (entry.get('scope') if is_dict else entry.scope) != scope:
+            continue
+        return entry.get('data', default) if is_dict else entry.data
+    
+    return default
+
+
 def validate_identifier(identifier: str, identifier_type: str = "identifier") -> str:
     """Validate and clean an identifier for use in API calls."""
     if not identifier or not isinstance(identifier, str):
@@ -135,6 +192,77 @@ def validate_identifier(identifier: str, identifier_type: str = "identifier") ->
     return identifier
 
 
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Split items into consecutive lists of at most ``size`` items."""
+    if size < 1:
+        raise ValueError("size must be at least 1")
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def encode_ndjson(items: Iterable[Any]) -> bytes:
+    """
+    Encode items as an NDJSON body, one compact JSON document per line.
+    
+    Items that are already bytes are taken to be encoded lines and used as they are.
+    """
+    # Lines are appended to one growing buffer and dropped as soon as they are copied,
+    # instead of keeping every line alive until a final join
+    buffer = bytearray()
+    for item in items:
+        if buffer:
+            buffer += b"\n"
+        buffer += item if isinstance(item, bytes) else serialization.dumps_bytes(item)
+    return bytes(buffer)
+
+
+def iter_ndjson(body: Union[bytes, str]) -> Iterator[Any]:
+    """Decode an NDJSON body one line at a time, skipping blank lines."""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    # Reading lines off a BytesIO doesn't build a list of every line up front
+    # like splitlines() does, and is no slower
+    for line in io.BytesIO(body):
+        if line.strip():
+            yield serialization.loads(line)
+
+
+# NDJSON bodies above this size are decoded in a worker thread by decode_ndjson_async()
+NDJSON_OFFLOAD_THRESHOLD = 64 * 1024
+
+
+async def decode_ndjson_async(body: Union[bytes, str]) -> List[Any]:
+    """
+    Decode a whole NDJSON body without stalling the event loop on large payloads.
+    
+    Small bodies are decoded inline, since a thread hop would cost more than the
+    decoding itself; larger ones are decoded in a worker thread.
+    """
+    if len(body) < NDJSON_OFFLOAD_THRESHOLD:
+        return list(iter_ndjson(body))
+    return await asyncio.to_thread(lambda: list(iter_ndjson(body)))
+
+
+def _read_file(file_path: str) -> bytes:
+    with open(file_path, 'rb') as f:
+        return f.read()
+
+
+async def read_upload_file(file_path: str) -> Tuple[str, bytes]:
+    """
+    Read a file for a multipart upload without blocking the event loop.
+    
+    Returns:
+        (filename, content) tuple, usable directly as an httpx ``files`` entry
+    """
+    content = await asyncio.to_thread(_read_file, file_path)
+    return os.path.basename(file_path), content
+
+
 def chunk_list(items: List[Any], chunk_size: int) -> Generator[List[Any], None, None]:
     """Split a list into chunks of specified size."""
     for i in range(0, len(items), chunk_size):
@@ -153,3 +281,18 @@ def safe_get_nested(data: Dict[str, Any], path: str, default: Any = None) -> Any
             return default
     
     return current
+
+
+def run(main: Awaitable[T]) -> T:
+    """
+    Run a coroutine to completion like asyncio.run(), on uvloop when it is installed.
+    
+    uvloop (pip install myer-pim-sdk[uvloop], not available on Windows) is a faster
+    drop-in event loop. The SDK never installs it globally; use this entry point, or
+    set it up in your own application, to opt in.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)